@@ -1,8 +1,19 @@
+import argparse
+import sys
+from pathlib import Path
+
 import pandas as pd
-import requests
 
-# Load the CSV file for CPUs
-df = pd.read_csv('../cpus_07_2025.csv')
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.dedup import drop_duplicates, existing_keys
+from ScrappingCommon.naming import normalise_name
+from ScrappingCommon.strapi_client import upload
+from ScrappingCommon.strapi_sync import sync_collection
+
+# Strapi API URL for CPUs
+API_BASE_URL = 'https://api.siliconcompare.com/api'  # Adjust the URL according to your Strapi instance
+COLLECTION = 'cpus'
+CONCURRENCY = 16  # Requests in flight at once
 
 # Function to clean and transform the DataFrame
 def transform_data(df):
@@ -21,30 +32,41 @@ def transform_data(df):
 
     return df.to_dict(orient='records')
 
-# Transform the data
-cpu_entries = transform_data(df)
-
-# Strapi API URL for CPUs
-api_url = 'https://api.siliconcompare.com/api/cpus'  # Adjust the URL according to your Strapi instance
+def build_payload(entry):
+    """Wrap a CPU record in the Strapi payload, NaN becomes None"""
+    entry_cleaned = {k: (v if pd.notna(v) else None) for k, v in entry.items()}
+    return {"data": {"CPU": entry_cleaned}}
 
-# Function to post data to Strapi
+# Post the CPU entries to Strapi
 def post_to_strapi(cpu_entries):
-    for entry in cpu_entries:
-        # Prepare the JSON data, wrapping it in a 'data' key and nested under 'CPU'
-        entry_cleaned = {k: (v if pd.notna(v) else None) for k, v in entry.items()}  # Replace NaN with None
-        
-        # Create the payload for Strapi
-        payload = {"data": {"CPU": entry_cleaned}}
-        
-        # Debug log to see the payload being sent
-        print(f"Sending payload: {payload}")
-        
-        # Send POST request to Strapi
-        response = requests.post(api_url, json=payload)
-        if response.status_code == 201 or 200:
-            print(f"Successfully added: {entry['cpu_name']}")
-        else:
-            print(f"Failed to add {entry['cpu_name']}: {response.content}")
+    # Only create the CPUs Strapi does not have yet, once each, matched on the normalised cpu_name;
+    # a rerun after an interrupted upload thus only sends the CPUs left
+    known = existing_keys(API_BASE_URL, COLLECTION, "CPU", "cpu_name")
+    cpu_entries, skipped = drop_duplicates(cpu_entries, lambda entry: normalise_name(entry['cpu_name']), known)
+    if skipped:
+        print(f"Skipping {len(skipped)} CPUs already in Strapi or repeated in the CSV")
+    payloads = [build_payload(entry) for entry in cpu_entries]
+    labels = [entry['cpu_name'] for entry in cpu_entries]
+    return upload(API_BASE_URL, COLLECTION, payloads, labels, CONCURRENCY, title='CPU upload')
 
-# Post the CPU entries to Strapi
-post_to_strapi(cpu_entries)
+# Only send the differences with what Strapi holds, matched on the normalised cpu_name
+def sync_to_strapi(cpu_entries, dry_run=False, max_delete_fraction=0.2):
+    records = [build_payload(entry)["data"]["CPU"] for entry in cpu_entries]
+    return sync_collection(API_BASE_URL, COLLECTION, "CPU", "cpu_name", records, dry_run=dry_run,
+                           max_delete_fraction=max_delete_fraction, concurrency=CONCURRENCY)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Send the CPUs of the CSV to Strapi")
+    parser.add_argument("mode", nargs="?", choices=["upload", "sync"], default="upload",
+                        help="upload: POST the CPUs Strapi does not have yet; sync: create, update and delete only what changed")
+    parser.add_argument("--dry-run", action="store_true", help="sync: only print what would be sent")
+    parser.add_argument("--max-delete-fraction", type=float, default=0.2,
+                        help="sync: refuse to delete more than this share of the collection")
+    args = parser.parse_args()
+
+    df = pd.read_csv('../cpus_07_2025.csv')
+    entries = transform_data(df)
+    if args.mode == "sync":
+        sync_to_strapi(entries, args.dry_run, args.max_delete_fraction)
+    else:
+        post_to_strapi(entries)
@@ -1,33 +1,38 @@
+import sys
+from pathlib import Path
+
 import requests
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.rate_limit import AdaptiveRateLimiter, limited_request
+from ScrappingCommon.strapi_cache import cached_collection, forget_entries
+from ScrappingCommon.strapi_fetch import make_session
+
 # Strapi API URL for CPUs
-api_url = 'http://localhost:1337/api/cpus'  # Adjust the URL according to your Strapi instance
+API_BASE_URL = 'http://localhost:1337/api'  # Adjust the URL according to your Strapi instance
+api_url = f'{API_BASE_URL}/cpus'
 
-# Function to get all CPU entries from Strapi
+# Deletes are paced by the adaptive limiter, which slows down when Strapi struggles
+session = make_session()
+limiter = AdaptiveRateLimiter(name='CPU delete')
+
+# Function to get all CPU entries, from the local cache refreshed with the changes since the last run
 def get_all_cpus():
-    all_cpus = []
-    page = 1
-    while True:
-        response = requests.get(f"{api_url}?pagination[page]={page}&pagination[pageSize]=100")
-        if response.status_code == 200:
-            data = response.json()
-            all_cpus.extend(data['data'])
-            if len(data['data']) < 100:  # Last page
-                break
-            page += 1
-        else:
-            print(f"Failed to fetch CPUs: {response.content}")
-            return None
-    return all_cpus
-
-# Function to delete a CPU entry
+    try:
+        return cached_collection(API_BASE_URL, 'cpus')
+    except requests.RequestException as e:
+        print(f"Failed to fetch CPUs: {e}")
+        return None
+
+# Function to delete a CPU entry, returns whether it was deleted
 def delete_cpu(cpu_id):
     delete_url = f"{api_url}/{cpu_id}"
-    response = requests.delete(delete_url)
+    response = limited_request(limiter, session, 'DELETE', delete_url)
     if response.status_code == 200:
         print(f"Successfully deleted CPU {cpu_id}")
-    else:
-        print(f"Failed to delete CPU {cpu_id}: {response.content}")
+        return True
+    print(f"Failed to delete CPU {cpu_id}: {response.content}")
+    return False
 
 # Main function to delete all CPUs
 def delete_all_cpus():
@@ -35,8 +40,15 @@ def delete_all_cpus():
     if cpus is None:
         return
 
-    for cpu in cpus:
-        delete_cpu(cpu['id'])
+    # The deleted entries leave the local cache in one go, even if the run is interrupted
+    deleted = []
+    try:
+        for cpu in cpus:
+            if delete_cpu(cpu['id']):
+                deleted.append(cpu['id'])
+    finally:
+        forget_entries(API_BASE_URL, 'cpus', deleted)
 
-# Run the delete process
-delete_all_cpus()
+if __name__ == '__main__':
+    # Run the delete process
+    delete_all_cpus()
@@ -1,72 +1,59 @@
+import argparse
+import sys
+from pathlib import Path
+
 import requests
 import json
-from collections import defaultdict
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.dedup import (apply_deletion_plan, build_deletion_plan, group_duplicates,
+                                   load_deletion_plan, write_deletion_plan)
+from ScrappingCommon.rate_limit import AdaptiveRateLimiter, limited_request
+from ScrappingCommon.strapi_cache import cached_collection, forget_entries
+from ScrappingCommon.strapi_fetch import make_session
 
 # Configuration de l'API Strapi
 API_BASE_URL = 'https://api.siliconcompare.com/api'
-CPUS_ENDPOINT = f'{API_BASE_URL}/cpus'
+COLLECTION = 'cpus'
+CPUS_ENDPOINT = f'{API_BASE_URL}/{COLLECTION}'
+CONCURRENCY = 8  # Suppressions en parallèle en mode automatique, le limiteur adaptatif peut en utiliser moins
+
+# Les suppressions passent par le limiteur adaptatif, qui ralentit si Strapi sature
+session = make_session()
+limiter = AdaptiveRateLimiter(name='CPU duplicates')
 
 def get_all_cpus():
-    """Récupère tous les CPUs de la base de données"""
+    """Récupère tous les CPUs, depuis le cache local mis à jour avec les changements depuis le dernier passage"""
     all_cpus = []
-    page = 1
-    page_size = 100  # Ajustez selon vos besoins
-    
-    while True:
-        params = {
-            'pagination[page]': page,
-            'pagination[pageSize]': page_size
-        }
-        
-        response = requests.get(CPUS_ENDPOINT, params=params)
-        
-        if response.status_code != 200:
-            print(f"❌ Erreur lors de la récupération des données: {response.status_code}")
-            break
-            
-        data = response.json()
-        cpus = data.get('data', [])
-        
-        if not cpus:
-            break
-            
-        all_cpus.extend(cpus)
-        page += 1
-        
-        print(f"📥 Récupéré {len(cpus)} CPUs (page {page-1})")
-        
-        # Si on a moins d'éléments que la taille de page, on a tout récupéré
-        if len(cpus) < page_size:
-            break
-    
+
+    try:
+        all_cpus = cached_collection(API_BASE_URL, COLLECTION)
+    except requests.RequestException as e:
+        print(f"❌ Erreur lors de la récupération des données: {e}")
+
     print(f"📊 Total récupéré: {len(all_cpus)} CPUs")
     return all_cpus
 
 def find_duplicates(cpus):
-    """Trouve les doublons basés sur le nom de la carte graphique"""
-    duplicates = defaultdict(list)
-    
-    for cpu in cpus:
-        cpu_data = cpu.get('attributes', {}).get('CPU', {})
-        videocard_name = cpu_data.get('videocard_name')
-        
-        if videocard_name:
-            duplicates[videocard_name].append({
-                'id': cpu['id'],
-                'name': videocard_name,
-                'created_at': cpu.get('attributes', {}).get('createdAt'),
-                'full_data': cpu_data
-            })
-    
-    # Garder seulement les entrées qui ont des doublons
-    actual_duplicates = {name: entries for name, entries in duplicates.items() if len(entries) > 1}
-    
-    return actual_duplicates
+    """Trouve les doublons basés sur le nom du CPU, normalisé (casse, espaces et tirets ignorés)"""
+    duplicates = {}
+
+    # Seuls les groupes de plusieurs entrées sont retournés, le plus ancien en premier
+    for entries in group_duplicates(cpus, 'CPU', 'cpu_name').values():
+        name = entries[0]['attributes']['CPU']['cpu_name']
+        duplicates[name] = [{
+            'id': cpu['id'],
+            'name': cpu['attributes']['CPU'].get('cpu_name'),
+            'created_at': cpu['attributes'].get('createdAt'),
+            'full_data': cpu['attributes']['CPU']
+        } for cpu in entries]
+
+    return duplicates
 
 def delete_cpu(cpu_id):
     """Supprime un CPU par son ID"""
     delete_url = f'{CPUS_ENDPOINT}/{cpu_id}'
-    response = requests.delete(delete_url)
+    response = limited_request(limiter, session, 'DELETE', delete_url)
     
     if response.status_code == 200:
         return True
@@ -94,46 +81,67 @@ def remove_duplicates_interactive(duplicates):
         response = input(f"Supprimer {len(entries)-1} doublons pour '{name}'? (y/N): ")
         
         if response.lower() == 'y':
-            # Supprimer tous sauf le premier (le plus ancien)
+            # Supprimer tous sauf le premier (le plus ancien), le cache local est mis à jour une fois par groupe
+            deleted = []
             for entry in entries[1:]:
                 if delete_cpu(entry['id']):
                     print(f"✅ Supprimé: {entry['name']} (ID: {entry['id']})")
-                    total_deleted += 1
+                    deleted.append(entry['id'])
                 else:
                     print(f"❌ Échec suppression: {entry['name']} (ID: {entry['id']})")
+            forget_entries(API_BASE_URL, COLLECTION, deleted)
+            total_deleted += len(deleted)
         else:
             print(f"⏭️  Ignoré: {name}")
     
     print(f"\n🎉 Suppression terminée. Total supprimé: {total_deleted} entrées")
 
-def remove_duplicates_auto(duplicates, keep_strategy='oldest'):
-    """Supprime les doublons automatiquement"""
+def print_plan(plan):
+    """Affiche les groupes d'un plan de suppression"""
+    for group in plan['groups']:
+        print(f"\n📋 '{group['name']}': 🟢 garder ID {group['keep']}, 🔴 supprimer {group['delete']}")
+
+def remove_duplicates_auto(cpus, keep_strategy='oldest'):
+    """Supprime les doublons automatiquement, les suppressions partent en parallèle"""
     print(f"\n🤖 Suppression automatique des doublons (stratégie: {keep_strategy})")
-    
-    total_deleted = 0
-    
-    for name, entries in duplicates.items():
-        if keep_strategy == 'oldest':
-            # Trier par date de création (garder le plus ancien)
-            entries.sort(key=lambda x: x['created_at'])
-        elif keep_strategy == 'newest':
-            # Trier par date de création (garder le plus récent)
-            entries.sort(key=lambda x: x['created_at'], reverse=True)
-        
-        print(f"\n📋 Traitement '{name}' ({len(entries)} entrées)")
-        print(f"🟢 Garder: ID {entries[0]['id']} (créé: {entries[0]['created_at']})")
-        
-        # Supprimer tous sauf le premier
-        for entry in entries[1:]:
-            if delete_cpu(entry['id']):
-                print(f"✅ Supprimé: ID {entry['id']} (créé: {entry['created_at']})")
-                total_deleted += 1
-            else:
-                print(f"❌ Échec suppression: ID {entry['id']}")
-    
-    print(f"\n🎉 Suppression automatique terminée. Total supprimé: {total_deleted} entrées")
+
+    plan = build_deletion_plan(API_BASE_URL, COLLECTION, cpus, 'CPU', 'cpu_name', keep_strategy)
+    print_plan(plan)
+    deleted = apply_deletion_plan(plan, CONCURRENCY)
+
+    print(f"\n🎉 Suppression automatique terminée. Total supprimé: {len(deleted)} entrées")
+
+def write_plan(cpus, path, keep_strategy='oldest'):
+    """Écrit le plan de suppression des doublons dans un fichier JSON, sans rien supprimer"""
+    plan = build_deletion_plan(API_BASE_URL, COLLECTION, cpus, 'CPU', 'cpu_name', keep_strategy)
+    write_deletion_plan(plan, path)
+    total = sum(len(group['delete']) for group in plan['groups'])
+    print(f"📝 Plan écrit dans {path}: {len(plan['groups'])} groupes, {total} entrées à supprimer")
+
+def apply_plan_file(path):
+    """Applique un plan de suppression écrit avec --plan"""
+    plan = load_deletion_plan(path)
+    if plan['base_url'] != API_BASE_URL or plan['collection'] != COLLECTION:
+        print(f"❌ Le plan vise {plan['base_url']}/{plan['collection']}, pas {CPUS_ENDPOINT}")
+        return
+    print(f"🤖 Application du plan {path} (créé le {plan['created_at']})")
+    deleted = apply_deletion_plan(plan, CONCURRENCY)
+    total = sum(len(group['delete']) for group in plan['groups'])
+    print(f"\n🎉 Plan appliqué. Total supprimé: {len(deleted)}/{total} entrées")
 
 def main():
+    parser = argparse.ArgumentParser(description="Nettoyage des CPUs en double dans Strapi. "
+                                                 "Sans option, les doublons sont traités depuis un menu interactif.")
+    parser.add_argument("--plan", metavar="FICHIER", help="écrire le plan de suppression dans FICHIER, sans rien supprimer")
+    parser.add_argument("--apply", metavar="FICHIER", help="appliquer un plan écrit avec --plan, sans confirmation")
+    parser.add_argument("--keep", choices=["oldest", "newest"], default="oldest",
+                        help="--plan: entrée gardée dans chaque groupe (défaut: la plus ancienne)")
+    args = parser.parse_args()
+
+    if args.apply:
+        apply_plan_file(args.apply)
+        return
+
     print("🚀 Démarrage du nettoyage des doublons...")
     
     # Récupérer tous les CPUs
@@ -142,6 +150,10 @@ def main():
     if not all_cpus:
         print("❌ Aucun CPU trouvé ou erreur de récupération")
         return
+
+    if args.plan:
+        write_plan(all_cpus, args.plan, args.keep)
+        return
     
     # Trouver les doublons
     duplicates = find_duplicates(all_cpus)
@@ -153,7 +165,7 @@ def main():
     # Afficher un résumé
     total_duplicates = sum(len(entries) - 1 for entries in duplicates.values())
     print(f"\n📊 Résumé:")
-    print(f"  - {len(duplicates)} noms de cartes avec doublons")
+    print(f"  - {len(duplicates)} noms de CPUs avec doublons")
     print(f"  - {total_duplicates} entrées à supprimer")
     
     # Choisir le mode de suppression
@@ -168,9 +180,9 @@ def main():
     if choice == '1':
         remove_duplicates_interactive(duplicates)
     elif choice == '2':
-        remove_duplicates_auto(duplicates, 'oldest')
+        remove_duplicates_auto(all_cpus, 'oldest')
     elif choice == '3':
-        remove_duplicates_auto(duplicates, 'newest')
+        remove_duplicates_auto(all_cpus, 'newest')
     elif choice == '4':
         for name, entries in duplicates.items():
             print(f"\n📋 '{name}' ({len(entries)} entrées):")
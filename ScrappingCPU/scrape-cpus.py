@@ -1,76 +1,18 @@
-import csv
-from bs4 import BeautifulSoup
-import re
+import io
+import sys
+from pathlib import Path
 
-def clean_text(text):
-    # Remove newlines and extra spaces
-    cleaned = re.sub(r'\s+', ' ', text).strip()
-    return cleaned
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.passmark_frame import CPU_COLUMNS, read_passmark_table, write_passmark_csv
 
-def extract_numeric_value(text):
-    """ Extracts only numeric values from the given text. """
-    # Replace commas with empty string and extract numeric parts
-    cleaned = re.sub(r'[^\d.]', '', text)  # Remove anything that's not a digit or period
-    return cleaned if cleaned else ''
-
-from bs4 import BeautifulSoup
-
-def parse_html_table(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table', id='cputable')
-    rows = table.find_all('tr')
-    
-    data = []
-    for row in rows[1:]:  # Skip the header row
-        cols = row.find_all('td')
-        if len(cols) >= 14:  # Ensure enough columns exist in each row
-            cpu_name = clean_text(cols[1].text).replace('-', ' ').replace('/', ' ').replace('(', ' ').replace(')', ' ')
-            num_sockets = cols[2].text.strip()
-            cores = cols[3].text.strip()
-            price = extract_numeric_value(cols[4].text.strip())
-            cpu_mark = cols[5].text.strip()
-            cpu_value = cols[6].text.strip()
-            thread_mark = cols[7].text.strip()
-            thread_value = cols[8].text.strip()
-            tdp = cols[9].text.strip()
-            power_perf = cols[10].text.strip()
-            test_date = cols[11].text.strip()
-            socket = cols[12].text.strip()
-            category = cols[13].text.strip()
-
-            # Extract year from test_date and check if it's greater than 2015
-            try:
-                # Split test_date and get the year part
-                year = int(test_date.split()[1])  # Get the second part (year) and convert to int
-                if year > 2015:
-                    # Append the extracted data to the list
-                    data.append([
-                        cpu_name,
-                        num_sockets if num_sockets != 'NA' else '',
-                        cores if cores != 'NA' else '',
-                        price if price != 'NA' else '',
-                        cpu_mark if cpu_mark != 'NA' else '',
-                        cpu_value if cpu_value != 'NA' else '',
-                        thread_mark if thread_mark != 'NA' else '',
-                        thread_value if thread_value != 'NA' else '',
-                        tdp if tdp != 'NA' else '',
-                        power_perf if power_perf != 'NA' else '',
-                        test_date,
-                        socket if socket != 'NA' else '',
-                        category
-                    ])
-            except (IndexError, ValueError):
-                # Handle cases where the year extraction fails
-                continue
-    
-    return data
-
-
-def write_csv(data, filename):
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['cpu_name', 'num_sockets', 'cores', 'price', 'cpu_mark', 'cpu_value', 'thread_mark', 'thread_value', 'tdp', 'power_perf', 'test_date', 'socket', 'category'])
-        writer.writerows(data)
+def parse_html_table(source):
+    """
+    Read the PassMark CPU table into a DataFrame, keeping CPUs tested after 2015.
+    `source` is a path to a saved page or a file object.
+    """
+    df = read_passmark_table(source, CPU_COLUMNS)
+    # Rows whose test date cannot be parsed are dropped as well
+    return df[df['test_date'].dt.year > 2015].reset_index(drop=True)
 
 # Main execution
 html_content = """
@@ -135,7 +77,9 @@ html_content = """
 							<tbody><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+7203P&amp;id=6813">AMD EPYC 7203P</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+EPYC+7203P&amp;id=6813#price">NA</a></td><td>22,017</td><td>NA</td><td>2,537</td><td>NA</td><td>120</td><td>183.48</td><td class="sorting_1">Jul 2025</td><td>SP3</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9565&amp;id=6769">AMD EPYC 9565</a></td><td>1</td><td>72</td><td><a href="cpu.php?cpu=AMD+EPYC+9565&amp;id=6769#price">$10,486.00*</a></td><td>135,221</td><td>12.90</td><td>3,696</td><td>0.35</td><td>400</td><td>338.05</td><td class="sorting_1">Jul 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+Embedded+8224P&amp;id=6790">AMD EPYC Embedded 8224P</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=AMD+EPYC+Embedded+8224P&amp;id=6790#price">NA</a></td><td>48,873</td><td>NA</td><td>2,357</td><td>NA</td><td>160</td><td>305.46</td><td class="sorting_1">Jul 2025</td><td>SP6</td><td>Server, Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+Embedded+9755&amp;id=6783">AMD EPYC Embedded 9755</a></td><td>1</td><td>128</td><td><a href="cpu.php?cpu=AMD+EPYC+Embedded+9755&amp;id=6783#price">NA</a></td><td>163,419</td><td>NA</td><td>3,499</td><td>NA</td><td>500</td><td>326.84</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+H+260&amp;id=6770">AMD Ryzen 7 H 260</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+H+260&amp;id=6770#price">NA</a></td><td>30,214</td><td>NA</td><td>3,965</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>FP8</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+270&amp;id=6779">AMD Ryzen 9 270</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+270&amp;id=6779#price">NA</a></td><td>31,104</td><td>NA</td><td>3,970</td><td>NA</td><td>45</td><td>691.19</td><td class="sorting_1">Jul 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+9960X+24-Cores&amp;id=6808">AMD Ryzen Threadripper 9960X 24-Cores</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+9960X+24-Cores&amp;id=6808#price">NA</a></td><td>92,632</td><td>NA</td><td>4,536</td><td>NA</td><td>350</td><td>264.66</td><td class="sorting_1">Jul 2025</td><td>sTR5</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+PRO+9945WX&amp;id=6801">AMD Ryzen Threadripper PRO 9945WX</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+PRO+9945WX&amp;id=6801#price">NA</a></td><td>56,854</td><td>NA</td><td>4,573</td><td>NA</td><td>350</td><td>162.44</td><td class="sorting_1">Jul 2025</td><td>sTR5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+PRO+9955WX&amp;id=6803">AMD Ryzen Threadripper PRO 9955WX</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+PRO+9955WX&amp;id=6803#price">NA</a></td><td>69,993</td><td>NA</td><td>4,561</td><td>NA</td><td>350</td><td>199.98</td><td class="sorting_1">Jul 2025</td><td>sTR5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+PRO+9965WX&amp;id=6804">AMD Ryzen Threadripper PRO 9965WX</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+PRO+9965WX&amp;id=6804#price">$4,360.38</a></td><td>95,346</td><td>21.87</td><td>4,555</td><td>1.04</td><td>350</td><td>272.42</td><td class="sorting_1">Jul 2025</td><td>sTR5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+PRO+9975WX&amp;id=6799">AMD Ryzen Threadripper PRO 9975WX</a></td><td>1</td><td>32</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+PRO+9975WX&amp;id=6799#price">$4,099.00</a></td><td>110,740</td><td>27.02</td><td>4,422</td><td>1.08</td><td>350</td><td>316.40</td><td class="sorting_1">Jul 2025</td><td>sTR5</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+PRO+9985WX&amp;id=6807">AMD Ryzen Threadripper PRO 9985WX</a></td><td>1</td><td>64</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+PRO+9985WX&amp;id=6807#price">$7,999.00</a></td><td>156,305</td><td>19.54</td><td>4,586</td><td>0.57</td><td>350</td><td>446.58</td><td class="sorting_1">Jul 2025</td><td>sTR5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+-+12+Core+2000+MHz&amp;id=6787">ARM - 12 Core 2000 MHz</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=ARM+-+12+Core+2000+MHz&amp;id=6787#price">NA</a></td><td>16,944</td><td>NA</td><td>3,991</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+-+4+Core+1804+MHz&amp;id=6773">ARM - 4 Core 1804 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+-+4+Core+1804+MHz&amp;id=6773#price">NA</a></td><td>3,336</td><td>NA</td><td>1,615</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A55+6+Core+1800+MHz&amp;id=6777">ARM Cortex-A55 6 Core 1800 MHz</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=ARM+Cortex-A55+6+Core+1800+MHz&amp;id=6777#price">NA</a></td><td>984</td><td>NA</td><td>311</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A72+1+Core+0+MHz&amp;id=6805">ARM Cortex-A72 1 Core 0 MHz</a></td><td>1</td><td>1</td><td><a href="cpu.php?cpu=ARM+Cortex-A72+1+Core+0+MHz&amp;id=6805#price">NA</a></td><td>400</td><td>NA</td><td>561</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A76+4+Core+2000+MHz&amp;id=6768">ARM Cortex-A76 4 Core 2000 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A76+4+Core+2000+MHz&amp;id=6768#price">NA</a></td><td>1,513</td><td>NA</td><td>676</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Kryo-4XX-Gold+1+Core+0+MHz&amp;id=6795">ARM Kryo-4XX-Gold 1 Core 0 MHz</a></td><td>1</td><td>1</td><td><a href="cpu.php?cpu=ARM+Kryo-4XX-Gold+1+Core+0+MHz&amp;id=6795#price">NA</a></td><td>769</td><td>NA</td><td>956</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Neoverse-V1+1+Core+0+MHz&amp;id=6806">ARM Neoverse-V1 1 Core 0 MHz</a></td><td>1</td><td>1</td><td><a href="cpu.php?cpu=ARM+Neoverse-V1+1+Core+0+MHz&amp;id=6806#price">NA</a></td><td>785</td><td>NA</td><td>1,472</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Fabrikams+XY9+%40+3.15+GHz&amp;id=6774">Fabrikams XY9 @ 3.15 GHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Fabrikams+XY9+%40+3.15+GHz&amp;id=6774#price">NA</a></td><td>6,715</td><td>NA</td><td>1,885</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=hi6620oem&amp;id=6810">hi6620oem</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=hi6620oem&amp;id=6810#price">NA</a></td><td>396</td><td>NA</td><td>321</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+3+100HL&amp;id=6775">Intel Core 3 100HL</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Core+3+100HL&amp;id=6775#price">$306.00*</a></td><td>17,899</td><td>58.49</td><td>3,731</td><td>12.19</td><td>45</td><td>397.76</td><td class="sorting_1">Jul 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+7+160UL&amp;id=6789">Intel Core 7 160UL</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Core+7+160UL&amp;id=6789#price">$426.00*</a></td><td>11,043</td><td>25.92</td><td>3,391</td><td>7.96</td><td>15</td><td>736.17</td><td class="sorting_1">Jul 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i7-1265UL&amp;id=6796">Intel Core i7-1265UL</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Core+i7-1265UL&amp;id=6796#price">NA</a></td><td>18,294</td><td>NA</td><td>3,513</td><td>NA</td><td>15</td><td>1,219.61</td><td class="sorting_1">Jul 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+245HX&amp;id=6782">Intel Core Ultra 5 245HX</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+245HX&amp;id=6782#price">NA</a></td><td>40,059</td><td>NA</td><td>4,530</td><td>NA</td><td>55</td><td>728.34</td><td class="sorting_1">Jul 2025</td><td>FCBGA2114</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+U300L&amp;id=6778">Intel U300L</a></td><td>1</td><td>5</td><td><a href="cpu.php?cpu=Intel+U300L&amp;id=6778#price">NA</a></td><td>7,692</td><td>NA</td><td>2,030</td><td>NA</td><td>15</td><td>512.81</td><td class="sorting_1">Jul 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Gold+6338T+%40+2.10GHz&amp;id=6780">Intel Xeon Gold 6338T @ 2.10GHz</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Xeon+Gold+6338T+%40+2.10GHz&amp;id=6780#price">$3,139.00*</a></td><td>35,801</td><td>11.41</td><td>2,348</td><td>0.75</td><td>165</td><td>216.98</td><td class="sorting_1">Jul 2025</td><td>FCLGA4189</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT8768CA&amp;id=6781">Mediatek MT8768CA</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT8768CA&amp;id=6781#price">NA</a></td><td>1,978</td><td>NA</td><td>569</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT8791&amp;id=6772">Mediatek MT8791</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT8791&amp;id=6772#price">NA</a></td><td>5,521</td><td>NA</td><td>2,271</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Spreadtrum+UMS9230E&amp;id=6784">Spreadtrum UMS9230E</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Spreadtrum+UMS9230E&amp;id=6784#price">NA</a></td><td>3,066</td><td>NA</td><td>1,122</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Synaptics+VS680&amp;id=6776">Synaptics VS680</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Synaptics+VS680&amp;id=6776#price">NA</a></td><td>1,728</td><td>NA</td><td>879</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ZHAOXIN+KaiXian+KX-U6780A&amp;id=6812">ZHAOXIN KaiXian KX-U6780A</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=ZHAOXIN+KaiXian+KX-U6780A&amp;id=6812#price">NA</a></td><td>3,058</td><td>NA</td><td>736</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ZHAOXIN+KaiXian+ZX-C%2B+C4701%402.0GHz&amp;id=6797">ZHAOXIN KaiXian ZX-C+ C4701@2.0GHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ZHAOXIN+KaiXian+ZX-C%2B+C4701%402.0GHz&amp;id=6797#price">NA</a></td><td>1,442</td><td>NA</td><td>564</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+4465P&amp;id=6748">AMD EPYC 4465P</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=AMD+EPYC+4465P&amp;id=6748#price">$399.00*</a></td><td>50,492</td><td>126.55</td><td>4,611</td><td>11.56</td><td>65</td><td>776.80</td><td class="sorting_1">Jun 2025</td><td>AM5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+4545P&amp;id=6758">AMD EPYC 4545P</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+EPYC+4545P&amp;id=6758#price">$549.00*</a></td><td>55,388</td><td>100.89</td><td>4,568</td><td>8.32</td><td>65</td><td>852.12</td><td class="sorting_1">Jun 2025</td><td>AM5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+4585PX&amp;id=6749">AMD EPYC 4585PX</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+EPYC+4585PX&amp;id=6749#price">$699.00*</a></td><td>71,552</td><td>102.36</td><td>4,795</td><td>6.86</td><td>170</td><td>420.89</td><td class="sorting_1">Jun 2025</td><td>AM5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+7K23&amp;id=6728">AMD EPYC 7K23</a></td><td>1</td><td>48</td><td><a href="cpu.php?cpu=AMD+EPYC+7K23&amp;id=6728#price">NA</a></td><td>81,183</td><td>NA</td><td>2,788</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9475F&amp;id=6743&amp;cpuCount=2">[Dual CPU] AMD EPYC 9475F</a></td><td>2</td><td>48</td><td><a href="cpu.php?cpu=AMD+EPYC+9475F&amp;id=6743#price">$15,184.00*</a></td><td>179,338</td><td>11.81</td><td>4,094</td><td>NA</td><td>4000</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+7545U&amp;id=6725">AMD Ryzen 5 7545U</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+7545U&amp;id=6725#price">NA</a></td><td>20,298</td><td>NA</td><td>3,673</td><td>NA</td><td>28</td><td>724.93</td><td class="sorting_1">Jun 2025</td><td>FP7, FP7r2</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+7445HS&amp;id=6767">AMD Ryzen 7 7445HS</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+7445HS&amp;id=6767#price">NA</a></td><td>19,316</td><td>NA</td><td>3,614</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+-+10+Core+2000+MHz&amp;id=6733">ARM - 10 Core 2000 MHz</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=ARM+-+10+Core+2000+MHz&amp;id=6733#price">NA</a></td><td>9,787</td><td>NA</td><td>3,807</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A53+4+Core+1968+MHz&amp;id=6766">ARM Cortex-A53 4 Core 1968 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A53+4+Core+1968+MHz&amp;id=6766#price">NA</a></td><td>571</td><td>NA</td><td>278</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A55+4+Core+0+MHz&amp;id=6740">ARM Cortex-A55 4 Core 0 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A55+4+Core+0+MHz&amp;id=6740#price">NA</a></td><td>258</td><td>NA</td><td>129</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Falkor+V1%2FKryo+4+Core+1612+MHz&amp;id=6764">ARM Falkor V1/Kryo 4 Core 1612 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Falkor+V1%2FKryo+4+Core+1612+MHz&amp;id=6764#price">NA</a></td><td>1,453</td><td>NA</td><td>472</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Neoverse-V2+72+Core+3447+MHz&amp;id=6755">ARM Neoverse-V2 72 Core 3447 MHz</a></td><td>1</td><td>72</td><td><a href="cpu.php?cpu=ARM+Neoverse-V2+72+Core+3447+MHz&amp;id=6755#price">NA</a></td><td>57,299</td><td>NA</td><td>2,311</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Hygon+C86-3G+%28OPN%3A3350M%29&amp;id=6747">Hygon C86-3G (OPN:3350M)</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Hygon+C86-3G+%28OPN%3A3350M%29&amp;id=6747#price">NA</a></td><td>4,658</td><td>NA</td><td>1,017</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+5+221E&amp;id=6742">Intel Core 5 221E</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+5+221E&amp;id=6742#price">$232.00*</a></td><td>32,388</td><td>139.60</td><td>4,186</td><td>18.04</td><td>65</td><td>498.28</td><td class="sorting_1">Jun 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i5-13600HRE&amp;id=6759">Intel Core i5-13600HRE</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=Intel+Core+i5-13600HRE&amp;id=6759#price">$347.00*</a></td><td>14,591</td><td>42.05</td><td>2,127</td><td>6.13</td><td>45</td><td>324.23</td><td class="sorting_1">Jun 2025</td><td>FCBGA1744</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i7-14701TE&amp;id=6730">Intel Core i7-14701TE</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Core+i7-14701TE&amp;id=6730#price">$392.00*</a></td><td>27,519</td><td>70.20</td><td>4,252</td><td>10.85</td><td>45</td><td>611.53</td><td class="sorting_1">Jun 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Pentium+Silver+A1030+%40+2.00GHz&amp;id=6754">Intel Pentium Silver A1030 @ 2.00GHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Pentium+Silver+A1030+%40+2.00GHz&amp;id=6754#price">NA</a></td><td>1,380</td><td>NA</td><td>1,115</td><td>NA</td><td>15</td><td>91.99</td><td class="sorting_1">Jun 2025</td><td>FCBGA1090</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6333P&amp;id=6738">Intel Xeon 6333P</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=Intel+Xeon+6333P&amp;id=6738#price">$319.00*</a></td><td>18,751</td><td>58.78</td><td>3,791</td><td>11.88</td><td>65</td><td>288.47</td><td class="sorting_1">Jun 2025</td><td>FCLGA1700</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+E-2226GE+%40+3.40GHz&amp;id=6761">Intel Xeon E-2226GE @ 3.40GHz</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=Intel+Xeon+E-2226GE+%40+3.40GHz&amp;id=6761#price">$286.00*</a></td><td>9,090</td><td>31.78</td><td>2,532</td><td>8.85</td><td>80</td><td>113.63</td><td class="sorting_1">Jun 2025</td><td>FCLGA1151</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+E3-1565L+v5+%40+2.50GHz&amp;id=6731">Intel Xeon E3-1565L v5 @ 2.50GHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Intel+Xeon+E3-1565L+v5+%40+2.50GHz&amp;id=6731#price">NA</a></td><td>7,325</td><td>NA</td><td>1,970</td><td>NA</td><td>35</td><td>209.28</td><td class="sorting_1">Jun 2025</td><td>FCBGA1440</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+E7-4850+v4+%40+2.10GHz&amp;id=6757&amp;cpuCount=4">[Quad CPU] Intel Xeon E7-4850 v4 @ 2.10GHz</a></td><td>4</td><td>16</td><td><a href="cpu.php?cpu=Intel+Xeon+E7-4850+v4+%40+2.10GHz&amp;id=6757#price">NA</a></td><td>36,786</td><td>NA</td><td>1,573</td><td>NA</td><td>115</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>FCLGA2011</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Platinum+8280L+%40+2.70GHz&amp;id=6729&amp;cpuCount=2">[Dual CPU] Intel Xeon Platinum 8280L @ 2.70GHz</a></td><td>2</td><td>28</td><td><a href="cpu.php?cpu=Intel+Xeon+Platinum+8280L+%40+2.70GHz&amp;id=6729#price">$29,796.00*</a></td><td>65,975</td><td>2.21</td><td>2,359</td><td>NA</td><td>205</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>FCLGA3647</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+w7-3545&amp;id=6746">Intel Xeon w7-3545</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Xeon+w7-3545&amp;id=6746#price">$2,039.00*</a></td><td>59,163</td><td>29.02</td><td>3,325</td><td>1.63</td><td>310</td><td>190.85</td><td class="sorting_1">Jun 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT8768&amp;id=6765">Mediatek MT8768</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT8768&amp;id=6765#price">NA</a></td><td>1,957</td><td>NA</td><td>630</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT8791V%2FHZA&amp;id=6750">Mediatek MT8791V/HZA</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT8791V%2FHZA&amp;id=6750#price">NA</a></td><td>4,882</td><td>NA</td><td>2,231</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT8791V%2FTZA&amp;id=6727">Mediatek MT8791V/TZA</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT8791V%2FTZA&amp;id=6727#price">NA</a></td><td>2,909</td><td>NA</td><td>2,082</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+SG8275&amp;id=6763">QTI SG8275</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+SG8275&amp;id=6763#price">NA</a></td><td>10,036</td><td>NA</td><td>3,208</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+SM8735&amp;id=6760">QTI SM8735</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+SM8735&amp;id=6760#price">NA</a></td><td>11,144</td><td>NA</td><td>2,711</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Snapdragon+X+Plus+%288-core%29+%40+3.30+GHz&amp;id=6732">Snapdragon X Plus (8-core) @ 3.30 GHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Snapdragon+X+Plus+%288-core%29+%40+3.30+GHz&amp;id=6732#price">NA</a></td><td>17,778</td><td>NA</td><td>3,194</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Spreadtrum+UMS9230H&amp;id=6737">Spreadtrum UMS9230H</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Spreadtrum+UMS9230H&amp;id=6737#price">NA</a></td><td>1,477</td><td>NA</td><td>1,119</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=StratoVirt&amp;id=6736">StratoVirt</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=StratoVirt&amp;id=6736#price">NA</a></td><td>11,440</td><td>NA</td><td>1,552</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=virt-10.0&amp;id=6744">virt-10.0</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=virt-10.0&amp;id=6744#price">NA</a></td><td>3,127</td><td>NA</td><td>1,338</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=virt-8.2&amp;id=6739">virt-8.2</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=virt-8.2&amp;id=6739#price">NA</a></td><td>6,547</td><td>NA</td><td>1,555</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Virtual+%40+2.89GHz&amp;id=6752">Virtual @ 2.89GHz</a></td><td>1</td><td>7</td><td><a href="cpu.php?cpu=Virtual+%40+2.89GHz&amp;id=6752#price">NA</a></td><td>4,134</td><td>NA</td><td>1,111</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+4245P&amp;id=6711">AMD EPYC 4245P</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+EPYC+4245P&amp;id=6711#price">$239.00*</a></td><td>31,316</td><td>131.03</td><td>4,603</td><td>19.26</td><td>65</td><td>481.79</td><td class="sorting_1">May 2025</td><td>AM5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+4345P&amp;id=6710">AMD EPYC 4345P</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+EPYC+4345P&amp;id=6710#price">$329.00*</a></td><td>37,671</td><td>114.50</td><td>4,672</td><td>14.20</td><td>65</td><td>579.55</td><td class="sorting_1">May 2025</td><td>AM5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+4565P&amp;id=6714">AMD EPYC 4565P</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+EPYC+4565P&amp;id=6714#price">$589.00*</a></td><td>64,006</td><td>108.67</td><td>4,738</td><td>8.04</td><td>170</td><td>376.51</td><td class="sorting_1">May 2025</td><td>AM5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9755&amp;id=6702">AMD EPYC 9755</a></td><td>1</td><td>128</td><td><a href="cpu.php?cpu=AMD+EPYC+9755&amp;id=6702#price">$12,984.00*</a></td><td>166,328</td><td>12.81</td><td>3,503</td><td>0.27</td><td>500</td><td>332.66</td><td class="sorting_1">May 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9755&amp;id=6702&amp;cpuCount=2">[Dual CPU] AMD EPYC 9755</a></td><td>2</td><td>128</td><td><a href="cpu.php?cpu=AMD+EPYC+9755&amp;id=6702#price">$25,968.00*</a></td><td>197,637</td><td>7.61</td><td>3,491</td><td>NA</td><td>500</td><td>NA</td><td class="sorting_1">May 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9B45&amp;id=6681">AMD EPYC 9B45</a></td><td>1</td><td>32</td><td><a href="cpu.php?cpu=AMD+EPYC+9B45&amp;id=6681#price">$13,564.00*</a></td><td>158,790</td><td>11.71</td><td>3,540</td><td>0.26</td><td>390</td><td>407.15</td><td class="sorting_1">May 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+PRO+215&amp;id=6705">AMD Ryzen 5 PRO 215</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+PRO+215&amp;id=6705#price">NA</a></td><td>19,690</td><td>NA</td><td>3,834</td><td>NA</td><td>28</td><td>703.22</td><td class="sorting_1">May 2025</td><td>FP8</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+255&amp;id=6715">AMD Ryzen 7 255</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+255&amp;id=6715#price">NA</a></td><td>31,072</td><td>NA</td><td>3,833</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+4950U+Mobile&amp;id=6677">AMD Ryzen 9 4950U Mobile</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+4950U+Mobile&amp;id=6677#price">NA</a></td><td>16,290</td><td>NA</td><td>2,724</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+8940HX&amp;id=6674">AMD Ryzen 9 8940HX</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+8940HX&amp;id=6674#price">NA</a></td><td>54,675</td><td>NA</td><td>4,033</td><td>NA</td><td>55</td><td>994.09</td><td class="sorting_1">May 2025</td><td>FL1</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+8945HX&amp;id=6691">AMD Ryzen 9 8945HX</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+8945HX&amp;id=6691#price">NA</a></td><td>50,251</td><td>NA</td><td>3,963</td><td>NA</td><td>55</td><td>913.65</td><td class="sorting_1">May 2025</td><td>FL1</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+9+H+365&amp;id=6709">AMD Ryzen AI 9 H 365</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+9+H+365&amp;id=6709#price">NA</a></td><td>28,941</td><td>NA</td><td>3,624</td><td>NA</td><td>54</td><td>535.95</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+9980X&amp;id=6670">AMD Ryzen Threadripper 9980X</a></td><td>1</td><td>64</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+9980X&amp;id=6670#price">NA</a></td><td>153,564</td><td>NA</td><td>4,591</td><td>NA</td><td>350</td><td>438.75</td><td class="sorting_1">May 2025</td><td>sTR5</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Threadripper+PRO+9995WX&amp;id=6693">AMD Ryzen Threadripper PRO 9995WX</a></td><td>1</td><td>96</td><td><a href="cpu.php?cpu=AMD+Ryzen+Threadripper+PRO+9995WX&amp;id=6693#price">NA</a></td><td>174,825</td><td>NA</td><td>4,565</td><td>NA</td><td>350</td><td>499.50</td><td class="sorting_1">May 2025</td><td>sTR5</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Amlogic+AMLA311D2&amp;id=6683">Amlogic AMLA311D2</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Amlogic+AMLA311D2&amp;id=6683#price">NA</a></td><td>3,522</td><td>NA</td><td>1,028</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A72+2+Core+1703+MHz&amp;id=6717">ARM Cortex-A72 2 Core 1703 MHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=ARM+Cortex-A72+2+Core+1703+MHz&amp;id=6717#price">NA</a></td><td>1,005</td><td>NA</td><td>578</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A72+8+Core+2016+MHz&amp;id=6686">ARM Cortex-A72 8 Core 2016 MHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=ARM+Cortex-A72+8+Core+2016+MHz&amp;id=6686#price">NA</a></td><td>2,208</td><td>NA</td><td>591</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A720+8+Core+2600+MHz&amp;id=6722">ARM Cortex-A720 8 Core 2600 MHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=ARM+Cortex-A720+8+Core+2600+MHz&amp;id=6722#price">NA</a></td><td>6,141</td><td>NA</td><td>1,455</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A76+4+Core+1608+MHz&amp;id=6720">ARM Cortex-A76 4 Core 1608 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A76+4+Core+1608+MHz&amp;id=6720#price">NA</a></td><td>2,698</td><td>NA</td><td>848</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Neoverse-V2+2+Core+0+MHz&amp;id=6696">ARM Neoverse-V2 2 Core 0 MHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=ARM+Neoverse-V2+2+Core+0+MHz&amp;id=6696#price">NA</a></td><td>1,991</td><td>NA</td><td>1,940</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Broadcom+BCM2712&amp;id=6672">Broadcom BCM2712</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Broadcom+BCM2712&amp;id=6672#price">NA</a></td><td>4,095</td><td>NA</td><td>1,804</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Essgoo&amp;id=6695">Essgoo</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Essgoo&amp;id=6695#price">NA</a></td><td>497</td><td>NA</td><td>349</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Atom+C3708+%40+1.70GHz&amp;id=6690">Intel Atom C3708 @ 1.70GHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Atom+C3708+%40+1.70GHz&amp;id=6690#price">$224.00*</a></td><td>3,750</td><td>16.74</td><td>681</td><td>3.04</td><td>17</td><td>220.61</td><td class="sorting_1">May 2025</td><td>FCBGA1310</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Celeron+5305U+%40+2.30GHz&amp;id=6669">Intel Celeron 5305U @ 2.30GHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Celeron+5305U+%40+2.30GHz&amp;id=6669#price">$128.00*</a></td><td>1,684</td><td>13.16</td><td>1,195</td><td>9.34</td><td>15</td><td>112.27</td><td class="sorting_1">May 2025</td><td>FCBGA1528</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+3+201E&amp;id=6724">Intel Core 3 201E</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Intel+Core+3+201E&amp;id=6724#price">NA</a></td><td>14,817</td><td>NA</td><td>3,284</td><td>NA</td><td>60</td><td>246.95</td><td class="sorting_1">May 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+9+270H&amp;id=6718">Intel Core 9 270H</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+9+270H&amp;id=6718#price">NA</a></td><td>31,602</td><td>NA</td><td>4,404</td><td>NA</td><td>45</td><td>702.26</td><td class="sorting_1">May 2025</td><td>FCBGA1744</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i5-9500E+%40+3.00GHz&amp;id=6671">Intel Core i5-9500E @ 3.00GHz</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=Intel+Core+i5-9500E+%40+3.00GHz&amp;id=6671#price">$192.00*</a></td><td>8,829</td><td>45.99</td><td>2,153</td><td>11.22</td><td>65</td><td>135.84</td><td class="sorting_1">May 2025</td><td>FCLGA1151</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+115U&amp;id=6716">Intel Core Ultra 5 115U</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+115U&amp;id=6716#price">NA</a></td><td>13,024</td><td>NA</td><td>3,057</td><td>NA</td><td>15</td><td>868.25</td><td class="sorting_1">May 2025</td><td>FCBGA2049</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+245&amp;id=6675">Intel Core Ultra 5 245</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+245&amp;id=6675#price">NA</a></td><td>38,809</td><td>NA</td><td>4,475</td><td>NA</td><td>65</td><td>597.06</td><td class="sorting_1">May 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+7+265HX&amp;id=6708">Intel Core Ultra 7 265HX</a></td><td>1</td><td>20</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+7+265HX&amp;id=6708#price">NA</a></td><td>49,826</td><td>NA</td><td>4,531</td><td>NA</td><td>55</td><td>905.93</td><td class="sorting_1">May 2025</td><td>FCBGA2114</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+7+265T&amp;id=6687">Intel Core Ultra 7 265T</a></td><td>1</td><td>20</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+7+265T&amp;id=6687#price">NA</a></td><td>36,838</td><td>NA</td><td>4,624</td><td>NA</td><td>35</td><td>1,052.52</td><td class="sorting_1">May 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Ultra+5+115U&amp;id=6689">Intel Ultra 5 115U</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Ultra+5+115U&amp;id=6689#price">NA</a></td><td>12,381</td><td>NA</td><td>2,876</td><td>NA</td><td>15</td><td>825.38</td><td class="sorting_1">May 2025</td><td>FCBGA2049</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6325P&amp;id=6688">Intel Xeon 6325P</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Intel+Xeon+6325P&amp;id=6688#price">NA</a></td><td>16,045</td><td>NA</td><td>4,283</td><td>NA</td><td>55</td><td>291.73</td><td class="sorting_1">May 2025</td><td>FCLGA1700</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6353P&amp;id=6673">Intel Xeon 6353P</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Xeon+6353P&amp;id=6673#price">$426.00*</a></td><td>27,662</td><td>64.93</td><td>4,200</td><td>9.86</td><td>65</td><td>425.57</td><td class="sorting_1">May 2025</td><td>FCLGA1700</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6369P&amp;id=6680">Intel Xeon 6369P</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Xeon+6369P&amp;id=6680#price">$606.00*</a></td><td>29,680</td><td>48.98</td><td>4,322</td><td>7.13</td><td>95</td><td>312.42</td><td class="sorting_1">May 2025</td><td>FCLGA1700</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6520P&amp;id=6668&amp;cpuCount=2">[Dual CPU] Intel Xeon 6520P</a></td><td>2</td><td>24</td><td><a href="cpu.php?cpu=Intel+Xeon+6520P&amp;id=6668#price">$2,590.00*</a></td><td>99,016</td><td>38.23</td><td>3,349</td><td>NA</td><td>210</td><td>NA</td><td class="sorting_1">May 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6747P&amp;id=6707&amp;cpuCount=2">[Dual CPU] Intel Xeon 6747P</a></td><td>2</td><td>48</td><td><a href="cpu.php?cpu=Intel+Xeon+6747P&amp;id=6707#price">$12,994.00*</a></td><td>141,231</td><td>10.87</td><td>3,201</td><td>NA</td><td>330</td><td>NA</td><td class="sorting_1">May 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Bronze+3508U&amp;id=6676">Intel Xeon Bronze 3508U</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Xeon+Bronze+3508U&amp;id=6676#price">$415.00*</a></td><td>11,224</td><td>27.05</td><td>1,663</td><td>4.01</td><td>125</td><td>89.79</td><td class="sorting_1">May 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Platinum+8490H&amp;id=6721&amp;cpuCount=4">[Quad CPU] Intel Xeon Platinum 8490H</a></td><td>4</td><td>60</td><td><a href="cpu.php?cpu=Intel+Xeon+Platinum+8490H&amp;id=6721#price">$68,000.00*</a></td><td>157,156</td><td>2.31</td><td>2,925</td><td>NA</td><td>350</td><td>NA</td><td class="sorting_1">May 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Platinum+8558&amp;id=6684&amp;cpuCount=2">[Dual CPU] Intel Xeon Platinum 8558</a></td><td>2</td><td>48</td><td><a href="cpu.php?cpu=Intel+Xeon+Platinum+8558&amp;id=6684#price">$9,300.00*</a></td><td>100,177</td><td>10.77</td><td>2,388</td><td>NA</td><td>330</td><td>NA</td><td class="sorting_1">May 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+w3-2525&amp;id=6679">Intel Xeon w3-2525</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Xeon+w3-2525&amp;id=6679#price">$609.00*</a></td><td>27,882</td><td>45.78</td><td>3,430</td><td>5.63</td><td>175</td><td>159.33</td><td class="sorting_1">May 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT8195AV&amp;id=6704">Mediatek MT8195AV</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT8195AV&amp;id=6704#price">NA</a></td><td>6,251</td><td>NA</td><td>1,977</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=MT6739CW&amp;id=6682">MT6739CW</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=MT6739CW&amp;id=6682#price">NA</a></td><td>545</td><td>NA</td><td>353</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+QM215&amp;id=6703">QTI QM215</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=QTI+QM215&amp;id=6703#price">NA</a></td><td>563</td><td>NA</td><td>347</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+SM4635&amp;id=6685">QTI SM4635</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+SM4635&amp;id=6685#price">NA</a></td><td>3,618</td><td>NA</td><td>1,477</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+8324PN+32-Core&amp;id=6644">AMD EPYC 8324PN 32-Core</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+EPYC+8324PN+32-Core&amp;id=6644#price">NA</a></td><td>8,375</td><td>NA</td><td>1,232</td><td>NA</td><td>130</td><td>64.42</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9J45&amp;id=6662&amp;cpuCount=2">[Dual CPU] AMD EPYC 9J45</a></td><td>2</td><td>128</td><td><a href="cpu.php?cpu=AMD+EPYC+9J45&amp;id=6662#price">NA</a></td><td>201,335</td><td>NA</td><td>3,488</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+3+210&amp;id=6634">AMD Ryzen 3 210</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=AMD+Ryzen+3+210&amp;id=6634#price">NA</a></td><td>13,175</td><td>NA</td><td>3,652</td><td>NA</td><td>28</td><td>470.55</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+220&amp;id=6616">AMD Ryzen 5 220</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+220&amp;id=6616#price">NA</a></td><td>18,260</td><td>NA</td><td>3,595</td><td>NA</td><td>28</td><td>652.16</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+240&amp;id=6615">AMD Ryzen 5 240</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+240&amp;id=6615#price">NA</a></td><td>22,576</td><td>NA</td><td>3,533</td><td>NA</td><td>45</td><td>501.69</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+7533HS&amp;id=6642">AMD Ryzen 5 7533HS</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+7533HS&amp;id=6642#price">NA</a></td><td>14,520</td><td>NA</td><td>2,740</td><td>NA</td><td>54</td><td>268.88</td><td class="sorting_1">Apr 2025</td><td>FP7</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+PRO+230&amp;id=6651">AMD Ryzen 5 PRO 230</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+PRO+230&amp;id=6651#price">NA</a></td><td>20,603</td><td>NA</td><td>3,691</td><td>NA</td><td>28</td><td>735.84</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Desktop, Laptop, Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+PRO+8645HS&amp;id=6659">AMD Ryzen 5 PRO 8645HS</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+PRO+8645HS&amp;id=6659#price">NA</a></td><td>23,227</td><td>NA</td><td>3,830</td><td>NA</td><td>45</td><td>516.16</td><td class="sorting_1">Apr 2025</td><td>FP7, FP7r2</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+260&amp;id=6658">AMD Ryzen 7 260</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+260&amp;id=6658#price">NA</a></td><td>29,955</td><td>NA</td><td>3,823</td><td>NA</td><td>45</td><td>665.66</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+7435H&amp;id=6627">AMD Ryzen 7 7435H</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+7435H&amp;id=6627#price">NA</a></td><td>24,156</td><td>NA</td><td>3,324</td><td>NA</td><td>45</td><td>536.81</td><td class="sorting_1">Apr 2025</td><td>FP7r2</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+PRO+250&amp;id=6665">AMD Ryzen 7 PRO 250</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+PRO+250&amp;id=6665#price">NA</a></td><td>23,279</td><td>NA</td><td>3,795</td><td>NA</td><td>28</td><td>831.38</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+9955HX&amp;id=6664">AMD Ryzen 9 9955HX</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+9955HX&amp;id=6664#price">NA</a></td><td>57,640</td><td>NA</td><td>4,459</td><td>NA</td><td>55</td><td>1,048.00</td><td class="sorting_1">Apr 2025</td><td>FL1</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+9955HX3D&amp;id=6641">AMD Ryzen 9 9955HX3D</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+9955HX3D&amp;id=6641#price">NA</a></td><td>61,403</td><td>NA</td><td>4,492</td><td>NA</td><td>55</td><td>1,116.42</td><td class="sorting_1">Apr 2025</td><td>FL1</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+5+340&amp;id=6657">AMD Ryzen AI 5 340</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+5+340&amp;id=6657#price">NA</a></td><td>20,196</td><td>NA</td><td>3,873</td><td>NA</td><td>28</td><td>721.27</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+5+PRO+340&amp;id=6607">AMD Ryzen AI 5 PRO 340</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+5+PRO+340&amp;id=6607#price">NA</a></td><td>18,999</td><td>NA</td><td>3,778</td><td>NA</td><td>28</td><td>678.53</td><td class="sorting_1">Apr 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+7+H+350&amp;id=6649">AMD Ryzen AI 7 H 350</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+7+H+350&amp;id=6649#price">NA</a></td><td>27,316</td><td>NA</td><td>3,970</td><td>NA</td><td>28</td><td>975.58</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+Max+Pro+385&amp;id=6656">AMD Ryzen AI Max Pro 385</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+Max+Pro+385&amp;id=6656#price">NA</a></td><td>33,441</td><td>NA</td><td>4,052</td><td>NA</td><td>55</td><td>608.02</td><td class="sorting_1">Apr 2025</td><td>FP11</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Embedded+V1780B&amp;id=6646">AMD Ryzen Embedded V1780B</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+Embedded+V1780B&amp;id=6646#price">NA</a></td><td>6,219</td><td>NA</td><td>1,607</td><td>NA</td><td>45</td><td>138.21</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+ARMv8+rev+1+%28v8l%29+4+Core+1510+MHz&amp;id=6606">ARM ARMv8 rev 1 (v8l) 4 Core 1510 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+ARMv8+rev+1+%28v8l%29+4+Core+1510+MHz&amp;id=6606#price">NA</a></td><td>1,042</td><td>NA</td><td>476</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A35+4+Core+2004+MHz&amp;id=6653">ARM Cortex-A35 4 Core 2004 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A35+4+Core+2004+MHz&amp;id=6653#price">NA</a></td><td>546</td><td>NA</td><td>259</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Kryo-3XX-Gold+8+Core+1766+MHz&amp;id=6630">ARM Kryo-3XX-Gold 8 Core 1766 MHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=ARM+Kryo-3XX-Gold+8+Core+1766+MHz&amp;id=6630#price">NA</a></td><td>2,372</td><td>NA</td><td>870</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Kryo-4XX-Silver+4+Core+1804+MHz&amp;id=6652">ARM Kryo-4XX-Silver 4 Core 1804 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Kryo-4XX-Silver+4+Core+1804+MHz&amp;id=6652#price">NA</a></td><td>3,425</td><td>NA</td><td>1,543</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=CIX+P1+CD8180&amp;id=6617">CIX P1 CD8180</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=CIX+P1+CD8180&amp;id=6617#price">NA</a></td><td>9,277</td><td>NA</td><td>1,376</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+3+N350&amp;id=6623">Intel 3 N350</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+3+N350&amp;id=6623#price">NA</a></td><td>4,877</td><td>NA</td><td>1,757</td><td>NA</td><td>7</td><td>696.75</td><td class="sorting_1">Apr 2025</td><td>FCBGA1264</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+3+N350&amp;id=6605">Intel Core 3 N350</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Core+3+N350&amp;id=6605#price">NA</a></td><td>7,117</td><td>NA</td><td>1,806</td><td>NA</td><td>7</td><td>1,016.78</td><td class="sorting_1">Apr 2025</td><td>FCBGA1264</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i5-1345URE&amp;id=6626">Intel Core i5-1345URE</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Core+i5-1345URE&amp;id=6626#price">$340.00*</a></td><td>11,565</td><td>34.01</td><td>3,122</td><td>9.18</td><td>15</td><td>770.98</td><td class="sorting_1">Apr 2025</td><td>FCBGA1744</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+235T&amp;id=6650">Intel Core Ultra 5 235T</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+235T&amp;id=6650#price">$247.00*</a></td><td>32,438</td><td>131.33</td><td>4,425</td><td>17.92</td><td>65</td><td>499.05</td><td class="sorting_1">Apr 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+245T&amp;id=6637">Intel Core Ultra 5 245T</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+245T&amp;id=6637#price">$270.00*</a></td><td>32,036</td><td>118.65</td><td>4,456</td><td>16.50</td><td>35</td><td>915.32</td><td class="sorting_1">Apr 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+7+255HX&amp;id=6648">Intel Core Ultra 7 255HX</a></td><td>1</td><td>20</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+7+255HX&amp;id=6648#price">NA</a></td><td>50,739</td><td>NA</td><td>4,645</td><td>NA</td><td>55</td><td>922.53</td><td class="sorting_1">Apr 2025</td><td>FCBGA2114</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+7+265H&amp;id=6660">Intel Core Ultra 7 265H</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+7+265H&amp;id=6660#price">NA</a></td><td>34,067</td><td>NA</td><td>4,432</td><td>NA</td><td>28</td><td>1,216.68</td><td class="sorting_1">Apr 2025</td><td>FCBGA2049</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+9+285HX&amp;id=6608">Intel Core Ultra 9 285HX</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+9+285HX&amp;id=6608#price">NA</a></td><td>62,297</td><td>NA</td><td>4,784</td><td>NA</td><td>55</td><td>1,132.68</td><td class="sorting_1">Apr 2025</td><td>FCBGA2114</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+CoreTM+Ultra+5+115U&amp;id=6661">Intel CoreTM Ultra 5 115U</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+CoreTM+Ultra+5+115U&amp;id=6661#price">NA</a></td><td>12,771</td><td>NA</td><td>3,421</td><td>NA</td><td>15</td><td>851.42</td><td class="sorting_1">Apr 2025</td><td>FCBGA2049</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Pentium+Gold+G7400E&amp;id=6643">Intel Pentium Gold G7400E</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Pentium+Gold+G7400E&amp;id=6643#price">$79.00*</a></td><td>6,134</td><td>77.65</td><td>2,875</td><td>36.39</td><td>46</td><td>133.35</td><td class="sorting_1">Apr 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6521P&amp;id=6625">Intel Xeon 6521P</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Xeon+6521P&amp;id=6625#price">$1,250.00*</a></td><td>57,970</td><td>46.38</td><td>2,829</td><td>2.26</td><td>225</td><td>257.65</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6530P&amp;id=6621&amp;cpuCount=2">[Dual CPU] Intel Xeon 6530P</a></td><td>2</td><td>32</td><td><a href="cpu.php?cpu=Intel+Xeon+6530P&amp;id=6621#price">$4,468.00*</a></td><td>124,434</td><td>27.85</td><td>3,453</td><td>NA</td><td>225</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6736P&amp;id=6622&amp;cpuCount=2">[Dual CPU] Intel Xeon 6736P</a></td><td>2</td><td>36</td><td><a href="cpu.php?cpu=Intel+Xeon+6736P&amp;id=6622#price">NA</a></td><td>125,444</td><td>NA</td><td>3,445</td><td>NA</td><td>205</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6737P&amp;id=6620&amp;cpuCount=2">[Dual CPU] Intel Xeon 6737P</a></td><td>2</td><td>32</td><td><a href="cpu.php?cpu=Intel+Xeon+6737P&amp;id=6620#price">$9,990.00*</a></td><td>127,075</td><td>12.72</td><td>3,366</td><td>NA</td><td>270</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6740P&amp;id=6633&amp;cpuCount=2">[Dual CPU] Intel Xeon 6740P</a></td><td>2</td><td>48</td><td><a href="cpu.php?cpu=Intel+Xeon+6740P&amp;id=6633#price">$9,300.00*</a></td><td>122,165</td><td>13.14</td><td>3,185</td><td>NA</td><td>270</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6741P&amp;id=6632">Intel Xeon 6741P</a></td><td>1</td><td>48</td><td><a href="cpu.php?cpu=Intel+Xeon+6741P&amp;id=6632#price">$4,421.00*</a></td><td>100,660</td><td>22.77</td><td>3,195</td><td>0.72</td><td>300</td><td>335.53</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6787P&amp;id=6610&amp;cpuCount=2">[Dual CPU] Intel Xeon 6787P</a></td><td>2</td><td>86</td><td><a href="cpu.php?cpu=Intel+Xeon+6787P&amp;id=6610#price">$20,800.00*</a></td><td>148,896</td><td>7.16</td><td>3,137</td><td>NA</td><td>350</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+D-2766NT+%40+2.00GHz&amp;id=6639">Intel Xeon D-2766NT @ 2.00GHz</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Xeon+D-2766NT+%40+2.00GHz&amp;id=6639#price">$1,224.00*</a></td><td>24,013</td><td>19.62</td><td>1,930</td><td>1.58</td><td>97</td><td>247.56</td><td class="sorting_1">Apr 2025</td><td>FCBGA2579</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+E7-4820+v2+%40+2.00GHz&amp;id=6654&amp;cpuCount=2">[Dual CPU] Intel Xeon E7-4820 v2 @ 2.00GHz</a></td><td>2</td><td>8</td><td><a href="cpu.php?cpu=Intel+Xeon+E7-4820+v2+%40+2.00GHz&amp;id=6654#price">NA</a></td><td>9,610</td><td>NA</td><td>1,324</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA2011</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Platinum+8260C+%40+2.40GHz&amp;id=6629">Intel Xeon Platinum 8260C @ 2.40GHz</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Xeon+Platinum+8260C+%40+2.40GHz&amp;id=6629#price">NA</a></td><td>34,420</td><td>NA</td><td>2,203</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>FCLGA3647</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT6739W&amp;id=6618">Mediatek MT6739W</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Mediatek+MT6739W&amp;id=6618#price">NA</a></td><td>251</td><td>NA</td><td>103</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=MT8161AB&amp;id=6614">MT8161AB</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=MT8161AB&amp;id=6614#price">NA</a></td><td>700</td><td>NA</td><td>285</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+SM6650&amp;id=6636">QTI SM6650</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+SM6650&amp;id=6636#price">NA</a></td><td>5,972</td><td>NA</td><td>1,178</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Qualcomm+Snapdragon+808+%288992%29&amp;id=6667">Qualcomm Snapdragon 808 (8992)</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=Qualcomm+Snapdragon+808+%288992%29&amp;id=6667#price">NA</a></td><td>720</td><td>NA</td><td>173</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=sc8830&amp;id=6619">sc8830</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=sc8830&amp;id=6619#price">NA</a></td><td>438</td><td>NA</td><td>295</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Allwinner+A733&amp;id=6545">Allwinner A733</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Allwinner+A733&amp;id=6545#price">NA</a></td><td>3,109</td><td>NA</td><td>1,330</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9175F&amp;id=6557">AMD EPYC 9175F</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+EPYC+9175F&amp;id=6557#price">$4,256.00*</a></td><td>65,792</td><td>15.46</td><td>4,271</td><td>1.00</td><td>320</td><td>205.60</td><td class="sorting_1">Mar 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9175F&amp;id=6557&amp;cpuCount=2">[Dual CPU] AMD EPYC 9175F</a></td><td>2</td><td>16</td><td><a href="cpu.php?cpu=AMD+EPYC+9175F&amp;id=6557#price">$8,512.00*</a></td><td>100,968</td><td>11.86</td><td>3,702</td><td>NA</td><td>320</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9V94&amp;id=6604&amp;cpuCount=2">[Dual CPU] AMD EPYC 9V94</a></td><td>2</td><td>128</td><td><a href="cpu.php?cpu=AMD+EPYC+9V94&amp;id=6604#price">NA</a></td><td>83,538</td><td>NA</td><td>1,902</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+7400F&amp;id=6603">AMD Ryzen 5 7400F</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+7400F&amp;id=6603#price">NA</a></td><td>25,607</td><td>NA</td><td>3,642</td><td>NA</td><td>65</td><td>393.96</td><td class="sorting_1">Mar 2025</td><td>AM5 (LGA 1718)</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+9600&amp;id=6590">AMD Ryzen 5 9600</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+9600&amp;id=6590#price">$463.56*</a></td><td>28,736</td><td>61.99</td><td>4,287</td><td>9.25</td><td>65</td><td>442.10</td><td class="sorting_1">Mar 2025</td><td>AM5</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+9900X3D&amp;id=6548">AMD Ryzen 9 9900X3D</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+9900X3D&amp;id=6548#price">$539.99</a></td><td>56,154</td><td>103.99</td><td>4,646</td><td>8.60</td><td>120</td><td>467.95</td><td class="sorting_1">Mar 2025</td><td>AM5</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+9+9950X3D&amp;id=6549">AMD Ryzen 9 9950X3D</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+Ryzen+9+9950X3D&amp;id=6549#price">$638.00</a></td><td>70,255</td><td>110.12</td><td>4,737</td><td>7.42</td><td>170</td><td>413.26</td><td class="sorting_1">Mar 2025</td><td>AM5</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+Max+385&amp;id=6602">AMD Ryzen AI Max 385</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+Max+385&amp;id=6602#price">NA</a></td><td>18,441</td><td>NA</td><td>2,056</td><td>NA</td><td>55</td><td>335.30</td><td class="sorting_1">Mar 2025</td><td>FP11</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+Max+390&amp;id=6598">AMD Ryzen AI Max 390</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+Max+390&amp;id=6598#price">NA</a></td><td>42,429</td><td>NA</td><td>4,025</td><td>NA</td><td>55</td><td>771.43</td><td class="sorting_1">Mar 2025</td><td>FP11</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+Z2+Go&amp;id=6563">AMD Ryzen Z2 Go</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=AMD+Ryzen+Z2+Go&amp;id=6563#price">NA</a></td><td>12,043</td><td>NA</td><td>3,116</td><td>NA</td><td>28</td><td>430.10</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Apple+A16&amp;id=6566">Apple A16</a></td><td>1</td><td>5</td><td><a href="cpu.php?cpu=Apple+A16&amp;id=6566#price">NA</a></td><td>10,033</td><td>NA</td><td>4,072</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Apple+M3+Ultra+28+Core&amp;id=6569">Apple M3 Ultra 28 Core</a></td><td>1</td><td>28</td><td><a href="cpu.php?cpu=Apple+M3+Ultra+28+Core&amp;id=6569#price">NA</a></td><td>68,805</td><td>NA</td><td>5,141</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Apple+M3+Ultra+32+Core&amp;id=6580">Apple M3 Ultra 32 Core</a></td><td>1</td><td>32</td><td><a href="cpu.php?cpu=Apple+M3+Ultra+32+Core&amp;id=6580#price">NA</a></td><td>73,785</td><td>NA</td><td>5,106</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+CIX+P1+CD8180+7+Core+2500+MHz&amp;id=6561">ARM CIX P1 CD8180 7 Core 2500 MHz</a></td><td>1</td><td>7</td><td><a href="cpu.php?cpu=ARM+CIX+P1+CD8180+7+Core+2500+MHz&amp;id=6561#price">NA</a></td><td>5,505</td><td>NA</td><td>1,395</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A53+4+Core+1416+MHz&amp;id=6552">ARM Cortex-A53 4 Core 1416 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A53+4+Core+1416+MHz&amp;id=6552#price">NA</a></td><td>468</td><td>NA</td><td>203</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A55+4+Core+2208+MHz&amp;id=6543">ARM Cortex-A55 4 Core 2208 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A55+4+Core+2208+MHz&amp;id=6543#price">NA</a></td><td>798</td><td>NA</td><td>368</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A78+4+Core+1958+MHz&amp;id=6589">ARM Cortex-A78 4 Core 1958 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A78+4+Core+1958+MHz&amp;id=6589#price">NA</a></td><td>3,150</td><td>NA</td><td>1,474</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Hygon+C86-4G+%28OPN%3A3490%29&amp;id=6553">Hygon C86-4G (OPN:3490)</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=Hygon+C86-4G+%28OPN%3A3490%29&amp;id=6553#price">NA</a></td><td>21,378</td><td>NA</td><td>1,760</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Celeron+G5900E+%40+3.20GHz&amp;id=6546">Intel Celeron G5900E @ 3.20GHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Celeron+G5900E+%40+3.20GHz&amp;id=6546#price">$53.00*</a></td><td>1,809</td><td>34.13</td><td>1,896</td><td>35.76</td><td>58</td><td>31.19</td><td class="sorting_1">Mar 2025</td><td>LGA 1200</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i3-12300HL&amp;id=6547">Intel Core i3-12300HL</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Intel+Core+i3-12300HL&amp;id=6547#price">NA</a></td><td>20,321</td><td>NA</td><td>3,586</td><td>NA</td><td>45</td><td>451.58</td><td class="sorting_1">Mar 2025</td><td>FCLGA1700</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+225T&amp;id=6550">Intel Core Ultra 5 225T</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+225T&amp;id=6550#price">NA</a></td><td>25,358</td><td>NA</td><td>4,348</td><td>NA</td><td>35</td><td>724.51</td><td class="sorting_1">Mar 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+7+265F&amp;id=6558">Intel Core Ultra 7 265F</a></td><td>1</td><td>20</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+7+265F&amp;id=6558#price">$264.99</a></td><td>48,349</td><td>182.46</td><td>4,717</td><td>17.80</td><td>65</td><td>743.83</td><td class="sorting_1">Mar 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Pentium+G3460T+%40+3.00GHz&amp;id=6588">Intel Pentium G3460T @ 3.00GHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Pentium+G3460T+%40+3.00GHz&amp;id=6588#price">NA</a></td><td>2,036</td><td>NA</td><td>1,674</td><td>NA</td><td>35</td><td>58.17</td><td class="sorting_1">Mar 2025</td><td>FCLGA1150</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Pentium+Gold+8500&amp;id=6586">Intel Pentium Gold 8500</a></td><td>1</td><td>5</td><td><a href="cpu.php?cpu=Intel+Pentium+Gold+8500&amp;id=6586#price">NA</a></td><td>5,652</td><td>NA</td><td>2,714</td><td>NA</td><td>9</td><td>628.05</td><td class="sorting_1">Mar 2025</td><td>FCBGA1781</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6517P&amp;id=6556">Intel Xeon 6517P</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=Intel+Xeon+6517P&amp;id=6556#price">$1,195.00*</a></td><td>49,572</td><td>41.48</td><td>3,481</td><td>2.91</td><td>190</td><td>260.90</td><td class="sorting_1">Mar 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+6760P&amp;id=6595&amp;cpuCount=2">[Dual CPU] Intel Xeon 6760P</a></td><td>2</td><td>64</td><td><a href="cpu.php?cpu=Intel+Xeon+6760P&amp;id=6595#price">NA</a></td><td>153,187</td><td>NA</td><td>3,214</td><td>NA</td><td>330</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>FCLGA4710</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Gold+6554S&amp;id=6583">Intel Xeon Gold 6554S</a></td><td>1</td><td>36</td><td><a href="cpu.php?cpu=Intel+Xeon+Gold+6554S&amp;id=6583#price">$2,974.99</a></td><td>50,777</td><td>17.07</td><td>1,802</td><td>0.61</td><td>270</td><td>188.06</td><td class="sorting_1">Mar 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Gold+6554S&amp;id=6583&amp;cpuCount=2">[Dual CPU] Intel Xeon Gold 6554S</a></td><td>2</td><td>36</td><td><a href="cpu.php?cpu=Intel+Xeon+Gold+6554S&amp;id=6583#price">$5,949.98</a></td><td>108,431</td><td>18.22</td><td>3,269</td><td>NA</td><td>270</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Phi+7290+%40+1.50GHz&amp;id=6597">Intel Xeon Phi 7290 @ 1.50GHz</a></td><td>1</td><td>72</td><td><a href="cpu.php?cpu=Intel+Xeon+Phi+7290+%40+1.50GHz&amp;id=6597#price">$3,213.00*</a></td><td>17,839</td><td>5.55</td><td>485</td><td>0.15</td><td>245</td><td>72.81</td><td class="sorting_1">Mar 2025</td><td>SVLCLGA3647</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Platinum+8170M+%40+2.10GHz&amp;id=6600&amp;cpuCount=2">[Dual CPU] Intel Xeon Platinum 8170M @ 2.10GHz</a></td><td>2</td><td>26</td><td><a href="cpu.php?cpu=Intel+Xeon+Platinum+8170M+%40+2.10GHz&amp;id=6600#price">NA</a></td><td>42,425</td><td>NA</td><td>1,664</td><td>NA</td><td>165</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>FCLGA3647</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Platinum+8581C+%40+2.30GHz&amp;id=6592">Intel Xeon Platinum 8581C @ 2.30GHz</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Xeon+Platinum+8581C+%40+2.30GHz&amp;id=6592#price">NA</a></td><td>8,040</td><td>NA</td><td>3,258</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+w3-2535&amp;id=6594">Intel Xeon w3-2535</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Xeon+w3-2535&amp;id=6594#price">NA</a></td><td>35,270</td><td>NA</td><td>3,614</td><td>NA</td><td>185</td><td>190.65</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+w5-3525&amp;id=6564">Intel Xeon w5-3525</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=Intel+Xeon+w5-3525&amp;id=6564#price">$1,339.00*</a></td><td>49,190</td><td>36.74</td><td>3,781</td><td>2.82</td><td>290</td><td>169.62</td><td class="sorting_1">Mar 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+w5-3535X&amp;id=6578">Intel Xeon w5-3535X</a></td><td>1</td><td>20</td><td><a href="cpu.php?cpu=Intel+Xeon+w5-3535X&amp;id=6578#price">$1,884.64*</a></td><td>54,276</td><td>28.80</td><td>3,813</td><td>2.02</td><td>300</td><td>180.92</td><td class="sorting_1">Mar 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+w7-2595X&amp;id=6599">Intel Xeon w7-2595X</a></td><td>1</td><td>26</td><td><a href="cpu.php?cpu=Intel+Xeon+w7-2595X&amp;id=6599#price">$2,039.00*</a></td><td>65,364</td><td>32.06</td><td>3,693</td><td>1.81</td><td>250</td><td>261.46</td><td class="sorting_1">Mar 2025</td><td>FCLGA4677</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Qualcomm+QCS5430&amp;id=6587">Qualcomm QCS5430</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Qualcomm+QCS5430&amp;id=6587#price">NA</a></td><td>3,729</td><td>NA</td><td>1,098</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Qualcomm+SA8195P&amp;id=6565">Qualcomm SA8195P</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Qualcomm+SA8195P&amp;id=6565#price">NA</a></td><td>5,348</td><td>NA</td><td>1,635</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Qualcomm+SM6375&amp;id=6555">Qualcomm SM6375</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Qualcomm+SM6375&amp;id=6555#price">NA</a></td><td>4,713</td><td>NA</td><td>2,001</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Rockchip+RK3566+RK817+EINK+LP4X+Board&amp;id=6585">Rockchip RK3566 RK817 EINK LP4X Board</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Rockchip+RK3566+RK817+EINK+LP4X+Board&amp;id=6585#price">NA</a></td><td>667</td><td>NA</td><td>446</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Samsung+s5e8855&amp;id=6579">Samsung s5e8855</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Samsung+s5e8855&amp;id=6579#price">NA</a></td><td>7,654</td><td>NA</td><td>2,418</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+BC-250&amp;id=6495">AMD BC-250</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+BC-250&amp;id=6495#price">NA</a></td><td>13,201</td><td>NA</td><td>2,115</td><td>NA</td><td>220</td><td>60.01</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9115&amp;id=6506">AMD EPYC 9115</a></td><td>1</td><td>16</td><td><a href="cpu.php?cpu=AMD+EPYC+9115&amp;id=6506#price">$726.00*</a></td><td>49,416</td><td>68.07</td><td>3,377</td><td>4.65</td><td>125</td><td>395.33</td><td class="sorting_1">Feb 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9555P&amp;id=6512">AMD EPYC 9555P</a></td><td>1</td><td>64</td><td><a href="cpu.php?cpu=AMD+EPYC+9555P&amp;id=6512#price">$7,983.00*</a></td><td>135,513</td><td>16.98</td><td>3,726</td><td>0.47</td><td>360</td><td>376.42</td><td class="sorting_1">Feb 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9V74&amp;id=6535">AMD EPYC 9V74</a></td><td>1</td><td>80</td><td><a href="cpu.php?cpu=AMD+EPYC+9V74&amp;id=6535#price">NA</a></td><td>117,606</td><td>NA</td><td>2,888</td><td>NA</td><td>400</td><td>294.02</td><td class="sorting_1">Feb 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+3+PRO+5355GE&amp;id=6498">AMD Ryzen 3 PRO 5355GE</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=AMD+Ryzen+3+PRO+5355GE&amp;id=6498#price">NA</a></td><td>12,761</td><td>NA</td><td>3,089</td><td>NA</td><td>35</td><td>364.61</td><td class="sorting_1">Feb 2025</td><td>AM4</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+230&amp;id=6490">AMD Ryzen 5 230</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+230&amp;id=6490#price">NA</a></td><td>21,009</td><td>NA</td><td>3,490</td><td>NA</td><td>28</td><td>750.34</td><td class="sorting_1">Feb 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+250&amp;id=6493">AMD Ryzen 7 250</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+250&amp;id=6493#price">NA</a></td><td>23,897</td><td>NA</td><td>3,719</td><td>NA</td><td>28</td><td>853.45</td><td class="sorting_1">Feb 2025</td><td>FP8</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+5825C&amp;id=6527">AMD Ryzen 7 5825C</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+5825C&amp;id=6527#price">NA</a></td><td>14,561</td><td>NA</td><td>2,645</td><td>NA</td><td>15</td><td>970.75</td><td class="sorting_1">Feb 2025</td><td>FP6</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+PRO+5755GE&amp;id=6511">AMD Ryzen 7 PRO 5755GE</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+PRO+5755GE&amp;id=6511#price">NA</a></td><td>20,894</td><td>NA</td><td>3,355</td><td>NA</td><td>35</td><td>596.96</td><td class="sorting_1">Feb 2025</td><td>AM4</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+7+PRO+350&amp;id=6513">AMD Ryzen AI 7 PRO 350</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+7+PRO+350&amp;id=6513#price">NA</a></td><td>24,220</td><td>NA</td><td>3,957</td><td>NA</td><td>28</td><td>865.02</td><td class="sorting_1">Feb 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+AI+9+HX+PRO+370&amp;id=6516">AMD Ryzen AI 9 HX PRO 370</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=AMD+Ryzen+AI+9+HX+PRO+370&amp;id=6516#price">NA</a></td><td>31,425</td><td>NA</td><td>3,952</td><td>NA</td><td>28</td><td>1,122.32</td><td class="sorting_1">Feb 2025</td><td>FP8</td><td>Desktop, Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A55+4+Core+2000+MHz&amp;id=6482">ARM Cortex-A55 4 Core 2000 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A55+4+Core+2000+MHz&amp;id=6482#price">NA</a></td><td>711</td><td>NA</td><td>320</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ARM+Cortex-A715+4+Core+2200+MHz&amp;id=6496">ARM Cortex-A715 4 Core 2200 MHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ARM+Cortex-A715+4+Core+2200+MHz&amp;id=6496#price">NA</a></td><td>3,432</td><td>NA</td><td>1,461</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Hygon+C86+3330+4-core&amp;id=6502">Hygon C86 3330 4-core</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Hygon+C86+3330+4-core&amp;id=6502#price">NA</a></td><td>6,031</td><td>NA</td><td>1,702</td><td>NA</td><td>35</td><td>172.32</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Atom+x7211E&amp;id=6542">Intel Atom x7211E</a></td><td>1</td><td>2</td><td><a href="cpu.php?cpu=Intel+Atom+x7211E&amp;id=6542#price">$39.00*</a></td><td>2,553</td><td>65.47</td><td>1,434</td><td>36.78</td><td>6</td><td>425.54</td><td class="sorting_1">Feb 2025</td><td>FCBGA1264</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+5+220H&amp;id=6514">Intel Core 5 220H</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=Intel+Core+5+220H&amp;id=6514#price">NA</a></td><td>21,268</td><td>NA</td><td>3,120</td><td>NA</td><td>45</td><td>472.62</td><td class="sorting_1">Feb 2025</td><td>FCBGA1744</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+7+240H&amp;id=6481">Intel Core 7 240H</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Core+7+240H&amp;id=6481#price">NA</a></td><td>24,606</td><td>NA</td><td>3,850</td><td>NA</td><td>45</td><td>546.80</td><td class="sorting_1">Feb 2025</td><td>FCBGA1744</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+7+250H&amp;id=6531">Intel Core 7 250H</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+7+250H&amp;id=6531#price">NA</a></td><td>25,655</td><td>NA</td><td>4,114</td><td>NA</td><td>45</td><td>570.12</td><td class="sorting_1">Feb 2025</td><td>FCBGA1744</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i5-1345UE&amp;id=6500">Intel Core i5-1345UE</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Core+i5-1345UE&amp;id=6500#price">$312.00*</a></td><td>10,312</td><td>33.05</td><td>2,697</td><td>8.65</td><td>15</td><td>687.48</td><td class="sorting_1">Feb 2025</td><td>FCBGA1744</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+i7-5960X+%40+3.50GHz&amp;id=6485&amp;cpuCount=2">[Dual CPU] Intel Core i7-5960X @ 3.50GHz</a></td><td>2</td><td>8</td><td><a href="cpu.php?cpu=Intel+Core+i7-5960X+%40+3.50GHz&amp;id=6485#price">NA</a></td><td>20,781</td><td>NA</td><td>1,663</td><td>NA</td><td>140</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>FCLGA2011</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+225H&amp;id=6525">Intel Core Ultra 5 225H</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+225H&amp;id=6525#price">NA</a></td><td>29,204</td><td>NA</td><td>4,365</td><td>NA</td><td>28</td><td>1,042.99</td><td class="sorting_1">Feb 2025</td><td>FCBGA2049</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+225U&amp;id=6521">Intel Core Ultra 5 225U</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+225U&amp;id=6521#price">NA</a></td><td>18,824</td><td>NA</td><td>3,630</td><td>NA</td><td>15</td><td>1,254.96</td><td class="sorting_1">Feb 2025</td><td>FCBGA2049</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+5+235&amp;id=6526">Intel Core Ultra 5 235</a></td><td>1</td><td>14</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+5+235&amp;id=6526#price">$264.99</a></td><td>40,192</td><td>151.67</td><td>4,542</td><td>17.14</td><td>65</td><td>618.34</td><td class="sorting_1">Feb 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+7+255U&amp;id=6488">Intel Core Ultra 7 255U</a></td><td>1</td><td>12</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+7+255U&amp;id=6488#price">NA</a></td><td>18,545</td><td>NA</td><td>3,734</td><td>NA</td><td>15</td><td>1,236.33</td><td class="sorting_1">Feb 2025</td><td>FCBGA2049</td><td>Laptop, Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+9+275HX&amp;id=6492">Intel Core Ultra 9 275HX</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+9+275HX&amp;id=6492#price">NA</a></td><td>56,415</td><td>NA</td><td>4,727</td><td>NA</td><td>55</td><td>1,025.73</td><td class="sorting_1">Feb 2025</td><td>FCBGA2114</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Core+Ultra+9+285T&amp;id=6510">Intel Core Ultra 9 285T</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=Intel+Core+Ultra+9+285T&amp;id=6510#price">$549.00*</a></td><td>36,940</td><td>67.29</td><td>4,775</td><td>8.70</td><td>35</td><td>1,055.44</td><td class="sorting_1">Feb 2025</td><td>FCLGA1851</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+D-1823NT+%40+2.80GHz&amp;id=6541">Intel Xeon D-1823NT @ 2.80GHz</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=Intel+Xeon+D-1823NT+%40+2.80GHz&amp;id=6541#price">$436.00*</a></td><td>13,673</td><td>31.36</td><td>2,429</td><td>5.57</td><td>55</td><td>248.60</td><td class="sorting_1">Feb 2025</td><td>FCBGA2227</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Intel+Xeon+Gold+5215+%40+2.20GHz&amp;id=6484">Intel Xeon Gold 5215 @ 2.20GHz</a></td><td>1</td><td>10</td><td><a href="cpu.php?cpu=Intel+Xeon+Gold+5215+%40+2.20GHz&amp;id=6484#price">$1,424.00*</a></td><td>16,304</td><td>11.45</td><td>2,101</td><td>1.48</td><td>85</td><td>191.81</td><td class="sorting_1">Feb 2025</td><td>FCLGA3647</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+Dimensity+9400+%28MT6991%29&amp;id=6537">Mediatek Dimensity 9400 (MT6991)</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+Dimensity+9400+%28MT6991%29&amp;id=6537#price">NA</a></td><td>12,506</td><td>NA</td><td>3,022</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Mediatek+MT6769V%2FCB&amp;id=6483">Mediatek MT6769V/CB</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Mediatek+MT6769V%2FCB&amp;id=6483#price">NA</a></td><td>2,652</td><td>NA</td><td>1,100</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+QCS4490&amp;id=6540">QTI QCS4490</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+QCS4490&amp;id=6540#price">NA</a></td><td>5,179</td><td>NA</td><td>2,191</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+SM4250&amp;id=6507">QTI SM4250</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+SM4250&amp;id=6507#price">NA</a></td><td>2,631</td><td>NA</td><td>802</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=QTI+SM6475&amp;id=6486">QTI SM6475</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=QTI+SM6475&amp;id=6486#price">NA</a></td><td>5,924</td><td>NA</td><td>2,040</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Qualcomm+SA8155P&amp;id=6515">Qualcomm SA8155P</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Qualcomm+SA8155P&amp;id=6515#price">NA</a></td><td>4,257</td><td>NA</td><td>1,365</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=RK3568+AIoT3568+Board+V2.1-AD52068%2C+LVDS%288775%29%2C+HD&amp;id=6523">RK3568 AIoT3568 Board V2.1-AD52068, LVDS(8775), HD</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=RK3568+AIoT3568+Board+V2.1-AD52068%2C+LVDS%288775%29%2C+HD&amp;id=6523#price">NA</a></td><td>1,178</td><td>NA</td><td>526</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Rockchip+RK3228A&amp;id=6517">Rockchip RK3228A</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=Rockchip+RK3228A&amp;id=6517#price">NA</a></td><td>314</td><td>NA</td><td>202</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Snapdragon+X+-+X126100+-+Qualcomm+Oryon&amp;id=6491">Snapdragon X - X126100 - Qualcomm Oryon</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Snapdragon+X+-+X126100+-+Qualcomm+Oryon&amp;id=6491#price">NA</a></td><td>16,843</td><td>NA</td><td>2,892</td><td>NA</td><td>30</td><td>561.43</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Laptop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=sun8iw7&amp;id=6538">sun8iw7</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=sun8iw7&amp;id=6538#price">NA</a></td><td>237</td><td>NA</td><td>207</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Mobile/Embedded</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Virtual+%40+2.32GHz&amp;id=6505">Virtual @ 2.32GHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Virtual+%40+2.32GHz&amp;id=6505#price">NA</a></td><td>1,826</td><td>NA</td><td>751</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=Virtual+%40+2.95GHz&amp;id=6529">Virtual @ 2.95GHz</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=Virtual+%40+2.95GHz&amp;id=6529#price">NA</a></td><td>10,358</td><td>NA</td><td>2,339</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=ZHAOXIN+KaiXian+KX-6640A%402.6GHz&amp;id=6509">ZHAOXIN KaiXian KX-6640A@2.6GHz</a></td><td>1</td><td>4</td><td><a href="cpu.php?cpu=ZHAOXIN+KaiXian+KX-6640A%402.6GHz&amp;id=6509#price">NA</a></td><td>1,766</td><td>NA</td><td>729</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9275F&amp;id=6458">AMD EPYC 9275F</a></td><td>1</td><td>24</td><td><a href="cpu.php?cpu=AMD+EPYC+9275F&amp;id=6458#price">$3,439.00*</a></td><td>84,620</td><td>24.61</td><td>3,810</td><td>1.11</td><td>320</td><td>264.44</td><td class="sorting_1">Jan 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9355P&amp;id=6449">AMD EPYC 9355P</a></td><td>1</td><td>32</td><td><a href="cpu.php?cpu=AMD+EPYC+9355P&amp;id=6449#price">$2,998.00*</a></td><td>97,255</td><td>32.44</td><td>3,741</td><td>1.25</td><td>280</td><td>347.34</td><td class="sorting_1">Jan 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9375F&amp;id=6480">AMD EPYC 9375F</a></td><td>1</td><td>32</td><td><a href="cpu.php?cpu=AMD+EPYC+9375F&amp;id=6480#price">$5,306.00*</a></td><td>95,768</td><td>18.05</td><td>3,762</td><td>0.71</td><td>320</td><td>299.28</td><td class="sorting_1">Jan 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9455P&amp;id=6461">AMD EPYC 9455P</a></td><td>1</td><td>48</td><td><a href="cpu.php?cpu=AMD+EPYC+9455P&amp;id=6461#price">$4,819.00*</a></td><td>116,713</td><td>24.22</td><td>3,750</td><td>0.78</td><td>300</td><td>389.04</td><td class="sorting_1">Jan 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+EPYC+9555&amp;id=6455&amp;cpuCount=2">[Dual CPU] AMD EPYC 9555</a></td><td>2</td><td>64</td><td><a href="cpu.php?cpu=AMD+EPYC+9555&amp;id=6455#price">$19,652.00*</a></td><td>180,981</td><td>9.21</td><td>3,757</td><td>NA</td><td>360</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>SP5</td><td>Server</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+2600E&amp;id=6452">AMD Ryzen 5 2600E</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+2600E&amp;id=6452#price">NA</a></td><td>12,346</td><td>NA</td><td>2,297</td><td>NA</td><td>65</td><td>189.94</td><td class="sorting_1">Jan 2025</td><td>AM4</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+5+PRO+8640U&amp;id=6447">AMD Ryzen 5 PRO 8640U</a></td><td>1</td><td>6</td><td><a href="cpu.php?cpu=AMD+Ryzen+5+PRO+8640U&amp;id=6447#price">NA</a></td><td>23,509</td><td>NA</td><td>3,792</td><td>NA</td><td>28</td><td>839.61</td><td class="sorting_1">Jan 2025</td><td>FP7 FP7r2</td><td>Laptop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="cpu_lookup.php?cpu=AMD+Ryzen+7+PRO+5800H&amp;id=6440">AMD Ryzen 7 PRO 5800H</a></td><td>1</td><td>8</td><td><a href="cpu.php?cpu=AMD+Ryzen+7+PRO+5800H&amp;id=6440#price">NA</a></td><td>19,313</td><td>NA</td><td>3,136</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>AM4</td><td>Laptop</td></tr></tbody></table>
 """
 
-scraped_data = parse_html_table(html_content)
-write_csv(scraped_data, 'cpus.csv')
+# Pass the path of a saved PassMark page to parse it instead of the table above
+source = sys.argv[1] if len(sys.argv) > 1 else io.StringIO(html_content)
+scraped_data = parse_html_table(source)
+write_passmark_csv(scraped_data, 'cpus.csv')
 
-print("CSV file 'cpus.csv' has been created successfully.")
\ No newline at end of file
+print("CSV file 'cpus.csv' has been created successfully.")
@@ -1,7 +1,11 @@
-import itertools
+import sys
 import urllib.parse
 import os
 from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.pairs import PairSpace
 
 def load_cpu_list(cpu_list_file):
     """
@@ -25,53 +29,56 @@ def sanitize_cpu_name(cpu_name):
 def generate_combinations(cpu_names):
     """
     Generate all unique combinations of two CPUs, ordered alphabetically.
+    The pairs are produced lazily when iterated, any pair can be read by its index.
     """
-    sorted_cpus = sorted(cpu_names)
-    combinations = list(itertools.combinations(sorted_cpus, 2))
-    return combinations
+    return PairSpace(cpu_names)
 
 def create_sitemap(combinations, base_url, output_file):
     """
-    Create a sitemap XML file from the list of CPU combinations.
+    Create a sitemap XML file from the CPU combinations, each entry is written as it is built.
     """
     sitemap_header = '''<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
         xmlns:xhtml="http://www.w3.org/1999/xhtml">
 '''
     sitemap_footer = '</urlset>'
-    url_entries = []
+    url_count = 0
 
     languages = ['en', 'es', 'fr']  # Language variants
-
-    for cpu1, cpu2 in combinations:
-        cpu1_sanitized = sanitize_cpu_name(cpu1)
-        cpu2_sanitized = sanitize_cpu_name(cpu2)
+    lastmod_date = datetime.now().strftime("%Y-%m-%d")  # Set last modified date to today
+
+    # Written to a temporary file renamed over the sitemap once complete, so an
+    # interrupted run leaves the previous sitemap in place rather than half a new one
+    temp_file = f"{output_file}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as file:
+        file.write(sitemap_header)
+        for cpu1, cpu2 in combinations:
+            cpu1_sanitized = sanitize_cpu_name(cpu1)
+            cpu2_sanitized = sanitize_cpu_name(cpu2)
         
-        # Create the base URL for this combination
-        relative_url = f"{cpu1_sanitized}-vs-{cpu2_sanitized}"
+            # Create the base URL for this combination
+            relative_url = f"{cpu1_sanitized}-vs-{cpu2_sanitized}"
         
-        # Collecting alternate URLs
-        alternate_links = []
-        for lang in languages:
-            full_url = f"{base_url}/{lang}/cpu/compare/{relative_url}"
-            alternate_links.append(f'<xhtml:link rel="alternate" hreflang="{lang}" href="{full_url}" />')
-
-        # Construct the XML entry for the current URL
-        lastmod_date = datetime.now().strftime("%Y-%m-%d")  # Set last modified date to today
-        url_entry = f"""  <url>
+            # Collecting alternate URLs
+            alternate_links = []
+            for lang in languages:
+                full_url = f"{base_url}/{lang}/cpu/compare/{relative_url}"
+                alternate_links.append(f'<xhtml:link rel="alternate" hreflang="{lang}" href="{full_url}" />')
+
+            # Construct the XML entry for the current URL
+            url_entry = f"""  <url>
     <loc>{base_url}/{languages[0]}/cpu/compare/{relative_url}</loc>
     {"\n    ".join(alternate_links)}
     <lastmod>{lastmod_date}</lastmod>
     <priority>1.0</priority>
   </url>"""
         
-        url_entries.append(url_entry)
-
-    sitemap_content = sitemap_header + "\n".join(url_entries) + "\n" + sitemap_footer
+            file.write(("\n" if url_count else "") + url_entry)
+            url_count += 1
 
-    with open(output_file, 'w', encoding='utf-8') as file:
-        file.write(sitemap_content)
-    print(f"Sitemap successfully created with {len(url_entries)} URLs at '{output_file}'.")
+        file.write("\n" + sitemap_footer)
+    os.replace(temp_file, output_file)
+    print(f"Sitemap successfully created with {url_count} URLs at '{output_file}'.")
 
 def main():
     # Configuration
@@ -0,0 +1,6 @@
+"""Helpers shared by the CPU, GPU, phone and sitemap scripts.
+
+Scripts living in the sibling ``Scrapping*`` folders add the repository root
+to ``sys.path`` before importing from this package; tools inside it are run
+from the repository root with ``python -m ScrappingCommon.<module>``.
+"""
@@ -0,0 +1,85 @@
+"""Amazon links of the CPU and GPU entries, set from a link list CSV.
+
+The list (cpu_list.csv, gpu_list.csv) pairs a name with its affiliate link.
+Names are matched on their normalised form, as the list says
+"Intel Core i9 13900K" where Strapi has the PassMark "Intel Core i9-13900K".
+The entries come from the local cache of the collection, and only those
+whose ``amazonLink`` is missing or different get a PUT. The PUT carries the
+listed attributes with the new link, no entry is read again, and the PUTs go
+out concurrently through one ``StrapiClient``.
+"""
+import asyncio
+
+import pandas as pd
+import requests
+
+from .naming import normalise_name
+from .strapi_cache import cached_collection
+from .strapi_client import StrapiClient
+
+
+def load_amazon_links(csv_path, name_field):
+    """``{normalised name: link}`` of a link list, rows without a name or a link are left out."""
+    links = pd.read_csv(csv_path).dropna(subset=[name_field, 'amazon_link'])
+    return {normalise_name(name): link for name, link in zip(links[name_field], links['amazon_link'])}
+
+
+def nan_to_none(obj):
+    """NaN values of the listed attributes become None, JSON has no NaN."""
+    if isinstance(obj, float) and pd.isna(obj):
+        return None
+    elif isinstance(obj, dict):
+        return {k: nan_to_none(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [nan_to_none(v) for v in obj]
+    return obj
+
+
+def plan_amazon_link_updates(entries, links, attribute, name_field, label):
+    """``(id, attributes, link)`` of the entries whose amazonLink is missing or different."""
+    updates = []
+    unchanged = unmatched = 0
+    for entry in entries:
+        data = (entry.get('attributes') or {}).get(attribute) or {}
+        amazon_link = links.get(normalise_name(data.get(name_field)))
+        if not amazon_link:
+            unmatched += 1
+        elif data.get('amazonLink') == amazon_link:
+            unchanged += 1
+        else:
+            updates.append((entry['id'], data, amazon_link))
+    print(f"{len(updates)} {label}s to update, {unchanged} already have their Amazon link, {unmatched} without a link")
+    return updates
+
+
+async def send_amazon_link_updates(base_url, collection, attribute, updates, concurrency=8, label=None):
+    """PUT the planned links, every other listed attribute kept as it is."""
+    label = label or attribute
+
+    async def update_one(client, entry_id, data, amazon_link):
+        payload = nan_to_none({"data": {attribute: dict(data, amazonLink=amazon_link)}})
+        status, body = await client.put(f"{collection}/{entry_id}", payload, label=f"{label} {entry_id}")
+        if status == 200:
+            print(f"Successfully updated {label} {entry_id} with Amazon link")
+        else:
+            print(f"Failed to update {label} {entry_id} (status {status}): {str(body)[:200]}")
+
+    async with StrapiClient(base_url, concurrency=concurrency) as client:
+        await asyncio.gather(*(update_one(client, *update) for update in updates))
+    client.print_summary(f'Amazon links of {label}s')
+
+
+def update_amazon_links(base_url, collection, attribute, name_field, csv_path, concurrency=8, label=None):
+    """Set the links of ``csv_path`` on the entries of ``collection``, return the number of updates sent."""
+    label = label or attribute
+    links = load_amazon_links(csv_path, name_field)
+    try:
+        entries = cached_collection(base_url, collection)
+    except requests.RequestException as e:
+        print(f"Stopped, a Strapi request failed: {e}")
+        return 0
+
+    updates = plan_amazon_link_updates(entries, links, attribute, name_field, label)
+    if updates:
+        asyncio.run(send_amazon_link_updates(base_url, collection, attribute, updates, concurrency, label))
+    return len(updates)
@@ -0,0 +1,92 @@
+"""
+Compare the BeautifulSoup parse of a saved PassMark table with the streaming reader.
+
+Run from the repository root:
+    python -m ScrappingCommon.bench_passmark_table [page.html ...] [--scale N]
+
+``--scale`` replicates the body rows N times into a temporary file to mimic
+the full PassMark exports, which are several times larger than the saved pages.
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from .passmark_table import iter_table_rows
+
+DEFAULT_PAGES = ['ScrappingCPU/tablefrompassmark.html']
+
+
+def bs4_rows(path, table_id='cputable'):
+    """The path used by scrape-cpus.py / scrape-gpus.py before the streaming reader."""
+    from bs4 import BeautifulSoup
+
+    with open(path, 'r', encoding='utf-8') as file:
+        soup = BeautifulSoup(file.read(), 'html.parser')
+    table = soup.find('table', id=table_id)
+    for row in table.find_all('tr')[1:]:
+        yield [col.text for col in row.find_all('td')]
+
+
+def streaming_rows(path, table_id='cputable'):
+    return iter_table_rows(path, table_id=table_id)
+
+
+def measure(rows_func, path):
+    """Return (rows, seconds to first row, total seconds, peak MiB) for one parse."""
+    start = time.perf_counter()
+    first_row = None
+    count = 0
+    for _ in rows_func(path):
+        if first_row is None:
+            first_row = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+
+    # Second pass for memory, tracemalloc slows the parse down too much to time it
+    tracemalloc.start()
+    for _ in rows_func(path):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, first_row or total, total, peak / (1024 * 1024)
+
+
+def scaled_copy(path, factor):
+    """Write a copy of ``path`` whose <tbody> is repeated ``factor`` times."""
+    with open(path, 'r', encoding='utf-8') as file:
+        html = file.read()
+    start = html.index('<tbody>') + len('<tbody>')
+    end = html.index('</tbody>')
+    fd, scaled_path = tempfile.mkstemp(suffix='.html')
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        file.write(html[:start])
+        for _ in range(factor):
+            file.write(html[start:end])
+        file.write(html[end:])
+    return scaled_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pages', nargs='*', default=DEFAULT_PAGES)
+    parser.add_argument('--scale', type=int, default=1, help='replicate the table rows N times')
+    args = parser.parse_args()
+
+    for page in args.pages:
+        path = scaled_copy(page, args.scale) if args.scale > 1 else page
+        try:
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"{page} (x{args.scale}, {size_mb:.1f} MiB)")
+            for name, rows_func in (('beautifulsoup', bs4_rows), ('streaming', streaming_rows)):
+                count, first_row, total, peak = measure(rows_func, path)
+                print(f"  {name:<14} {count:>6} rows  first row {first_row * 1000:8.1f} ms  "
+                      f"total {total * 1000:8.1f} ms  peak {peak:7.1f} MiB")
+        finally:
+            if path != page:
+                os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
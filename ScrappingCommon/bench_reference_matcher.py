@@ -0,0 +1,88 @@
+"""
+Compare the SequenceMatcher loop of generate_sitemap.py with ReferenceMatcher.
+
+Run from the repository root:
+    python -m ScrappingCommon.bench_reference_matcher [--scale N]
+
+The names of the full PassMark lists, the 3.1k CPUs of ScrappingCPU/cpus.csv
+and the 2.7k GPUs of ScrappingGPU/graphics_cards.csv, formatted as
+transform_cpus / transform_gpus format them, are checked against the
+script's REFERENCE_CPUS (threshold 0.8) and REFERENCE_GPUS (0.65).
+``--scale`` adds N - 1 altered copies of every name (a suffix, the hyphens
+turned back into spaces...) to mimic a larger catalogue. Both methods must
+keep the same names; the matcher time includes building its index.
+"""
+import argparse
+import importlib.util
+from difflib import SequenceMatcher
+from pathlib import Path
+import re
+import time
+
+import pandas as pd
+
+from .reference_matcher import ReferenceMatcher
+
+ROOT = Path(__file__).resolve().parent.parent
+CATALOGUES = [
+    ('CPU', 'ScrappingCPU/cpus.csv', 'cpu_name', 'REFERENCE_CPUS', 0.8),
+    ('GPU', 'ScrappingGPU/graphics_cards.csv', 'videocard_name', 'REFERENCE_GPUS', 0.65),
+]
+VARIANTS = [
+    lambda name, n: f"{name}-v{n}",
+    lambda name, n: name.replace('-', ' ') + f" {n}",
+    lambda name, n: f"{name[:len(name) // 2]}-{n}-{name[len(name) // 2:]}",
+]
+
+
+def load_generate_sitemap():
+    path = ROOT / 'python_sitemap' / 'generate_sitemap.py'
+    spec = importlib.util.spec_from_file_location('generate_sitemap', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def is_similar(item, reference_list, threshold):
+    """The check generate_sitemap.py ran for every name before ReferenceMatcher."""
+    for ref in reference_list:
+        if SequenceMatcher(None, item, ref).ratio() >= threshold:
+            return True
+    return False
+
+
+def catalogue_names(csv_file, column, scale):
+    names = [re.sub(r'\s+', '-', name.strip()) for name in pd.read_csv(ROOT / csv_file)[column].dropna()]
+    scaled = list(names)
+    for n in range(1, scale):
+        scaled += [VARIANTS[n % len(VARIANTS)](name, n) for name in names]
+    return scaled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1, help='altered copies of every name, to grow the catalogue')
+    args = parser.parse_args()
+
+    generate_sitemap = load_generate_sitemap()
+    for label, csv_file, column, references_name, threshold in CATALOGUES:
+        references = getattr(generate_sitemap, references_name)
+        names = catalogue_names(csv_file, column, args.scale)
+
+        start = time.perf_counter()
+        baseline = [is_similar(name, references, threshold) for name in names]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = ReferenceMatcher(references, threshold)
+        indexed = [matcher.matches(name) for name in names]
+        matcher_time = time.perf_counter() - start
+
+        print(f"{label}: {len(names)} names x {len(references)} references, threshold {threshold}, "
+              f"{sum(indexed)} kept, same result: {baseline == indexed}")
+        print(f"  SequenceMatcher loop {loop_time:8.3f} s")
+        print(f"  ReferenceMatcher     {matcher_time:8.3f} s  ({loop_time / matcher_time:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
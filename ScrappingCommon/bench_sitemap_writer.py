@@ -0,0 +1,162 @@
+"""
+Compare the ElementTree sitemap generation with the streaming writer.
+
+Run from the repository root:
+    python -m ScrappingCommon.bench_sitemap_writer [--items 5000] [--max-urls 1000000] [--languages en]
+                                                   [--workers 1 8] [--levels 1 6 9]
+
+A synthetic catalogue of ``--items`` names is paired like the comparison
+pages of python_sitemap/generate_sitemap.py (5,000 items make 12.5 million
+pairs per language, ``--max-urls`` caps the pairs written so the ElementTree
+run fits in memory). Each method runs in its own process and reports its
+wall time, peak memory (max RSS of the process and of its own workers),
+files and bytes written.
+
+- ``etree``: the former generation, the combinations materialised in a list,
+  one ElementTree per shard and ``datetime.now()`` for every URL;
+- ``stream``: generate_sitemap.py as it is, pairs produced lazily by
+  ``PairSpace`` and records streamed to the shards by ``ShardedSitemapWriter``;
+- ``jobs``: the shards of every language written by ``run_pair_shard_jobs``
+  on a pool of ``--workers`` processes, once for each count given;
+- ``gzip``: ``stream`` with the shards gzipped as they are written, once for
+  each compression level of ``--levels``; the size is that of the .xml.gz
+  files, to set against the plain XML of ``stream``.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import itertools
+import os
+import resource
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+from .pairs import PairSpace
+from .sitemap_jobs import pair_shard_jobs, run_pair_shard_jobs
+from .sitemap_writer import url_record, write_sitemap_shards
+
+BASE_URL = 'https://siliconcompare.com'
+MAX_URLS_PER_FILE = 45000  # as in generate_sitemap.py
+METHODS = ('etree', 'stream', 'jobs', 'gzip')
+BRANDS = ('Apple', 'Samsung', 'Xiaomi', 'Google', 'OnePlus', 'Oppo', 'Motorola', 'Sony')
+
+
+def synthetic_catalogue(count):
+    return [f"{BRANDS[i % len(BRANDS)]}-Model-{i:05d}-Pro" for i in range(count)]
+
+
+def combinations(items):
+    for i, item1 in enumerate(items):
+        for item2 in items[i+1:]:
+            first, second = sorted([item1, item2])
+            yield f"{first}-vs-{second}"
+
+
+def write_etree(output_dir, items, languages, max_urls):
+    """The generation before the streaming writer, kept here as the baseline."""
+    pairs = list(itertools.islice(combinations(items), max_urls))
+    files = []
+    for lang in languages:
+        urlcount = 0
+        sitemapindex = 1
+        for combination in pairs:
+            if urlcount == 0:
+                filename = f"bench-sitemap-{lang}-{sitemapindex}.xml"
+                sitemap = ET.Element('urlset', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+                files.append(filename)
+            url_elem = ET.SubElement(sitemap, 'url')
+            ET.SubElement(url_elem, 'loc').text = f"{BASE_URL}/{lang}/phone/compare/{combination}"
+            ET.SubElement(url_elem, 'lastmod').text = datetime.now().strftime('%Y-%m-%d')
+            ET.SubElement(url_elem, 'priority').text = '0.5'
+            urlcount += 1
+            if urlcount >= MAX_URLS_PER_FILE:
+                ET.ElementTree(sitemap).write(os.path.join(output_dir, filename), encoding='utf-8',
+                                              xml_declaration=True)
+                urlcount = 0
+                sitemapindex += 1
+        if urlcount > 0:
+            ET.ElementTree(sitemap).write(os.path.join(output_dir, filename), encoding='utf-8',
+                                          xml_declaration=True)
+    return files
+
+
+def write_stream(output_dir, items, languages, max_urls, compresslevel=None):
+    lastmod = datetime.now().strftime('%Y-%m-%d')
+    pairs = PairSpace(items)
+    files = []
+    for lang in languages:
+        records = (url_record(f"{BASE_URL}/{lang}/phone/compare/{first}-vs-{second}", lastmod, '0.5')
+                   for first, second in pairs.iter_range(0, max_urls))
+        files += write_sitemap_shards(output_dir, f"bench-sitemap-{lang}-{{index}}.xml", records,
+                                      max_urls=MAX_URLS_PER_FILE, compresslevel=compresslevel)
+    return files
+
+
+def write_jobs(output_dir, items, languages, max_urls, workers):
+    lastmod = datetime.now().strftime('%Y-%m-%d')
+    # Only the first max_urls pairs, as the other methods
+    kept = PairSpace(items)
+    jobs = []
+    for lang in languages:
+        jobs += [job._replace(stop=min(job.stop, max_urls))
+                 for job in pair_shard_jobs('bench', kept.items, f"{BASE_URL}/{lang}/phone/compare/",
+                                            f"bench-sitemap-{lang}", MAX_URLS_PER_FILE)
+                 if job.start < max_urls]
+    results = run_pair_shard_jobs(jobs, {'bench': kept.items}, output_dir, lastmod, workers, MAX_URLS_PER_FILE)
+    return [name for files in results for name in files]
+
+
+def run_method(method, items, languages, max_urls, option=None):
+    """
+    Runs in a fresh worker process, so the max RSS is this method's alone.
+    ``option`` is the worker count of ``jobs`` and the compression level of ``gzip``.
+    """
+    with tempfile.TemporaryDirectory(prefix='sitemap_bench_') as output_dir:
+        start = time.perf_counter()
+        if method == 'jobs':
+            files = write_jobs(output_dir, items, languages, max_urls, option)
+        elif method == 'gzip':
+            files = write_stream(output_dir, items, languages, max_urls, option)
+        else:
+            files = {'etree': write_etree, 'stream': write_stream}[method](output_dir, items, languages, max_urls)
+        wall = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(output_dir, name)) for name in files)
+    peak_kib = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return wall, peak_kib, len(files), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=5000, help='size of the synthetic catalogue')
+    parser.add_argument('--max-urls', type=int, default=1_000_000, help='pairs written per language')
+    parser.add_argument('--languages', nargs='*', default=['en'])
+    parser.add_argument('--methods', nargs='*', choices=METHODS, default=list(METHODS))
+    parser.add_argument('--workers', nargs='*', type=int, default=sorted({1, os.cpu_count()}),
+                        help='jobs: worker process counts to run with')
+    parser.add_argument('--levels', nargs='*', type=int, default=[1, 6, 9], help='gzip: compression levels to run with')
+    args = parser.parse_args()
+
+    items = synthetic_catalogue(args.items)
+    pairs = min(args.max_urls, args.items * (args.items - 1) // 2)
+    print(f"{args.items} items, {pairs} URLs per language, languages {', '.join(args.languages)}")
+    runs = []  # (label, method, option)
+    for method in args.methods:
+        if method == 'jobs':
+            runs += [(f"jobs x{workers}", method, workers) for workers in args.workers]
+        elif method == 'gzip':
+            runs += [(f"gzip -{level}", method, level) for level in args.levels]
+        else:
+            runs.append((method, method, None))
+    for label, method, option in runs:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            wall, peak_kib, files, size = pool.submit(run_method, method, items, args.languages, args.max_urls,
+                                                      option).result()
+        urls = pairs * len(args.languages)
+        print(f"  {label:<8} wall {wall:7.2f} s  {urls / wall:10.0f} URL/s  peak RSS {peak_kib / 1024:7.1f} MiB  "
+              f"{files:>4} files  {size / 1024 / 1024:8.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
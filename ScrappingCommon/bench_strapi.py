@@ -0,0 +1,194 @@
+"""
+Drive the Strapi scripts against the in-memory stand-in and time them.
+
+Run from the repository root:
+    python -m ScrappingCommon.bench_strapi [--latency-ms 20] [--jitter-ms 10] [--error-rate 0.02]
+
+Each scenario calls the functions of the real scripts (cputostrapy,
+gputostrapy, phones_to_strapi, the amazon link updater, the duplicate
+remover, the sitemap fetch) with their API URL pointed at a ``MockStrapi``
+on ``--port``. It reports the requests the server answered, requests per
+second, the p50/p95 server-side latency and the wall time. The scripts'
+own output is hidden unless ``--verbose`` is given.
+
+The amazon-links scenario first seeds the names of cpu_list.csv and
+gpu_list.csv, two thirds of them with a missing or stale link, so its PUTs
+are measured. The writes a scenario is there to measure are always listed,
+so a run that sent none shows ``PUT 0``.
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+from pathlib import Path
+import tempfile
+import time
+
+import pandas as pd
+
+from .mock_strapi import MockStrapi
+
+ROOT = Path(__file__).resolve().parent.parent
+SCENARIOS = ('upload', 'sync', 'amazon-links', 'dedup', 'sitemap-fetch')
+# Requests a scenario is there to measure, reported even when none was sent
+SCENARIO_METHODS = {'upload': ('POST',), 'amazon-links': ('PUT',), 'dedup': ('DELETE',)}
+# Link lists of the amazon-links scenario: (CSV, collection, attribute, name field)
+LINK_LISTS = [
+    ('ScrappingCPU/cpu_list.csv', 'cpus', 'CPU', 'cpu_name'),
+    ('ScrappingGPU/gpu_list.csv', 'gpus', 'GPU', 'videocard_name'),
+]
+
+
+def load_script(relative_path):
+    """Import one of the scripts as a module, from its own folder as the scripts expect."""
+    path = ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    with working_directory(path.parent):
+        spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_scenario(mock, name, func, verbose=False, methods=()):
+    """Run one scenario and print its figures; ``methods`` are always listed, a count of 0 included."""
+    mock.reset_stats()
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    start = time.perf_counter()
+    with output:
+        func()
+    wall = time.perf_counter() - start
+
+    stats = mock.stats
+    requests = sum(stats['requests'].values())
+    counts = dict.fromkeys(methods, 0)
+    counts.update(stats['requests'])
+    methods = ' '.join(f"{method} {count}" for method, count in sorted(counts.items()))
+    errors = sum(count for status, count in stats['statuses'].items() if status >= 400)
+    print(f"  {name:<24} {requests:>6} req  {requests / wall if wall else 0:8.1f} req/s  "
+          f"p50 {percentile(stats['latencies'], 0.5) * 1000:7.1f} ms  "
+          f"p95 {percentile(stats['latencies'], 0.95) * 1000:7.1f} ms  "
+          f"wall {wall:7.2f} s  errors {errors:>4}  ({methods})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=18337)
+    parser.add_argument('--latency-ms', type=float, default=0, help='delay the mock adds to every answer')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='random extra delay, up to this much')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with a 503')
+    parser.add_argument('--max-inflight', type=int, help='mock answers 429 beyond this many concurrent requests')
+    parser.add_argument('--scenarios', nargs='*', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--duplicates', type=int, default=200, help='dedup: duplicated CPUs seeded before the run')
+    parser.add_argument('--verbose', action='store_true', help="show the scripts' own output")
+    args = parser.parse_args()
+
+    # The scripts read and write the collection cache, keep the benchmark's apart
+    cache_dir = tempfile.TemporaryDirectory(prefix='strapi_bench_cache_')
+    os.environ['STRAPI_CACHE_DIR'] = cache_dir.name
+
+    mock = MockStrapi(port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                      error_rate=args.error_rate, max_inflight=args.max_inflight, seed=0)
+    base_url = mock.start()
+    print(f"Mock Strapi on {base_url}: latency {args.latency_ms} ms (+{args.jitter_ms} ms jitter), "
+          f"error rate {args.error_rate}, max in flight {args.max_inflight}")
+
+    cputostrapy = load_script('ScrappingCPU/cputostrapy.py')
+    gputostrapy = load_script('ScrappingGPU/gputostrapy.py')
+    phones_to_strapi = load_script('ScrappingPhones/phones_to_strapi.py')
+    for module in (cputostrapy, gputostrapy):
+        module.API_BASE_URL = base_url
+    cpus = cputostrapy.transform_data(pd.read_csv(ROOT / 'cpus_07_2025.csv'))
+    gpus = gputostrapy.transform_data(pd.read_csv(ROOT / 'graphics_cards_07_2025.csv'))
+    phones_folder = ROOT / 'ScrappingPhones' / 'resultsWeb'
+
+    def upload():
+        cputostrapy.post_to_strapi(cpus)
+        gputostrapy.post_to_strapi(gpus)
+        phones_to_strapi.upload_to_strapi(str(phones_folder), base_url)
+
+    def sync():
+        cputostrapy.sync_to_strapi(cpus)
+        gputostrapy.sync_to_strapi(gpus)
+        phones_to_strapi.sync_to_strapi(str(phones_folder), base_url)
+
+    def seed_amazon_entries():
+        """
+        The names of cpu_list.csv / gpu_list.csv, hyphenated as PassMark writes them: a third
+        already has its link, a third a stale one and a third none, so two thirds need a PUT.
+        """
+        for csv_file, collection, attribute, name_field in LINK_LISTS:
+            links = pd.read_csv(ROOT / csv_file).dropna(subset=[name_field, 'amazon_link'])
+            records = []
+            for index, (name, link) in enumerate(zip(links[name_field], links['amazon_link'])):
+                record = {name_field: name.rsplit(' ', 1)[0] + '-' + name.rsplit(' ', 1)[-1]}
+                if index % 3 == 0:
+                    record['amazonLink'] = link
+                elif index % 3 == 1:
+                    record['amazonLink'] = 'https://amzn.to/stale'
+                records.append(record)
+            mock.seed(collection, records, attribute)
+
+    def amazon_links():
+        for relative_path in ('ScrappingCPU/amazonLinkToStrapi.py', 'ScrappingGPU/amazonLinkToStrapi.py'):
+            module = load_script(relative_path)
+            module.API_BASE_URL = base_url
+            name = 'update_all_cpus_with_amazon_links' if 'CPU' in relative_path else 'update_all_gpus_with_amazon_links'
+            getattr(module, name)()
+
+    def dedup():
+        remove_cpu_duplicate = load_script('ScrappingCPU/remove_cpu_duplicate.py')
+        remove_cpu_duplicate.API_BASE_URL = base_url
+        remove_cpu_duplicate.CPUS_ENDPOINT = f'{base_url}/cpus'
+        # Same names with the PassMark hyphen dropped, as a second import would create them
+        mock.seed('cpus', [dict(cpu, cpu_name=cpu['cpu_name'].replace('-', ' ')) for cpu in cpus[:args.duplicates]],
+                  'CPU')
+        plan_path = Path(cache_dir.name) / 'deletion_plan.json'
+        remove_cpu_duplicate.write_plan(remove_cpu_duplicate.get_all_cpus(), plan_path)
+        remove_cpu_duplicate.apply_plan_file(plan_path)
+
+    def sitemap_fetch(full):
+        generate_sitemap = load_script('python_sitemap/generate_sitemap.py')
+        for collection in generate_sitemap.COLLECTIONS.values():
+            generate_sitemap.cached_collection(base_url, collection, full=full)
+
+    scenarios = {
+        'upload': upload,
+        'sync': sync,
+        'amazon-links': amazon_links,
+        'dedup': dedup,
+        'sitemap-fetch': lambda: sitemap_fetch(full=True),
+    }
+    try:
+        for name in args.scenarios:
+            if name == 'amazon-links':
+                seed_amazon_entries()
+            run_scenario(mock, name, scenarios[name], args.verbose, SCENARIO_METHODS.get(name, ()))
+            if name == 'sitemap-fetch':
+                # Second fetch, an incremental refresh of the collection cache
+                run_scenario(mock, 'sitemap-fetch (cached)', lambda: sitemap_fetch(full=False), args.verbose)
+    finally:
+        mock.stop()
+        cache_dir.cleanup()
+    print("Collections at the end: " + ', '.join(f"{name} {len(entries)}" for name, entries in mock.data.items()))
+
+
+if __name__ == '__main__':
+    main()
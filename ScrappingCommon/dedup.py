@@ -0,0 +1,120 @@
+"""Duplicate detection on normalised names, at upload time and after the fact.
+
+Two records are duplicates when ``normalise_name`` gives the same key for
+their name field ('Intel Core i5-12400' and 'intel core i5 12400').
+
+- ``drop_duplicates`` filters a batch before it is uploaded, against the
+  keys already in the collection and the earlier records of the batch.
+  This is also how an interrupted upload resumes: the cache refresh behind
+  ``existing_keys`` picks up the entries the interrupted run created, so a
+  rerun only sends the records left.
+- ``build_deletion_plan`` groups the duplicated entries of a collection and
+  chooses the one to keep. The plan is written to a JSON file that can be
+  reviewed, then ``apply_deletion_plan`` sends its DELETEs concurrently.
+"""
+import asyncio
+from datetime import datetime, timezone
+import json
+
+from .naming import normalise_name
+from .strapi_cache import cached_collection, forget_entries
+from .strapi_client import SUCCESS_STATUSES, StrapiClient
+
+
+def entry_key(entry, attribute, key_field):
+    """Normalised key of a Strapi entry, None when it has no name."""
+    data = (entry.get('attributes') or {}).get(attribute) or {}
+    return normalise_name(data.get(key_field))
+
+
+def existing_keys(base_url, collection, attribute, key_field):
+    """Keys of the entries already in a collection, read through the local cache."""
+    keys = {entry_key(entry, attribute, key_field) for entry in cached_collection(base_url, collection)}
+    keys.discard(None)
+    return keys
+
+
+def drop_duplicates(items, key, known_keys=()):
+    """
+    Keep the items whose ``key(item)`` is neither in ``known_keys`` nor the
+    key of an earlier item. Items without a key are kept. Returns
+    ``(kept, skipped)``, ``skipped`` being a list of ``(item, reason)``.
+    """
+    seen = set(known_keys)
+    kept, skipped = [], []
+    for item in items:
+        item_key = key(item)
+        if item_key is None:
+            kept.append(item)
+        elif item_key in known_keys:
+            skipped.append((item, 'already in Strapi'))
+        elif item_key in seen:
+            skipped.append((item, 'repeated in the batch'))
+        else:
+            seen.add(item_key)
+            kept.append(item)
+    return kept, skipped
+
+
+def group_duplicates(entries, attribute, key_field):
+    """``{key: entries}`` for the keys held by more than one entry, oldest entry first."""
+    groups = {}
+    for entry in entries:
+        key = entry_key(entry, attribute, key_field)
+        if key is not None:
+            groups.setdefault(key, []).append(entry)
+    return {key: sorted(group, key=lambda entry: ((entry.get('attributes') or {}).get('createdAt') or '', entry['id']))
+            for key, group in groups.items() if len(group) > 1}
+
+
+def build_deletion_plan(base_url, collection, entries, attribute, key_field, keep='oldest'):
+    """Plan removing every duplicate but the oldest (or newest) entry of each group."""
+    groups = []
+    for key, group in group_duplicates(entries, attribute, key_field).items():
+        if keep == 'newest':
+            group = group[::-1]
+        groups.append({
+            'key': key,
+            'name': ((group[0].get('attributes') or {}).get(attribute) or {}).get(key_field),
+            'keep': group[0]['id'],
+            'delete': [entry['id'] for entry in group[1:]],
+        })
+    return {
+        'base_url': base_url,
+        'collection': collection,
+        'keep': keep,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'groups': groups,
+    }
+
+
+def write_deletion_plan(plan, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, ensure_ascii=False, indent=2)
+
+
+def load_deletion_plan(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+async def _delete_all(plan, concurrency):
+    collection = plan['collection']
+    deleted = []
+    async with StrapiClient(plan['base_url'], concurrency=concurrency) as client:
+        async def delete_one(entry_id, name):
+            status, _ = await client.delete(f'{collection}/{entry_id}', label=f'{name} ({entry_id})')
+            if status in SUCCESS_STATUSES:
+                deleted.append(entry_id)
+
+        await asyncio.gather(*(delete_one(entry_id, group['name'])
+                               for group in plan['groups'] for entry_id in group['delete']))
+    client.print_summary(f"Duplicates of {collection}")
+    return deleted
+
+
+def apply_deletion_plan(plan, concurrency=8):
+    """Send the DELETEs of a plan concurrently, return the ids actually deleted."""
+    deleted = asyncio.run(_delete_all(plan, concurrency))
+    forget_entries(plan['base_url'], plan['collection'], deleted)
+    return deleted
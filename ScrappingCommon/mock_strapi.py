@@ -0,0 +1,254 @@
+"""
+In-memory stand-in for the part of the Strapi v4 REST API the scripts use.
+
+Run from the repository root:
+    python -m ScrappingCommon.mock_strapi [--port 1337] [--latency-ms 20] [--error-rate 0.05]
+
+Serves ``/api/<collection>`` for cpus, gpus and phones:
+
+- ``GET`` lists with ``pagination[page]`` / ``pagination[pageSize]``,
+  ``fields[n]`` projection and the ``filters[updatedAt][$gte]`` /
+  ``filters[id][$in][n]`` filters, and answers ``meta.pagination``;
+- ``GET /<id>``, ``POST``, ``PUT /<id>`` and ``DELETE /<id>`` act on one entry.
+
+Entries get ``createdAt`` / ``updatedAt`` like Strapi. Every answer can be
+delayed (``latency_ms`` plus up to ``jitter_ms``), replaced by a 503 with
+probability ``error_rate``, or by a 429 when more than ``max_inflight``
+requests are being served. ``GET /_stats`` returns the request counts and
+latencies, ``POST /_reset`` clears them.
+
+``MockStrapi(...).start()`` runs the server in a background thread and
+returns its base URL, for benchmarks (see ``bench_strapi.py``).
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import itertools
+import math
+import random
+import threading
+import time
+
+from aiohttp import web
+
+COLLECTIONS = ('cpus', 'gpus', 'phones')
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 10000  # rest.maxLimit of backend/config/api.js
+
+
+class MockStrapi:
+    def __init__(self, host='127.0.0.1', port=1337, collections=COLLECTIONS, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, max_inflight=None, seed=None):
+        self.host = host
+        self.port = port
+        self.collections = collections
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.max_inflight = max_inflight
+        self.random = random.Random(seed)
+
+        self.data = {collection: {} for collection in collections}
+        self._ids = itertools.count(1)
+        self._clock = datetime.now(timezone.utc)
+        self._inflight = 0
+        self._loop = None
+        self._runner = None
+        self.reset_stats()
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}/api"
+
+    # Data
+
+    def _timestamp(self):
+        # Strictly increasing, so updatedAt filters behave even within one millisecond
+        self._clock = max(self._clock + timedelta(milliseconds=1), datetime.now(timezone.utc))
+        return self._clock.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+    def create(self, collection, attributes):
+        entry_id = next(self._ids)
+        now = self._timestamp()
+        self.data[collection][entry_id] = dict(attributes, createdAt=now, updatedAt=now, publishedAt=now)
+        return entry_id
+
+    def seed(self, collection, records, attribute):
+        """Insert records directly, without going through HTTP; returns their ids."""
+        return [self.create(collection, {attribute: record}) for record in records]
+
+    def entry(self, collection, entry_id, fields=None):
+        attributes = self.data[collection][entry_id]
+        if fields:
+            attributes = {field: attributes.get(field) for field in fields}
+        return {'id': entry_id, 'attributes': attributes}
+
+    # Stats
+
+    def reset_stats(self):
+        self.stats = {'requests': {}, 'statuses': {}, 'latencies': []}
+
+    def _record(self, method, status, latency):
+        self.stats['requests'][method] = self.stats['requests'].get(method, 0) + 1
+        self.stats['statuses'][status] = self.stats['statuses'].get(status, 0) + 1
+        self.stats['latencies'].append(latency)
+
+    # HTTP
+
+    @web.middleware
+    async def _faults(self, request, handler):
+        if request.path.startswith('/_'):
+            return await handler(request)
+        start = time.perf_counter()
+        self._inflight += 1
+        try:
+            if self.max_inflight is not None and self._inflight > self.max_inflight:
+                response = web.json_response({'error': {'status': 429, 'message': 'Too Many Requests'}},
+                                             status=429, headers={'Retry-After': '1'})
+            else:
+                delay = self.latency_ms + self.random.uniform(0, self.jitter_ms)
+                if delay:
+                    await asyncio.sleep(delay / 1000)
+                if self.random.random() < self.error_rate:
+                    response = web.json_response({'error': {'status': 503, 'message': 'Injected error'}}, status=503)
+                else:
+                    response = await handler(request)
+        finally:
+            self._inflight -= 1
+        self._record(request.method, response.status, time.perf_counter() - start)
+        return response
+
+    def _target(self, request):
+        """(collection, entry id) of a request, None for the parts that do not exist."""
+        collection = request.match_info['collection']
+        if collection not in self.data:
+            return None, None
+        entry_id = request.match_info.get('id', '')
+        if not entry_id.isdigit() or int(entry_id) not in self.data[collection]:
+            return collection, None
+        return collection, int(entry_id)
+
+    @staticmethod
+    def _not_found():
+        return web.json_response({'data': None, 'error': {'status': 404, 'message': 'Not Found'}}, status=404)
+
+    async def _list(self, request):
+        collection, _ = self._target(request)
+        if collection is None:
+            return self._not_found()
+        query = request.query
+        page = max(1, int(query.get('pagination[page]', 1)))
+        page_size = min(MAX_PAGE_SIZE, max(1, int(query.get('pagination[pageSize]', DEFAULT_PAGE_SIZE))))
+        fields = [value for key, value in query.items() if key.startswith('fields[')]
+
+        ids = sorted(self.data[collection])
+        updated_after = query.get('filters[updatedAt][$gte]')
+        if updated_after is not None:
+            ids = [entry_id for entry_id in ids if self.data[collection][entry_id]['updatedAt'] >= updated_after]
+        wanted = {int(value) for key, value in query.items() if key.startswith('filters[id][$in]')}
+        if wanted:
+            ids = [entry_id for entry_id in ids if entry_id in wanted]
+
+        page_ids = ids[(page - 1) * page_size:page * page_size]
+        return web.json_response({
+            'data': [self.entry(collection, entry_id, fields) for entry_id in page_ids],
+            'meta': {'pagination': {'page': page, 'pageSize': page_size,
+                                    'pageCount': math.ceil(len(ids) / page_size), 'total': len(ids)}},
+        })
+
+    async def _get(self, request):
+        collection, entry_id = self._target(request)
+        if entry_id is None:
+            return self._not_found()
+        return web.json_response({'data': self.entry(collection, entry_id), 'meta': {}})
+
+    async def _create(self, request):
+        collection, _ = self._target(request)
+        if collection is None:
+            return self._not_found()
+        body = await request.json()
+        entry_id = self.create(collection, body.get('data') or {})
+        return web.json_response({'data': self.entry(collection, entry_id), 'meta': {}})
+
+    async def _update(self, request):
+        collection, entry_id = self._target(request)
+        if entry_id is None:
+            return self._not_found()
+        body = await request.json()
+        # Attributes sent replace the stored ones, the others are kept, like Strapi
+        self.data[collection][entry_id].update(body.get('data') or {}, updatedAt=self._timestamp())
+        return web.json_response({'data': self.entry(collection, entry_id), 'meta': {}})
+
+    async def _delete(self, request):
+        collection, entry_id = self._target(request)
+        if entry_id is None:
+            return self._not_found()
+        entry = self.entry(collection, entry_id)
+        del self.data[collection][entry_id]
+        return web.json_response({'data': entry, 'meta': {}})
+
+    async def _stats(self, request):
+        return web.json_response(self.stats)
+
+    async def _reset(self, request):
+        self.reset_stats()
+        return web.json_response({})
+
+    def app(self):
+        app = web.Application(middlewares=[self._faults], client_max_size=64 * 1024 * 1024)
+        app.router.add_get('/api/{collection}', self._list)
+        app.router.add_post('/api/{collection}', self._create)
+        app.router.add_get('/api/{collection}/{id}', self._get)
+        app.router.add_put('/api/{collection}/{id}', self._update)
+        app.router.add_delete('/api/{collection}/{id}', self._delete)
+        app.router.add_get('/_stats', self._stats)
+        app.router.add_post('/_reset', self._reset)
+        return app
+
+    # Running
+
+    async def _serve(self):
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    def start(self):
+        """Serve from a background thread, return the API base URL once it accepts connections."""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._serve())
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        threading.Thread(target=run, name='mock-strapi', daemon=True).start()
+        ready.wait()
+        return self.base_url
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def serve_forever(self):
+        web.run_app(self.app(), host=self.host, port=self.port, access_log=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the Strapi REST API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=1337)
+    parser.add_argument('--latency-ms', type=float, default=0, help='delay added to every answer')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='random extra delay, up to this much')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with a 503')
+    parser.add_argument('--max-inflight', type=int, help='answer 429 beyond this many concurrent requests')
+    args = parser.parse_args()
+
+    MockStrapi(args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+               error_rate=args.error_rate, max_inflight=args.max_inflight).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
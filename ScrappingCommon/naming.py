@@ -0,0 +1,18 @@
+"""Normalised product names used as matching keys between CSVs, JSON files and Strapi."""
+import re
+import unicodedata
+
+_SEPARATORS = re.compile(r'[^0-9a-z]+')
+
+
+def normalise_name(name):
+    """
+    Key for a CPU, GPU or phone name: case, accents, punctuation and spacing are ignored,
+    so 'Intel Core i5-12400' and 'intel core  i5 12400' give the same key.
+    Returns None for missing names.
+    """
+    if name is None or (isinstance(name, float) and name != name):
+        return None
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(char for char in name if not unicodedata.combining(char)).casefold()
+    return _SEPARATORS.sub(' ', name).strip() or None
@@ -0,0 +1,76 @@
+"""
+Index-addressable pairs of items, for the comparison sitemaps.
+
+``PairSpace(items)`` sorts the items once and numbers their unordered pairs
+like ``itertools.combinations(sorted(items), 2)`` does:
+(0, 1), (0, 2) ... (0, n-1), (1, 2) ... The pair number ``k`` is turned
+into its item indices ``(i, j)`` arithmetically, so any range of pairs, for
+instance one sitemap shard, is produced on its own and lazily, without
+building the pairs before it. Memory stays O(n) for the n(n-1)/2 pairs.
+
+Items are sorted, so the first item of a pair always sorts before the
+second, as the ``a-vs-b`` URLs expect.
+"""
+from math import isqrt
+
+
+class PairSpace:
+    def __init__(self, items):
+        self.items = sorted(items)
+        self.n = len(self.items)
+
+    def __len__(self):
+        return self.n * (self.n - 1) // 2
+
+    def row_start(self, i):
+        """Number of the pair (i, i + 1), the first pair of item i."""
+        return i * (2 * self.n - i - 1) // 2
+
+    def position(self, k):
+        """Item indices (i, j), i < j, of pair number ``k``."""
+        if not 0 <= k < len(self):
+            raise IndexError(f"pair {k} out of range for {len(self)} pairs")
+        # Largest i with row_start(i) <= k, the root of i^2 - (2n - 1) i + 2k = 0
+        b = 2 * self.n - 1
+        i = (b - isqrt(b * b - 8 * k)) // 2
+        # isqrt rounds down, at most one step off either way
+        while i > 0 and self.row_start(i) > k:
+            i -= 1
+        while self.row_start(i + 1) <= k:
+            i += 1
+        return i, k - self.row_start(i) + i + 1
+
+    def index(self, i, j):
+        """Number of the pair of items i and j, the inverse of ``position``."""
+        if i > j:
+            i, j = j, i
+        if not 0 <= i < j < self.n:
+            raise IndexError(f"no pair ({i}, {j}) among {self.n} items")
+        return self.row_start(i) + j - i - 1
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += len(self)
+        i, j = self.position(k)
+        return self.items[i], self.items[j]
+
+    def __iter__(self):
+        return self.iter_range(0, len(self))
+
+    def iter_range(self, start=0, stop=None):
+        """Yield the pairs numbered start to stop - 1, finding only the first one arithmetically."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        items = self.items
+        i, j = self.position(start)
+        for _ in range(stop - start):
+            yield items[i], items[j]
+            j += 1
+            if j == self.n:
+                i += 1
+                j = i + 1
+
+    def shards(self, size):
+        """Ranges of pair numbers of at most ``size`` pairs, each one can be produced on its own."""
+        return [range(start, min(start + size, len(self))) for start in range(0, len(self), size)]
@@ -0,0 +1,163 @@
+"""Header-driven conversion of PassMark tables into typed DataFrames.
+
+The ``<th>`` row is read once to map column labels to output fields, so the
+tables keep parsing when PassMark adds or reorders columns. Raw cell strings
+are collected column by column and each column is then cleaned and cast in a
+single vectorized pandas operation instead of running regexes per cell.
+"""
+import re
+
+import pandas as pd
+
+from .passmark_table import iter_table_rows
+
+VRAM_UNITS_TO_MB = {'KB': 1 / 1024, 'MB': 1, 'GB': 1024, 'TB': 1024 * 1024}
+
+
+def name_column(separators):
+    """Collapse whitespace, then replace every character of ``separators`` with a space."""
+    def convert(column):
+        column = column.str.replace(r'\s+', ' ', regex=True).str.strip()
+        return column.str.replace(f'[{separators}]', ' ', regex=True)
+    return convert
+
+
+def text_column(column):
+    column = column.str.strip()
+    return column.mask(column == 'NA')
+
+
+def _to_float(column):
+    column = column.mask(column.isin(['NA', '']))
+    try:
+        return column.astype('float64')
+    except ValueError:
+        # Unexpected text in a numeric column, fall back to coercing cell by cell
+        return pd.to_numeric(column, errors='coerce')
+
+
+def number_column(column):
+    """Numbers with thousands separators, 'NA' becomes missing."""
+    return _to_float(column.str.strip().str.replace(',', '', regex=False))
+
+
+def integer_column(column):
+    return number_column(column).round().astype('Int64')
+
+
+def price_column(column):
+    """Prices such as '$3,439.00*', anything that is not a digit or a period is dropped."""
+    return _to_float(column.str.replace(r'[^\d.]', '', regex=True))
+
+
+def vram_column(column):
+    """Memory sizes such as '8192 MB' or '8 GB', converted to MB."""
+    parts = column.str.strip().str.extract(r'^([\d.,]+)\s*([KMGT]B)?', flags=re.IGNORECASE)
+    values = pd.to_numeric(parts[0].str.replace(',', '', regex=False), errors='coerce')
+    factors = parts[1].str.upper().map(VRAM_UNITS_TO_MB).fillna(1)
+    return (values * factors).round().astype('Int64')
+
+
+def date_column(column):
+    """'Mon YYYY' test dates, unparseable values become NaT."""
+    return pd.to_datetime(column.str.strip(), format='%b %Y', errors='coerce')
+
+
+# Header label -> (output field, column converter), in output column order
+CPU_COLUMNS = {
+    'CPU Name': ('cpu_name', name_column('-/()')),
+    'Number of Sockets': ('num_sockets', integer_column),
+    'Cores': ('cores', integer_column),
+    'Price': ('price', price_column),
+    'CPU Mark': ('cpu_mark', integer_column),
+    'CPU Value': ('cpu_value', number_column),
+    'Thread Mark': ('thread_mark', integer_column),
+    'Thread Value': ('thread_value', number_column),
+    'TDP (W)': ('tdp', number_column),
+    'Power Perf.': ('power_perf', number_column),
+    'Test Date': ('test_date', date_column),
+    'Socket': ('socket', text_column),
+    'Category': ('category', text_column),
+}
+
+GPU_COLUMNS = {
+    'Videocard Name': ('videocard_name', name_column('-/')),
+    'Price': ('price', price_column),
+    'G3D Mark': ('g3d_mark', integer_column),
+    'Videocard Value': ('videocard_value', number_column),
+    'G2D Mark': ('g2d_mark', integer_column),
+    'TDP (W)': ('tdp', number_column),
+    'Power Perf.': ('power_perf', number_column),
+    'VRAM (MB)': ('vram', vram_column),
+    'Test Date': ('test_date', date_column),
+    'Category': ('category', text_column),
+}
+
+# Alternative labels seen on older saves of the charts
+HEADER_ALIASES = {
+    'Categories': 'Category',
+    'Videocard Category': 'Category',
+}
+
+
+def _column_map(header, columns):
+    """Map output fields to their cell index in ``header``."""
+    positions = {}
+    for index, label in enumerate(header):
+        label = ' '.join(label.split())
+        label = HEADER_ALIASES.get(label, label)
+        if label in columns and columns[label][0] not in positions:
+            positions[columns[label][0]] = index
+
+    missing = [label for label, (field, _) in columns.items() if field not in positions]
+    if missing:
+        raise ValueError(f"PassMark table is missing columns: {', '.join(missing)} (header: {header})")
+    return positions
+
+
+def read_passmark_table(source, columns, table_id='cputable'):
+    """
+    Read a saved PassMark table into a typed DataFrame.
+
+    ``columns`` is ``CPU_COLUMNS``, ``GPU_COLUMNS`` or a mapping of the same
+    shape. Rows with fewer cells than the mapped columns are skipped.
+    """
+    rows = iter_table_rows(source, table_id=table_id, with_header=True)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError(f"No table with id '{table_id}' and a header row found")
+
+    positions = _column_map(header, columns)
+    min_cells = max(positions.values()) + 1
+    raw = {field: [] for field in positions}
+    for cells in rows:
+        if len(cells) < min_cells:
+            continue
+        for field, index in positions.items():
+            raw[field].append(cells[index])
+
+    return pd.DataFrame({
+        field: convert(pd.Series(raw[field], dtype=str))
+        for field, convert in columns.values()
+    })
+
+
+# Fields PassMark shows with two decimals, written back the same way ('95.00', not '95.0')
+TWO_DECIMAL_FIELDS = ('price', 'cpu_value', 'thread_value', 'videocard_value', 'power_perf')
+
+
+def _plain_number(value):
+    """'65' for 65.0, the float as it is otherwise ('7.5')."""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def write_passmark_csv(df, filename):
+    """Write the table in the layout of cpus.csv / graphics_cards.csv."""
+    df = df.copy()
+    for field in df.columns[df.dtypes == 'float64']:
+        if field in TWO_DECIMAL_FIELDS:
+            df[field] = df[field].map('{:.2f}'.format, na_action='ignore')
+        else:
+            df[field] = df[field].map(_plain_number, na_action='ignore')
+    df['test_date'] = df['test_date'].dt.strftime('%b %Y')
+    df.to_csv(filename, index=False, encoding='utf-8')
@@ -0,0 +1,132 @@
+"""Streaming reader for the PassMark ``cputable`` HTML tables.
+
+The CPU and GPU charts are saved from passmark.com as one big ``<table>``.
+Instead of building a BeautifulSoup tree of the whole page, the file is fed
+chunk by chunk into the stdlib incremental tokenizer and each ``<tr>`` is
+yielded as soon as its closing tag has been seen, so memory stays flat and
+the first rows are available before the rest of the file has been read.
+"""
+import codecs
+from contextlib import nullcontext
+from html.parser import HTMLParser
+import os
+
+CHUNK_SIZE = 64 * 1024  # Characters handed to the tokenizer at a time
+
+
+class _TableRowParser(HTMLParser):
+    """Collect the header labels and the cell texts of a single table."""
+
+    def __init__(self, table_id):
+        super().__init__(convert_charrefs=True)
+        self.table_id = table_id
+        self.header = None
+        self.rows = []
+        self.finished = False
+        self._depth = 0  # <table> nesting level, 1 = inside the target table
+        self._row = None
+        self._row_is_header = False
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth == 0:
+            if tag == 'table' and not self.finished and dict(attrs).get('id') == self.table_id:
+                self._depth = 1
+            return
+        if tag == 'table':
+            self._depth += 1
+        elif self._depth != 1:
+            return
+        elif tag == 'tr':
+            self._end_row()
+            self._row = []
+            self._row_is_header = False
+        elif tag in ('td', 'th') and self._row is not None:
+            self._end_cell()
+            self._cell = []
+            if tag == 'th':
+                self._row_is_header = True
+
+    def handle_endtag(self, tag):
+        if self._depth == 0:
+            return
+        if tag == 'table':
+            self._depth -= 1
+            if self._depth == 0:
+                self._end_row()
+                self.finished = True
+        elif self._depth != 1:
+            return
+        elif tag in ('td', 'th'):
+            self._end_cell()
+        elif tag == 'tr':
+            self._end_row()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _end_cell(self):
+        if self._cell is None:
+            return
+        if self._row_is_header:
+            # Header cells also contain the search inputs and <option> texts,
+            # the column label is the first piece of text.
+            self._row.append(next((part.strip() for part in self._cell if part.strip()), ''))
+        else:
+            self._row.append(''.join(self._cell))
+        self._cell = None
+
+    def _end_row(self):
+        if self._row is None:
+            return
+        self._end_cell()
+        if self._row_is_header:
+            if self.header is None:
+                self.header = self._row
+        elif self._row:
+            self.rows.append(self._row)
+        self._row = None
+
+    def pop_rows(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+
+def _open_source(source):
+    """Return a context manager giving a readable file for a path or file object."""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, 'r', encoding='utf-8')
+    return nullcontext(source)
+
+
+def iter_table_rows(source, table_id='cputable', with_header=False, chunk_size=CHUNK_SIZE):
+    """
+    Yield the raw cell texts of every body row of the table ``table_id``.
+
+    ``source`` is a path or an already opened file object (text or binary,
+    binary input is decoded as UTF-8). When ``with_header`` is true the list
+    of ``<th>`` labels is yielded first. Reading stops as soon as the table
+    is closed, the remainder of the document is never tokenized.
+    """
+    parser = _TableRowParser(table_id)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    header_sent = not with_header
+
+    with _open_source(source) as file:
+        while not parser.finished:
+            chunk = file.read(chunk_size)
+            if isinstance(chunk, bytes):
+                chunk = decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                parser.close()
+            else:
+                parser.feed(chunk)
+
+            if not header_sent and parser.header is not None:
+                header_sent = True
+                yield parser.header
+            yield from parser.pop_rows()
+
+            if not chunk:
+                break
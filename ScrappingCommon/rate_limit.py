@@ -0,0 +1,238 @@
+"""Client-side adaptive rate limiting for the scripts writing to Strapi.
+
+A token bucket spaces the requests at ``rate`` per second and a concurrency
+cap bounds how many are in flight. Both are tuned with AIMD every ``window``
+responses. They grow while the window is all 2xx/4xx and its p95 latency
+stays under the target: doubling until the first backoff, like TCP slow
+start, then additively. They are held on a few 5xx, and cut multiplicatively
+on any 429, on more than ``error_threshold`` of 5xx or connection errors,
+on a p95 above the target, or on a p95 twice the best one seen (once above
+a tenth of the target).
+
+The rate has no fixed ceiling: ``max_rate`` comes from the caller or the
+``STRAPI_MAX_RATE`` environment variable (the limit of the production box),
+and without either the rate stops where the concurrency cap would stop it
+anyway, ``max_concurrency`` requests per best p95 latency seen.
+
+``stable_state()`` is the rate and concurrency the last window ran at
+without trouble. ``save_limiter_state`` keeps it per server next to the
+Strapi cache and ``load_limiter_state`` hands it to the limiter of the next
+run, which starts there instead of ramping up from the defaults again.
+
+The same limiter works for asyncio callers (``async with limiter.request()``)
+and threaded ones (``with limiter.request_sync()``).
+"""
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+import json
+import os
+import threading
+import time
+
+from .strapi_cache import cache_path
+
+BACKOFF_STATUSES = {429, 500, 502, 503, 504}
+STATE_FILE = 'limiter_state.json'
+
+
+class RequestTracker:
+    """Handed to the caller of ``request()``, which sets ``status`` once it has an answer."""
+
+    def __init__(self):
+        self.status = None
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate=10.0, min_rate=1.0, max_rate=None, concurrency=4, max_concurrency=32,
+                 rate_step=2.0, decrease=0.5, latency_target=1.0, window=20, error_threshold=0.1, name='Strapi'):
+        if max_rate is None and os.environ.get('STRAPI_MAX_RATE'):
+            max_rate = float(os.environ['STRAPI_MAX_RATE'])
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = max(min_rate, rate if max_rate is None else min(rate, max_rate))
+        self.concurrency = min(concurrency, max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.rate_step = rate_step
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.window = window
+        self.error_threshold = error_threshold
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._inflight = 0
+        self._window_latencies = []
+        self._window_errors = 0
+        self._window_throttled = 0
+        self._best_p95 = None
+        self._slow_start = True
+        self._stable = None  # (rate, concurrency) of the last window without trouble
+        self._thread_condition = threading.Condition()
+        self._async_condition = None
+
+    # Token bucket
+
+    def _take_token(self):
+        """Take a token if there is one and return 0, else return how long until the next one."""
+        with self._lock:
+            now = time.monotonic()
+            burst = max(1.0, self.rate / 10)
+            self._tokens = min(burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            # No reservation ahead of time: a waiter checks again at the rate current by then
+            return (1 - self._tokens) / self.rate
+
+    # Feedback
+
+    def _rate_ceiling(self):
+        if self.max_rate is not None:
+            return self.max_rate
+        if self._best_p95:
+            # More than this, the concurrency cap holds the requests back anyway
+            return max(self.min_rate, self.max_concurrency / self._best_p95)
+        return float('inf')
+
+    def stable_state(self):
+        """``{'rate', 'concurrency'}`` the last window ran at without trouble, None before the first window."""
+        if self._stable is None:
+            return None
+        rate, concurrency = self._stable
+        return {'rate': rate, 'concurrency': concurrency}
+
+    def record(self, status, latency):
+        """Account one response (status None for a connection error) and adapt every ``window`` responses."""
+        with self._lock:
+            self._window_latencies.append(latency)
+            if status == 429:
+                self._window_throttled += 1
+            elif status is None or status in BACKOFF_STATUSES:
+                self._window_errors += 1
+            if len(self._window_latencies) < self.window:
+                return
+            latencies = sorted(self._window_latencies)
+            p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+            errors = self._window_errors + self._window_throttled
+            # Any 429 is the server asking to slow down; a few 5xx in a window can be noise
+            congested = self._window_throttled or self._window_errors > self.error_threshold * len(latencies)
+            self._window_latencies = []
+            self._window_errors = 0
+            self._window_throttled = 0
+
+            window_rate, window_concurrency = self.rate, self.concurrency
+            # The relative test ignores windows that are fast anyway, a few ms of jitter would double a 1 ms p95
+            slow = p95 > self.latency_target or (
+                self._best_p95 is not None and p95 > 2 * self._best_p95 and p95 > 0.1 * self.latency_target)
+            if congested or slow:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.concurrency = max(1, int(self.concurrency * self.decrease))
+                self._slow_start = False
+                change = 'down'
+            elif errors:
+                change = 'hold'
+            elif self._slow_start:
+                self.rate = min(self._rate_ceiling(), self.rate * 2)
+                self.concurrency = min(self.max_concurrency, self.concurrency * 2)
+                change = 'up'
+            else:
+                self.rate = min(self._rate_ceiling(), self.rate + self.rate_step)
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+                change = 'up'
+            if not errors:
+                self._best_p95 = p95 if self._best_p95 is None else min(self._best_p95, p95)
+            # After a cut the new values are the best guess, otherwise those the window ran at
+            self._stable = (self.rate, self.concurrency) if change == 'down' else (window_rate, window_concurrency)
+            print(f"[{self.name} limiter] {change}: {self.rate:.1f} req/s, concurrency {self.concurrency} "
+                  f"(p95 {p95 * 1000:.0f} ms, {errors} errors in the last {len(latencies)})")
+
+    # asyncio interface
+
+    @asynccontextmanager
+    async def request(self):
+        """Wait for a free slot and a token, time the request made inside the block."""
+        if self._async_condition is None:
+            self._async_condition = asyncio.Condition()
+        # The slot first, so only the requests holding one poll the bucket
+        async with self._async_condition:
+            await self._async_condition.wait_for(lambda: self._inflight < self.concurrency)
+            self._inflight += 1
+
+        tracker = RequestTracker()
+        start = None
+        try:
+            while (wait := self._take_token()) > 0:
+                await asyncio.sleep(wait)
+            start = time.perf_counter()
+            yield tracker
+        finally:
+            if start is not None:
+                self.record(tracker.status, time.perf_counter() - start)
+            async with self._async_condition:
+                self._inflight -= 1
+                self._async_condition.notify_all()
+
+    # Threaded interface
+
+    @contextmanager
+    def request_sync(self):
+        """Blocking version of ``request()`` for requests/threads callers."""
+        with self._thread_condition:
+            self._thread_condition.wait_for(lambda: self._inflight < self.concurrency)
+            self._inflight += 1
+
+        tracker = RequestTracker()
+        start = None
+        try:
+            while (wait := self._take_token()) > 0:
+                time.sleep(wait)
+            start = time.perf_counter()
+            yield tracker
+        finally:
+            if start is not None:
+                self.record(tracker.status, time.perf_counter() - start)
+            with self._thread_condition:
+                self._inflight -= 1
+                self._thread_condition.notify_all()
+
+
+def limited_request(limiter, session, method, url, **kwargs):
+    """``session.request`` paced by ``limiter``, the response status is fed back to it."""
+    with limiter.request_sync() as tracker:
+        response = session.request(method, url, **kwargs)
+        tracker.status = response.status_code
+    return response
+
+
+def _state_path():
+    return cache_path().with_name(STATE_FILE)
+
+
+def load_limiter_state(key):
+    """``{'rate', 'concurrency'}`` saved for ``key`` (the API base URL) by the last run, None if there is none."""
+    try:
+        with open(_state_path(), encoding='utf-8') as f:
+            return json.load(f).get(key)
+    except (OSError, ValueError):
+        return None
+
+
+def save_limiter_state(key, limiter):
+    """Keep the stable rate and concurrency of ``limiter`` for the next run against ``key``."""
+    state = limiter.stable_state()
+    if state is None:
+        return
+    path = _state_path()
+    try:
+        with open(path, encoding='utf-8') as f:
+            states = json.load(f)
+    except (OSError, ValueError):
+        states = {}
+    states[key] = state
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(states, f, indent=2)
+    os.replace(tmp_path, path)
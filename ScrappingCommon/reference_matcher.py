@@ -0,0 +1,103 @@
+"""
+Match names against a reference list with ``difflib.SequenceMatcher``
+without scoring every name against every reference.
+
+``ReferenceMatcher(references, threshold).matches(name)`` answers exactly
+what looping ``SequenceMatcher(None, name, reference).ratio() >= threshold``
+over the references answers, but the references are indexed once:
+
+- an identical reference is found in a set;
+- ``ratio()`` is ``2 * matches / total length`` and the matches cannot
+  exceed the characters both strings have in common, so one vectorised pass
+  over a references x characters count matrix rules out every reference whose
+  upper bound is below the threshold;
+- among the others, the reference with the same normalised key (see
+  naming.py) and those sharing the most character trigrams with the name,
+  found through an inverted index, are scored first, then the rest by
+  decreasing bound; the first one over the threshold ends the search.
+
+Each reference keeps its own ``SequenceMatcher`` with the reference as
+second sequence, so difflib indexes it once instead of for every name.
+"""
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+import numpy as np
+
+from .naming import normalise_name
+
+NGRAM = 3
+SHORTLIST = 8  # references taken from the trigram index before the others
+
+
+def ngrams(text, size=NGRAM):
+    text = f" {text.casefold()} "
+    return {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+
+
+class ReferenceMatcher:
+    def __init__(self, references, threshold, shortlist=SHORTLIST):
+        self.threshold = threshold
+        self.shortlist = shortlist
+        self.references = list(dict.fromkeys(references))
+        self.exact = set(self.references)
+        self.by_key = defaultdict(list)
+        self.by_ngram = defaultdict(list)
+        self.matchers = []
+        self.alphabet = {}
+        for reference in self.references:
+            for char in reference:
+                self.alphabet.setdefault(char, len(self.alphabet))
+        self.char_counts = np.zeros((len(self.references), max(1, len(self.alphabet))), dtype=np.int32)
+        self.lengths = np.array([len(reference) for reference in self.references], dtype=np.int64)
+        for index, reference in enumerate(self.references):
+            self.by_key[normalise_name(reference)].append(index)
+            for gram in ngrams(reference):
+                self.by_ngram[gram].append(index)
+            for char, count in Counter(reference).items():
+                self.char_counts[index, self.alphabet[char]] = count
+            self.matchers.append(SequenceMatcher(None, '', reference))
+        self._cache = {}
+
+    def upper_bounds(self, name):
+        """quick_ratio() of ``name`` against every reference, an upper bound of their ratio()."""
+        name_counts = [(self.alphabet[char], count) for char, count in Counter(name).items() if char in self.alphabet]
+        if name_counts:
+            columns, counts = zip(*name_counts)
+            common = np.minimum(self.char_counts[:, list(columns)], np.array(counts)).sum(axis=1)
+        else:
+            common = np.zeros(len(self.references), dtype=np.int64)
+        # Both empty is the only zero total, and an identical reference is caught before
+        return 2.0 * common / np.maximum(self.lengths + len(name), 1)
+
+    def matches(self, name):
+        """True when ``name`` is similar to at least one reference, as the SequenceMatcher loop decided it."""
+        if name not in self._cache:
+            self._cache[name] = self._matches(name)
+        return self._cache[name]
+
+    def _matches(self, name):
+        if name in self.exact:
+            return True
+        if not self.references:
+            return False
+        bounds = self.upper_bounds(name)
+        viable = set(np.flatnonzero(bounds >= self.threshold).tolist())
+        if not viable:
+            return False
+
+        shared = Counter()
+        for gram in ngrams(name):
+            shared.update(self.by_ngram.get(gram, ()))
+        candidates = list(self.by_key.get(normalise_name(name), ()))
+        candidates += [index for index, _ in shared.most_common(self.shortlist)]
+        candidates += sorted(viable, key=lambda index: -bounds[index])
+
+        for index in dict.fromkeys(candidates):
+            if index not in viable:
+                continue
+            matcher = self.matchers[index]
+            matcher.set_seq1(name)
+            if matcher.ratio() >= self.threshold:
+                return True
+        return False
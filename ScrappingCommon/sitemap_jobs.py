@@ -0,0 +1,77 @@
+"""
+Comparison sitemap shards written in parallel by a pool of processes.
+
+A ``PairShardJob`` is one shard: a range of pair numbers of one group of
+items (see pairs.py) and the URL prefix of one category and language, the
+pair ``(a, b)`` giving ``<url_prefix>a-vs-b``. Each worker process builds
+the ``PairSpace`` of every group once, in the pool initializer, then writes
+the shards it is handed through a ``ShardedSitemapWriter``, which renames
+each file over its final name once complete. ``run_pair_shard_jobs``
+returns the file names job by job, in the order of the jobs, for the
+sitemap index. With ``compresslevel`` the shards are gzipped, ``.xml.gz``.
+
+Serialising the XML is CPU-bound and the shards are independent, so the
+time of a full regeneration goes down with the number of cores.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from .pairs import PairSpace
+from .sitemap_writer import MAX_URLS_PER_FILE, ShardedSitemapWriter, url_record
+
+
+class PairShardJob(NamedTuple):
+    group: str        # the items paired, e.g. 'cpu'
+    url_prefix: str   # e.g. 'https://siliconcompare.com/en/cpu/compare/'
+    name: str         # file name without extension, '-2', '-3'... is added if it rolls over the byte limit
+    start: int
+    stop: int
+    priority: str = '0.5'
+
+
+_pair_spaces = {}
+_settings = {}
+
+
+def _init_worker(items_by_group, output_dir, lastmod, max_urls, compresslevel):
+    _pair_spaces.clear()
+    _pair_spaces.update((group, PairSpace(items)) for group, items in items_by_group.items())
+    _settings.update(output_dir=output_dir, lastmod=lastmod, max_urls=max_urls, compresslevel=compresslevel)
+
+
+def write_pair_shard(job):
+    """Write one job's shard, return the names of the files written."""
+    pairs = _pair_spaces[job.group]
+    lastmod = _settings['lastmod']
+
+    def shard_name(index):
+        return f"{job.name}.xml" if index == 1 else f"{job.name}-{index}.xml"
+
+    records = (url_record(f"{job.url_prefix}{first}-vs-{second}", lastmod, job.priority)
+               for first, second in pairs.iter_range(job.start, job.stop))
+    with ShardedSitemapWriter(_settings['output_dir'], shard_name, max_urls=_settings['max_urls'],
+                              compresslevel=_settings['compresslevel']) as writer:
+        for record in records:
+            writer.add(record)
+    return writer.files
+
+
+def pair_shard_jobs(group, items, url_prefix, name_prefix, shard_size=MAX_URLS_PER_FILE, priority='0.5'):
+    """Jobs covering every pair of ``items``, ``shard_size`` pairs each, named ``<name_prefix>-1``..."""
+    pairs = PairSpace(items)
+    return [PairShardJob(group, url_prefix, f"{name_prefix}-{shard}", pair_range.start, pair_range.stop, priority)
+            for shard, pair_range in enumerate(pairs.shards(shard_size), 1)]
+
+
+def run_pair_shard_jobs(jobs, items_by_group, output_dir, lastmod, workers=None, max_urls=MAX_URLS_PER_FILE,
+                        compresslevel=None):
+    """
+    Run the jobs on ``workers`` processes (one per CPU by default, 1 writes
+    them in this process) and return the list of file names of each job.
+    """
+    initargs = (items_by_group, output_dir, lastmod, max_urls, compresslevel)
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker(*initargs)
+        return [write_pair_shard(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        return list(pool.map(write_pair_shard, jobs))
@@ -0,0 +1,134 @@
+"""Streaming writer of sharded sitemap files.
+
+``<url>`` records are written to the current shard as they come, nothing is
+kept in memory but the record being written, so the sitemaps of any number
+of comparison pairs are written with flat memory. A new shard is started
+before the current one would go over ``max_urls`` URLs or ``max_bytes``
+bytes (the sitemap protocol allows 50,000 URLs and 50 MB per file).
+
+The bytes written are the same as those of the ``xml.etree.ElementTree``
+serialisation the sitemap scripts used before. Each shard is written to a
+temporary file renamed over the final name once complete, so a crawler or a
+deploy never picks up half a sitemap.
+
+With ``compresslevel`` (1-9) the shards are gzipped as they are written and
+get a ``.gz`` suffix, which crawlers accept for sitemaps. The limits still
+apply to the uncompressed size, as the protocol requires.
+"""
+import gzip
+import io
+import os
+from xml.sax.saxutils import escape
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+MAX_URLS_PER_FILE = 50000
+MAX_BYTES_PER_FILE = 50 * 1024 * 1024
+URLSET_HEADER = f"<?xml version='1.0' encoding='utf-8'?>\n<urlset xmlns=\"{SITEMAP_NS}\">"
+URLSET_FOOTER = "</urlset>"
+WRITE_BUFFER = 1024 * 1024
+
+
+def url_record(loc, lastmod, priority):
+    """One ``<url>`` element, ``lastmod`` is a preformatted date shared by the whole run."""
+    return (f"<url><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod>"
+            f"<priority>{priority}</priority></url>")
+
+
+class ShardedSitemapWriter:
+    """
+    Write records to ``name_pattern.format(index=1)``, ``index=2``... in
+    ``output_dir``, rolling to the next file at the URL or size limit.
+    ``name_pattern`` can also be a function of the index returning the name.
+    ``files`` lists the names of the shards written, in order.
+    """
+
+    def __init__(self, output_dir, name_pattern, max_urls=MAX_URLS_PER_FILE, max_bytes=MAX_BYTES_PER_FILE,
+                 header=URLSET_HEADER, footer=URLSET_FOOTER, compresslevel=None):
+        self.output_dir = output_dir
+        self.name_pattern = name_pattern
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.header = header.encode('utf-8')
+        self.footer = footer.encode('utf-8')
+        self.compresslevel = compresslevel
+        self.files = []
+        self.url_count = 0
+        self._file = None
+        self._raw = None
+        self._path = None
+        self._shard_urls = 0
+        self._shard_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _shard_name(self, index):
+        if callable(self.name_pattern):
+            return self.name_pattern(index)
+        return self.name_pattern.format(index=index)
+
+    def _open_shard(self):
+        filename = self._shard_name(len(self.files) + 1)
+        if self.compresslevel is not None:
+            filename += '.gz'
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._path = os.path.join(self.output_dir, filename)
+        self._raw = open(f"{self._path}.{os.getpid()}.tmp", 'wb', buffering=WRITE_BUFFER)
+        if self.compresslevel is None:
+            self._file = self._raw
+        else:
+            # mtime 0 keeps the files identical from one run to the next; the buffer
+            # hands zlib large blocks rather than one small record at a time
+            gzip_file = gzip.GzipFile(filename='', mode='wb', compresslevel=self.compresslevel,
+                                      fileobj=self._raw, mtime=0)
+            self._file = io.BufferedWriter(gzip_file, WRITE_BUFFER)
+        self._file.write(self.header)
+        self.files.append(filename)
+        self._shard_urls = 0
+        self._shard_bytes = len(self.header)
+
+    def _close_shard(self):
+        self._file.write(self.footer)
+        self._file.close()
+        self._raw.close()  # GzipFile leaves the file it writes to open
+        os.replace(self._raw.name, self._path)
+        self._file = self._raw = None
+
+    def add(self, record):
+        data = record.encode('utf-8')
+        if self._file is not None and (self._shard_urls >= self.max_urls or
+                                       self._shard_bytes + len(data) + len(self.footer) > self.max_bytes):
+            self._close_shard()
+        if self._file is None:
+            self._open_shard()
+        self._file.write(data)
+        self._shard_urls += 1
+        self._shard_bytes += len(data)
+        self.url_count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._close_shard()
+
+    def discard(self):
+        """Drop the shard being written, after an error; the shards already complete stay."""
+        if self._file is not None:
+            self._file.close()
+            self._raw.close()
+            os.remove(self._raw.name)
+            self._file = self._raw = None
+            self.files.pop()
+
+
+def write_sitemap_shards(output_dir, name_pattern, records, **kwargs):
+    """Write every record of an iterable, return the shard file names (none for no records)."""
+    with ShardedSitemapWriter(output_dir, name_pattern, **kwargs) as writer:
+        for record in records:
+            writer.add(record)
+    return writer.files
@@ -0,0 +1,170 @@
+"""Local SQLite copy of Strapi collections, refreshed incrementally.
+
+The first refresh of a collection downloads it whole. Later refreshes only
+ask for the entries whose ``updatedAt`` is not older than the newest one
+already cached, then list the ids of the collection (a light
+``fields=updatedAt`` listing) to drop the entries deleted since and pick up
+any entry the filter missed. A pipeline run over an unchanged collection
+costs a single light listing instead of a full download.
+
+Entries are stored as returned by the API (``{'id', 'attributes'}``), so
+callers can use them like the result of ``fetch_collection``. Deleting the
+cache directory (``.strapi_cache`` at the root of the repo by default) forces
+a full download.
+"""
+import json
+import os
+from pathlib import Path
+import sqlite3
+import time
+
+from .strapi_fetch import DEFAULT_CONCURRENCY, iter_collection, make_session
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.strapi_cache'
+ID_PAGE_SIZE = 1000    # the id listing only carries updatedAt, large pages are cheap
+ID_FILTER_CHUNK = 100  # ids per filters[id][$in] request
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    source TEXT NOT NULL,          -- API base URL + collection
+    id INTEGER NOT NULL,
+    updated_at TEXT,
+    data TEXT NOT NULL,            -- the entry as returned by the API, as JSON
+    PRIMARY KEY (source, id)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    source TEXT PRIMARY KEY,
+    last_updated_at TEXT,          -- newest updatedAt seen in the collection
+    synced_at REAL NOT NULL        -- time of the last refresh
+);
+"""
+
+
+def cache_path():
+    """SQLite file of the cache, ``STRAPI_CACHE_DIR`` overrides the default directory."""
+    directory = Path(os.environ.get('STRAPI_CACHE_DIR', DEFAULT_CACHE_DIR))
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / 'strapi_cache.sqlite'
+
+
+class StrapiCache:
+    """Cached entries of the Strapi collections, keyed by API base URL and collection name."""
+
+    def __init__(self, path=None):
+        self.path = path or cache_path()
+        self._db = sqlite3.connect(str(self.path))
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def source(base_url, collection):
+        return f"{base_url.rstrip('/')}/{collection}"
+
+    def entries(self, base_url, collection):
+        """Cached entries of a collection, ordered by id."""
+        rows = self._db.execute("SELECT data FROM entries WHERE source = ? ORDER BY id",
+                                (self.source(base_url, collection),))
+        return [json.loads(data) for data, in rows]
+
+    def forget(self, base_url, collection, ids):
+        """Drop entries the caller just deleted from Strapi."""
+        source = self.source(base_url, collection)
+        self._db.executemany("DELETE FROM entries WHERE source = ? AND id = ?",
+                             [(source, entry_id) for entry_id in ids])
+        self._db.commit()
+
+    def clear(self, base_url, collection):
+        source = self.source(base_url, collection)
+        self._db.execute("DELETE FROM entries WHERE source = ?", (source,))
+        self._db.execute("DELETE FROM syncs WHERE source = ?", (source,))
+        self._db.commit()
+
+    def _store(self, source, entries):
+        rows = [(source, entry['id'], (entry.get('attributes') or {}).get('updatedAt'),
+                 json.dumps(entry, ensure_ascii=False)) for entry in entries]
+        self._db.executemany("INSERT OR REPLACE INTO entries (source, id, updated_at, data) VALUES (?, ?, ?, ?)",
+                             rows)
+        return len(rows)
+
+    def refresh(self, base_url, collection, full=False, concurrency=DEFAULT_CONCURRENCY, session=None):
+        """
+        Bring the cached copy of a collection up to date, return a dict of counts
+        (``fetched``, ``deleted``, ``total``). ``full`` discards the cached copy first.
+        """
+        source = self.source(base_url, collection)
+        if full:
+            self.clear(base_url, collection)
+        row = self._db.execute("SELECT last_updated_at FROM syncs WHERE source = ?", (source,)).fetchone()
+        last_updated_at = row[0] if row else None
+
+        own_session = session is None
+        session = session or make_session(concurrency)
+        try:
+            if last_updated_at is None:
+                fetched = self._store(source, iter_collection(base_url, collection, concurrency=concurrency,
+                                                              session=session))
+                deleted = 0
+            else:
+                # $gte: entries saved in the same millisecond as the newest cached one are fetched again
+                changed = iter_collection(base_url, collection, concurrency=concurrency, session=session,
+                                          params={'filters[updatedAt][$gte]': last_updated_at})
+                fetched = self._store(source, changed)
+
+                remote = {entry['id']: (entry.get('attributes') or {}).get('updatedAt')
+                          for entry in iter_collection(base_url, collection, fields=['updatedAt'],
+                                                       page_size=ID_PAGE_SIZE, concurrency=concurrency,
+                                                       session=session)}
+                local = dict(self._db.execute("SELECT id, updated_at FROM entries WHERE source = ?", (source,)))
+                gone = [entry_id for entry_id in local if entry_id not in remote]
+                self._db.executemany("DELETE FROM entries WHERE source = ? AND id = ?",
+                                     [(source, entry_id) for entry_id in gone])
+                deleted = len(gone)
+
+                # Entries the updatedAt filter cannot see, e.g. restored with an older date
+                stale = [entry_id for entry_id, updated_at in remote.items() if local.get(entry_id) != updated_at]
+                for start in range(0, len(stale), ID_FILTER_CHUNK):
+                    params = {f'filters[id][$in][{index}]': entry_id
+                              for index, entry_id in enumerate(stale[start:start + ID_FILTER_CHUNK])}
+                    fetched += self._store(source, iter_collection(base_url, collection, concurrency=concurrency,
+                                                                   session=session, params=params))
+        except BaseException:
+            self._db.rollback()
+            raise
+        finally:
+            if own_session:
+                session.close()
+
+        newest = self._db.execute("SELECT MAX(updated_at) FROM entries WHERE source = ?", (source,)).fetchone()[0]
+        self._db.execute("INSERT OR REPLACE INTO syncs (source, last_updated_at, synced_at) VALUES (?, ?, ?)",
+                         (source, newest, time.time()))
+        self._db.commit()
+        total = self._db.execute("SELECT COUNT(*) FROM entries WHERE source = ?", (source,)).fetchone()[0]
+        return {'fetched': fetched, 'deleted': deleted, 'total': total}
+
+
+def cached_collection(base_url, collection, full=False, concurrency=DEFAULT_CONCURRENCY, path=None):
+    """
+    Entries of a collection, like ``fetch_collection``, served from the local
+    cache after an incremental refresh. Prints what the refresh downloaded.
+    """
+    with StrapiCache(path) as cache:
+        started = time.perf_counter()
+        counts = cache.refresh(base_url, collection, full=full, concurrency=concurrency)
+        print(f"Strapi cache of {collection}: {counts['fetched']} entries fetched, {counts['deleted']} deleted, "
+              f"{counts['total']} cached ({time.perf_counter() - started:.2f}s)")
+        return cache.entries(base_url, collection)
+
+
+def forget_entries(base_url, collection, ids, path=None):
+    """Remove deleted entries from the cache without waiting for the next refresh."""
+    with StrapiCache(path) as cache:
+        cache.forget(base_url, collection, ids)
@@ -0,0 +1,214 @@
+"""Asynchronous Strapi REST client shared by the upload scripts.
+
+One ``aiohttp`` session keeps a pool of keep-alive connections to the API and
+an ``AdaptiveRateLimiter`` paces the requests and bounds how many are in
+flight, backing off when the server struggles. Requests answered with
+429 or a 5xx status, or that fail at the connection level, are retried with
+exponential backoff (honouring ``Retry-After``). A POST is not idempotent:
+it is only retried when Strapi cannot have created the entry, on 429/503
+answers or when the connection could not be opened, never after a timeout
+or a dropped connection, which would create the entry twice. Every request is accounted
+in a ``RunSummary`` that is printed at the end of a run.
+"""
+import asyncio
+import json
+import random
+import time
+
+import aiohttp
+
+from .rate_limit import AdaptiveRateLimiter, load_limiter_state, save_limiter_state
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses and errors after which the request was certainly not processed, safe to retry for POST
+POST_RETRY_STATUSES = {429, 503}
+POST_RETRY_ERRORS = (aiohttp.ClientConnectorError,)
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+SUCCESS_STATUSES = {200, 201, 204}
+
+
+class RunSummary:
+    """Outcome counts and latencies of the requests made during a run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+        self.statuses = {}
+        self.latencies = []
+        self.failures = []  # (label, status, body excerpt)
+
+    def record(self, label, status, latency, body=None):
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latencies.append(latency)
+        if status in SUCCESS_STATUSES:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            self.failures.append((label, status, str(body)[:200] if body is not None else ''))
+
+    def percentile(self, fraction):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def print(self, title='Run summary', max_failures=20):
+        elapsed = time.perf_counter() - self.started
+        total = self.succeeded + self.failed
+        print(f"\n{title}: {total} requests in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.1f} req/s)")
+        print(f"  succeeded {self.succeeded}, failed {self.failed}, retries {self.retries}")
+        print(f"  latency p50 {self.percentile(0.5) * 1000:.0f} ms, p95 {self.percentile(0.95) * 1000:.0f} ms")
+        print(f"  statuses: {', '.join(f'{status}: {count}' for status, count in sorted(self.statuses.items(), key=str))}")
+        for label, status, body in self.failures[:max_failures]:
+            print(f"  failed {label} ({status}): {body}")
+        if len(self.failures) > max_failures:
+            print(f"  ... and {len(self.failures) - max_failures} more failures")
+
+
+class StrapiClient:
+    """
+    Pooled, bounded-concurrency client for a Strapi instance.
+
+    Use as ``async with StrapiClient('https://api.example.com/api') as client``.
+    Paths passed to the request methods are relative to ``base_url``.
+    ``concurrency`` is the most requests the limiter may let through at once,
+    and where it starts. The limiter also starts at the rate the previous run
+    against the same API settled on, and leaves its own for the next one.
+    """
+
+    def __init__(self, base_url, concurrency=16, max_retries=5, backoff=0.5, timeout=30, headers=None,
+                 limiter=None):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self._own_limiter = limiter is None
+        if limiter is None:
+            settings = {'concurrency': concurrency}
+            settings.update(load_limiter_state(self.base_url) or {})
+            limiter = AdaptiveRateLimiter(max_concurrency=concurrency, **settings)
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.summary = RunSummary()
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        if self._own_limiter:
+            save_limiter_state(self.base_url, self.limiter)
+
+    def print_summary(self, title='Run summary'):
+        self.summary.print(title)
+        print(f"  final rate {self.limiter.rate:.1f} req/s, concurrency {self.limiter.concurrency}")
+
+    def url(self, path):
+        return path if path.startswith('http') else f"{self.base_url}/{path.lstrip('/')}"
+
+    def retry_delay(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        # Full jitter keeps the retries of many concurrent requests from lining up
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    async def request(self, method, path, label=None, **kwargs):
+        """
+        Send one request, retrying on 429/5xx and connection errors
+        (see ``retryable`` for POST). Return ``(status, body)``, body being the decoded JSON when there is some.
+        A request that never got a response is reported with status ``None``.
+        """
+        label = label or f'{method} {path}'
+        url = self.url(path)
+        attempt = 0
+        while True:
+            retry_after = None
+            error = None
+            try:
+                async with self.limiter.request() as tracker:
+                    # Latency of the request itself, not of the wait for a free slot
+                    start = time.perf_counter()
+                    async with self._session.request(method, url, **kwargs) as response:
+                        status = tracker.status = response.status
+                        retry_after = response.headers.get('Retry-After')
+                        text = await response.text()
+                body = _decode(text)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                status, body = None, f'{type(e).__name__}: {e}'
+
+            if not self.retryable(method, status, error) or attempt >= self.max_retries:
+                self.summary.record(label, status, time.perf_counter() - start, body)
+                return status, body
+
+            self.summary.retries += 1
+            await asyncio.sleep(self.retry_delay(attempt, retry_after))
+            attempt += 1
+
+    @staticmethod
+    def retryable(method, status, error=None):
+        """
+        True when the request can be sent again. An idempotent request is
+        retried on 429/5xx and on any connection error or timeout; a POST only
+        when it certainly did not reach Strapi, as a retry after a timeout or a
+        dropped connection could create the entry a second time.
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            return status is None or status in RETRY_STATUSES
+        if status is None:
+            return isinstance(error, POST_RETRY_ERRORS)
+        return status in POST_RETRY_STATUSES
+
+    async def get(self, path, label=None, **kwargs):
+        return await self.request('GET', path, label, **kwargs)
+
+    async def post(self, path, payload, label=None):
+        return await self.request('POST', path, label, json=payload)
+
+    async def put(self, path, payload, label=None):
+        return await self.request('PUT', path, label, json=payload)
+
+    async def delete(self, path, label=None):
+        return await self.request('DELETE', path, label)
+
+
+def _decode(text):
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+async def post_all(base_url, collection, payloads, labels, concurrency=16, title='Upload'):
+    """POST every payload to ``collection`` concurrently, print and return the run summary."""
+    async with StrapiClient(base_url, concurrency=concurrency) as client:
+        async def post_one(payload, label):
+            status, body = await client.post(collection, payload, label)
+            if status in SUCCESS_STATUSES:
+                print(f"Successfully added: {label}")
+            else:
+                print(f"Failed to add {label} (status {status}): {str(body)[:200]}")
+
+        await asyncio.gather(*(post_one(payload, label) for payload, label in zip(payloads, labels)))
+    client.print_summary(title)
+    return client.summary
+
+
+def upload(base_url, collection, payloads, labels, concurrency=16, title='Upload'):
+    """Blocking entry point for the scripts, see ``post_all``."""
+    return asyncio.run(post_all(base_url, collection, payloads, labels, concurrency, title))
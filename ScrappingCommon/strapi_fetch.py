@@ -0,0 +1,90 @@
+"""Paginated listing of Strapi collections.
+
+The first page is requested alone to read ``meta.pagination.pageCount``, the
+remaining pages are then fetched concurrently over one pooled
+``requests.Session``. Pages are yielded in order as soon as they (and the
+pages before them) have arrived, so callers can start working on the first
+entries while the rest of the collection is still downloading.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CONCURRENCY = 8
+
+
+def make_session(pool_size=DEFAULT_CONCURRENCY, retries=3):
+    """A session keeping ``pool_size`` connections alive, retrying 429/5xx answers with backoff."""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=None, respect_retry_after_header=True)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def page_params(page, page_size, fields=None, params=None):
+    """Query parameters of one page, ``fields`` limits the attributes returned."""
+    query = dict(params or {})
+    query['pagination[page]'] = page
+    query['pagination[pageSize]'] = page_size
+    for index, field in enumerate(fields or ()):
+        query[f'fields[{index}]'] = field
+    return query
+
+
+def _get_page(session, url, page, page_size, fields, params, timeout):
+    response = session.get(url, params=page_params(page, page_size, fields, params), timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def iter_collection_pages(base_url, collection, fields=None, page_size=DEFAULT_PAGE_SIZE,
+                          concurrency=DEFAULT_CONCURRENCY, params=None, session=None, timeout=60):
+    """
+    Yield ``(page, entries)`` for every page of a collection, in page order.
+
+    ``fields`` is a list of attribute names (Strapi ``fields`` projection),
+    ``params`` extra query parameters such as filters. Raises
+    ``requests.HTTPError`` when a page cannot be fetched.
+    """
+    url = f"{base_url.rstrip('/')}/{collection}"
+    own_session = session is None
+    session = session or make_session(concurrency)
+    try:
+        first = _get_page(session, url, 1, page_size, fields, params, timeout)
+        yield 1, first.get('data', [])
+
+        page_count = first.get('meta', {}).get('pagination', {}).get('pageCount')
+        if page_count is None:
+            # No count in the answer, fall back to walking the pages until a short one
+            page, entries = 1, first.get('data', [])
+            while len(entries) == page_size:
+                page += 1
+                entries = _get_page(session, url, page, page_size, fields, params, timeout).get('data', [])
+                yield page, entries
+            return
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pages = range(2, page_count + 1)
+            results = pool.map(lambda page: _get_page(session, url, page, page_size, fields, params, timeout), pages)
+            for page, data in zip(pages, results):
+                yield page, data.get('data', [])
+    finally:
+        if own_session:
+            session.close()
+
+
+def iter_collection(base_url, collection, **kwargs):
+    """Yield the entries of a collection one by one, see ``iter_collection_pages``."""
+    for _, entries in iter_collection_pages(base_url, collection, **kwargs):
+        yield from entries
+
+
+def fetch_collection(base_url, collection, **kwargs):
+    """Return every entry of a collection as a list, see ``iter_collection_pages``."""
+    return list(iter_collection(base_url, collection, **kwargs))
@@ -0,0 +1,156 @@
+"""Diff-based sync of a local catalogue into a Strapi collection.
+
+Local records and Strapi entries are matched on a normalised name. Each side
+is reduced to a content hash, and only the differences are sent:
+
+- a POST for every record Strapi does not have;
+- a PUT for every record whose content changed;
+- a DELETE for every entry that is gone from the catalogue, and for every
+  duplicate of an entry.
+
+Unchanged records cost nothing. Nothing is deleted up front, so the site
+never runs with an empty collection.
+"""
+import asyncio
+import hashlib
+import json
+import math
+
+from .naming import normalise_name
+from .strapi_client import SUCCESS_STATUSES, StrapiClient
+from .strapi_fetch import fetch_collection
+
+# Fields added to the entries after the upload (see amazonLinkToStrapi.py), kept on update
+PRESERVED_FIELDS = ('amazonLink',)
+
+
+def _canonical(value):
+    """JSON-comparable form of a value: NaN becomes None and integral floats become ints."""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def content_hash(record):
+    """Stable hash of a record's content, independent of key order and of 3 vs 3.0."""
+    data = json.dumps(_canonical(record), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class SyncPlan:
+    """Requests needed to bring a Strapi collection in line with the local records."""
+
+    def __init__(self):
+        self.create = []     # (key, record)
+        self.update = []     # (key, entry id, record)
+        self.delete = []     # (key, entry id, reason)
+        self.unchanged = 0
+        self.skipped = []    # local records without a usable name
+
+    def print(self, title):
+        print(f"{title}: {len(self.create)} to create, {len(self.update)} to update, "
+              f"{len(self.delete)} to delete, {self.unchanged} unchanged"
+              + (f", {len(self.skipped)} local records without a name skipped" if self.skipped else ''))
+
+
+def plan_sync(records, entries, attribute, key_field, preserved_fields=PRESERVED_FIELDS):
+    """
+    Compare local ``records`` (dicts) with Strapi ``entries`` of the collection.
+
+    ``attribute`` is the JSON attribute holding the record in Strapi ('CPU',
+    'GPU', 'phone') and ``key_field`` the name field used as key. Fields of
+    ``preserved_fields`` present in Strapi but not locally are carried over.
+    """
+    plan = SyncPlan()
+
+    local = {}
+    for record in records:
+        key = normalise_name(record.get(key_field))
+        if key is None:
+            plan.skipped.append(record)
+            continue
+        local[key] = _canonical(record)  # The last record of a duplicated name wins
+
+    remote = {}
+    for entry in sorted(entries, key=lambda entry: entry['id']):
+        data = (entry.get('attributes') or {}).get(attribute) or {}
+        key = normalise_name(data.get(key_field))
+        if key is None:
+            continue
+        if key in remote:
+            # Keep the oldest entry, its id is the one already linked and indexed
+            plan.delete.append((key, entry['id'], 'duplicate'))
+        else:
+            remote[key] = (entry['id'], data)
+
+    for key, record in local.items():
+        if key not in remote:
+            plan.create.append((key, record))
+            continue
+        entry_id, data = remote[key]
+        merged = dict(record)
+        for field in preserved_fields:
+            if field not in merged and data.get(field) is not None:
+                merged[field] = data[field]
+        if content_hash(merged) == content_hash(data):
+            plan.unchanged += 1
+        else:
+            plan.update.append((key, entry_id, merged))
+
+    for key, (entry_id, _) in remote.items():
+        if key not in local:
+            plan.delete.append((key, entry_id, 'not in the local catalogue'))
+    return plan
+
+
+async def apply_plan(client, collection, attribute, plan):
+    """Send the requests of a plan concurrently, return the number of failed requests."""
+    async def send(method, path, payload, label):
+        status, body = await client.request(method, path, label, json=payload)
+        if status not in SUCCESS_STATUSES:
+            print(f"Failed to {method} {label} (status {status}): {str(body)[:200]}")
+
+    requests = [send('POST', collection, {'data': {attribute: record}}, f'create {key}')
+                for key, record in plan.create]
+    requests += [send('PUT', f'{collection}/{entry_id}', {'data': {attribute: record}}, f'update {key}')
+                 for key, entry_id, record in plan.update]
+    requests += [send('DELETE', f'{collection}/{entry_id}', None, f'delete {key} ({reason})')
+                 for key, entry_id, reason in plan.delete]
+    await asyncio.gather(*requests)
+    return client.summary.failed
+
+
+def sync_collection(base_url, collection, attribute, key_field, records, dry_run=False,
+                    max_delete_fraction=0.2, concurrency=16):
+    """
+    Sync ``records`` into ``collection`` and print what was done.
+
+    The sync stops before sending anything when it would delete more than
+    ``max_delete_fraction`` of the collection (a truncated CSV, a wrong
+    key field...); pass 1 to allow it. Returns the plan.
+    """
+    entries = fetch_collection(base_url, collection, fields=[attribute], concurrency=concurrency)
+    plan = plan_sync(records, entries, attribute, key_field)
+    plan.print(f"Sync of {collection} ({len(entries)} entries in Strapi)")
+
+    if entries and len(plan.delete) > max_delete_fraction * len(entries):
+        print(f"Refusing to delete {len(plan.delete)} of {len(entries)} entries, "
+              f"check the local data or raise max_delete_fraction")
+        return plan
+    if dry_run or not (plan.create or plan.update or plan.delete):
+        return plan
+
+    async def run():
+        async with StrapiClient(base_url, concurrency=concurrency) as client:
+            await apply_plan(client, collection, attribute, plan)
+        client.print_summary(f"Sync of {collection}")
+
+    asyncio.run(run())
+    return plan
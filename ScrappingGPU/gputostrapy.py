@@ -1,8 +1,19 @@
+import argparse
+import sys
+from pathlib import Path
+
 import pandas as pd
-import requests
 
-# Load the CSV file
-df = pd.read_csv('../graphics_cards_07_2025.csv')
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.dedup import drop_duplicates, existing_keys
+from ScrappingCommon.naming import normalise_name
+from ScrappingCommon.strapi_client import upload
+from ScrappingCommon.strapi_sync import sync_collection
+
+# Strapi API URL
+API_BASE_URL = 'https://api.siliconcompare.com/api'  # Adjust the URL according to your Strapi instance
+COLLECTION = 'gpus'
+CONCURRENCY = 16  # Requests in flight at once
 
 # Function to clean and transform the DataFrame
 def transform_data(df):
@@ -21,32 +32,40 @@ def transform_data(df):
 
     return df.to_dict(orient='records')
 
-# Transform the data
-gpu_entries = transform_data(df)
-
-# Strapi API URL
-api_url = 'https://api.siliconcompare.com/api/gpus'  # Adjust the URL according to your Strapi instance
+def build_payload(entry):
+    """Wrap a GPU record in the Strapi payload, NaN becomes None"""
+    entry_cleaned = {k: (v if pd.notna(v) else None) for k, v in entry.items()}
+    return {"data": {"GPU": entry_cleaned}}
 
 def post_to_strapi(gpu_entries):
-    for entry in gpu_entries:
-        # Replace NaN with None
-        entry_cleaned = {k: (v if pd.notna(v) else None) for k, v in entry.items()}
-        
-        # Create payload
-        payload = {"data": {"GPU": entry_cleaned}}
-        
-        print(f"Sending payload: {payload}")
-        
-        response = requests.post(api_url, json=payload)
-        if response.status_code == 201 or 200:
-            print(f"✅ Successfully added: {entry['videocard_name']}")
-        else:
-            try:
-                error_details = response.json()
-            except ValueError:
-                error_details = response.text
-            print(f"❌ Failed to add {entry['videocard_name']} (status {response.status_code}): {error_details}")
-
-
-# Post the GPU entries to Strapi
-post_to_strapi(gpu_entries)
+    # Only create the GPUs Strapi does not have yet, once each, matched on the normalised videocard_name;
+    # a rerun after an interrupted upload thus only sends the GPUs left
+    known = existing_keys(API_BASE_URL, COLLECTION, "GPU", "videocard_name")
+    gpu_entries, skipped = drop_duplicates(gpu_entries, lambda entry: normalise_name(entry['videocard_name']), known)
+    if skipped:
+        print(f"Skipping {len(skipped)} GPUs already in Strapi or repeated in the CSV")
+    payloads = [build_payload(entry) for entry in gpu_entries]
+    labels = [entry['videocard_name'] for entry in gpu_entries]
+    return upload(API_BASE_URL, COLLECTION, payloads, labels, CONCURRENCY, title='GPU upload')
+
+# Only send the differences with what Strapi holds, matched on the normalised videocard_name
+def sync_to_strapi(gpu_entries, dry_run=False, max_delete_fraction=0.2):
+    records = [build_payload(entry)["data"]["GPU"] for entry in gpu_entries]
+    return sync_collection(API_BASE_URL, COLLECTION, "GPU", "videocard_name", records, dry_run=dry_run,
+                           max_delete_fraction=max_delete_fraction, concurrency=CONCURRENCY)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Send the GPUs of the CSV to Strapi")
+    parser.add_argument("mode", nargs="?", choices=["upload", "sync"], default="upload",
+                        help="upload: POST the GPUs Strapi does not have yet; sync: create, update and delete only what changed")
+    parser.add_argument("--dry-run", action="store_true", help="sync: only print what would be sent")
+    parser.add_argument("--max-delete-fraction", type=float, default=0.2,
+                        help="sync: refuse to delete more than this share of the collection")
+    args = parser.parse_args()
+
+    df = pd.read_csv('../graphics_cards_07_2025.csv')
+    entries = transform_data(df)
+    if args.mode == "sync":
+        sync_to_strapi(entries, args.dry_run, args.max_delete_fraction)
+    else:
+        post_to_strapi(entries)
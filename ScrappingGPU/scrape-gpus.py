@@ -1,58 +1,16 @@
-import csv
-from bs4 import BeautifulSoup
-import re
+import io
+import sys
+from pathlib import Path
 
-def clean_text(text):
-    # Remove newlines and extra spaces
-    cleaned = re.sub(r'\s+', ' ', text).strip()
-    return cleaned
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.passmark_frame import GPU_COLUMNS, read_passmark_table, write_passmark_csv
 
-def extract_numeric_value(text):
-    """ Extracts only numeric values from the given text. """
-    # Replace commas with empty string and extract numeric parts
-    cleaned = re.sub(r'[^\d.]', '', text)  # Remove anything that's not a digit or period
-    return cleaned if cleaned else ''
-
-def parse_html_table(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table', id='cputable')
-    rows = table.find_all('tr')
-    
-    data = []
-    for row in rows[1:]:  # Skip the header row
-        cols = row.find_all('td')
-        if len(cols) >= 11:
-            videocard_name = clean_text(cols[1].text).replace('-', ' ').replace('/', ' ')
-            price = extract_numeric_value(cols[2].text.strip())
-            g3d_mark = cols[3].text.strip()
-            videocard_value = cols[4].text.strip()
-            g2d_mark = cols[5].text.strip()
-            tdp = cols[6].text.strip()
-            power_perf = cols[7].text.strip()
-            vram = extract_numeric_value(cols[8].text.strip())  # Extract numeric value from VRAM
-            test_date = cols[9].text.strip()
-            category = cols[10].text.strip()
-            
-            data.append([
-                videocard_name,
-                price if price != 'NA' else '',
-                g3d_mark if g3d_mark != 'NA' else '',
-                videocard_value if videocard_value != 'NA' else '',
-                g2d_mark if g2d_mark != 'NA' else '',
-                tdp if tdp != 'NA' else '',
-                power_perf if power_perf != 'NA' else '',
-                vram if vram != 'NA' else '',
-                test_date,
-                category
-            ])
-    
-    return data
-
-def write_csv(data, filename):
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['videocard_name', 'price', 'g3d_mark', 'videocard_value', 'g2d_mark', 'tdp', 'power_perf', 'vram', 'test_date', 'category'])
-        writer.writerows(data)
+def parse_html_table(source):
+    """
+    Read the PassMark videocard table into a DataFrame.
+    `source` is a path to a saved page or a file object.
+    """
+    return read_passmark_table(source, GPU_COLUMNS)
 
 # Main execution
 html_content = """
@@ -123,7 +81,9 @@ html_content = """
 							<tbody><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=SudoMaker+Virtual+Display+Adapter&amp;id=5215">SudoMaker Virtual Display Adapter</a></td><td><a href="gpu.php?gpu=SudoMaker+Virtual+Display+Adapter&amp;id=5215#price">NA</a></td><td>20,290</td><td>NA</td><td>982</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Vega+8+Mobile+Ryzen+5+3500U&amp;id=6207">Radeon Vega 8 Mobile Ryzen 5 3500U</a></td><td><a href="gpu.php?gpu=Radeon+Vega+8+Mobile+Ryzen+5+3500U&amp;id=6207#price">NA</a></td><td>2,006</td><td>NA</td><td>406</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+3+3200U&amp;id=6717">Radeon Ryzen 3 3200U</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+3+3200U&amp;id=6717#price">NA</a></td><td>961</td><td>NA</td><td>348</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Eng+Sample%3A+100-000000149-40_40%2F30_Y&amp;id=6703">Radeon Eng Sample: 100-000000149-40_40/30_Y</a></td><td><a href="gpu.php?gpu=Radeon+Eng+Sample%3A+100-000000149-40_40%2F30_Y&amp;id=6703#price">NA</a></td><td>1,801</td><td>NA</td><td>598</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=mv+video+hook+driver2&amp;id=3298">mv video hook driver2</a></td><td><a href="gpu.php?gpu=mv+video+hook+driver2&amp;id=3298#price">NA</a></td><td>2,312</td><td>NA</td><td>404</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Moore+Threads+MTT+S30&amp;id=6731">Moore Threads MTT S30</a></td><td><a href="gpu.php?gpu=Moore+Threads+MTT+S30&amp;id=6731#price">NA</a></td><td>580</td><td>NA</td><td>529</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=MirrorOp+Virtual+Adaptor+Ryzen+7+PRO+5850U&amp;id=6689">MirrorOp Virtual Adaptor Ryzen 7 PRO 5850U</a></td><td><a href="gpu.php?gpu=MirrorOp+Virtual+Adaptor+Ryzen+7+PRO+5850U&amp;id=6689#price">NA</a></td><td>1,345</td><td>NA</td><td>439</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=MirrorOp+Virtual+Adaptor+Ryzen+5+Pro+7535U&amp;id=6727">MirrorOp Virtual Adaptor Ryzen 5 Pro 7535U</a></td><td><a href="gpu.php?gpu=MirrorOp+Virtual+Adaptor+Ryzen+5+Pro+7535U&amp;id=6727#price">NA</a></td><td>2,430</td><td>NA</td><td>610</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Meta+Virtual+Monitor+Ryzen+5+7600X+6-Core&amp;id=6713">Meta Virtual Monitor Ryzen 5 7600X 6-Core</a></td><td><a href="gpu.php?gpu=Meta+Virtual+Monitor+Ryzen+5+7600X+6-Core&amp;id=6713#price">NA</a></td><td>1,854</td><td>NA</td><td>570</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L40S-1Q&amp;id=6618">L40S-1Q</a></td><td><a href="gpu.php?gpu=L40S-1Q&amp;id=6618#price">NA</a></td><td>2,932</td><td>NA</td><td>79</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-8Q&amp;id=6659">L4-8Q</a></td><td><a href="gpu.php?gpu=L4-8Q&amp;id=6659#price">NA</a></td><td>5,707</td><td>NA</td><td>94</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-12Q&amp;id=6644">L4-12Q</a></td><td><a href="gpu.php?gpu=L4-12Q&amp;id=6644#price">NA</a></td><td>3,544</td><td>NA</td><td>88</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GRID+P4-2B4&amp;id=6654">GRID P4-2B4</a></td><td><a href="gpu.php?gpu=GRID+P4-2B4&amp;id=6654#price">NA</a></td><td>2,754</td><td>NA</td><td>31</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5050&amp;id=6668">GeForce RTX 5050</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5050&amp;id=6668#price">$269.99</a></td><td>17,326</td><td>64.17</td><td>1,113</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=DisplayLink+USB+Device+Ryzen+7+Pro+7735U&amp;id=6664">DisplayLink USB Device Ryzen 7 Pro 7735U</a></td><td><a href="gpu.php?gpu=DisplayLink+USB+Device+Ryzen+7+Pro+7735U&amp;id=6664#price">NA</a></td><td>2,678</td><td>NA</td><td>527</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=A10-4Q&amp;id=6658">A10-4Q</a></td><td><a href="gpu.php?gpu=A10-4Q&amp;id=6658#price">NA</a></td><td>2,765</td><td>NA</td><td>290</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Virtual+Desktop+Monitor&amp;id=5025">Virtual Desktop Monitor</a></td><td><a href="gpu.php?gpu=Virtual+Desktop+Monitor&amp;id=5025#price">NA</a></td><td>19,006</td><td>NA</td><td>1,083</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=SQExtFramebufferUmode+Device&amp;id=5050">SQExtFramebufferUmode Device</a></td><td><a href="gpu.php?gpu=SQExtFramebufferUmode+Device&amp;id=5050#price">NA</a></td><td>1,752</td><td>NA</td><td>337</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+6000+Blackwell+Max-Q+Workstation+Edition&amp;id=6527">RTX PRO 6000 Blackwell Max-Q Workstation Edition</a></td><td><a href="gpu.php?gpu=RTX+PRO+6000+Blackwell+Max-Q+Workstation+Edition&amp;id=6527#price">NA</a></td><td>32,721</td><td>NA</td><td>976</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+4000+Blackwell+Generation+Laptop+GPU&amp;id=6530">RTX PRO 4000 Blackwell Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+PRO+4000+Blackwell+Generation+Laptop+GPU&amp;id=6530#price">NA</a></td><td>30,028</td><td>NA</td><td>1,374</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+7+PRO+4700G&amp;id=6590">Radeon Ryzen 7 PRO 4700G</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+7+PRO+4700G&amp;id=6590#price">NA</a></td><td>2,148</td><td>NA</td><td>711</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+9060+XT+8GB&amp;id=6575">Radeon RX 9060 XT 8GB</a></td><td><a href="gpu.php?gpu=Radeon+RX+9060+XT+8GB&amp;id=6575#price">$279.99</a></td><td>20,548</td><td>73.39</td><td>1,226</td><td>150</td><td>136.99</td><td>8192 MB</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+9060+XT+16GB&amp;id=5957">Radeon RX 9060 XT 16GB</a></td><td><a href="gpu.php?gpu=Radeon+RX+9060+XT+16GB&amp;id=5957#price">$379.99</a></td><td>20,183</td><td>53.12</td><td>1,187</td><td>160</td><td>126.15</td><td>16384 MB</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Eng+Sample%3A+100-000000252-50_Y&amp;id=6605">Radeon Eng Sample: 100-000000252-50_Y</a></td><td><a href="gpu.php?gpu=Radeon+Eng+Sample%3A+100-000000252-50_Y&amp;id=6605#price">NA</a></td><td>2,411</td><td>NA</td><td>478</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Eng+Sample%3A+100-000000151-40_38%2F33_Y&amp;id=6436">Radeon Eng Sample: 100-000000151-40_38/33_Y</a></td><td><a href="gpu.php?gpu=Radeon+Eng+Sample%3A+100-000000151-40_38%2F33_Y&amp;id=6436#price">NA</a></td><td>1,367</td><td>NA</td><td>554</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+660M+Ryzen+5+7533HS&amp;id=6493">Radeon 660M Ryzen 5 7533HS</a></td><td><a href="gpu.php?gpu=Radeon+660M+Ryzen+5+7533HS&amp;id=6493#price">NA</a></td><td>2,666</td><td>NA</td><td>759</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Parsec+Virtual+Display+Adapter+Ryzen+5+5600GT&amp;id=6499">Parsec Virtual Display Adapter Ryzen 5 5600GT</a></td><td><a href="gpu.php?gpu=Parsec+Virtual+Display+Adapter+Ryzen+5+5600GT&amp;id=6499#price">NA</a></td><td>2,712</td><td>NA</td><td>799</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Meta+Virtual+Monitor+Ryzen+5+5625U&amp;id=6560">Meta Virtual Monitor Ryzen 5 5625U</a></td><td><a href="gpu.php?gpu=Meta+Virtual+Monitor+Ryzen+5+5625U&amp;id=6560#price">NA</a></td><td>1,009</td><td>NA</td><td>440</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L40S-8Q&amp;id=5762">L40S-8Q</a></td><td><a href="gpu.php?gpu=L40S-8Q&amp;id=5762#price">NA</a></td><td>5,094</td><td>NA</td><td>103</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=L40S-12A&amp;id=6570">L40S-12A</a></td><td><a href="gpu.php?gpu=L40S-12A&amp;id=6570#price">NA</a></td><td>3,660</td><td>NA</td><td>79</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Intel+1st+Generation+Intel+HD&amp;id=6471">Intel 1st Generation Intel HD</a></td><td><a href="gpu.php?gpu=Intel+1st+Generation+Intel+HD&amp;id=6471#price">NA</a></td><td>35</td><td>NA</td><td>8</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+P40-1Q&amp;id=5750">GRID P40-1Q</a></td><td><a href="gpu.php?gpu=GRID+P40-1Q&amp;id=5750#price">NA</a></td><td>7,572</td><td>NA</td><td>630</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GRID+P40-1B&amp;id=6555">GRID P40-1B</a></td><td><a href="gpu.php?gpu=GRID+P40-1B&amp;id=6555#price">NA</a></td><td>3,690</td><td>NA</td><td>90</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5050+Laptop+GPU&amp;id=6552">GeForce RTX 5050 Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5050+Laptop+GPU&amp;id=6552#price">NA</a></td><td>17,017</td><td>NA</td><td>930</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+3060&amp;id=6498">GeForce RTX 3060</a></td><td><a href="gpu.php?gpu=GeForce+RTX+3060&amp;id=6498#price">NA</a></td><td>17,116</td><td>NA</td><td>1,011</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+3050+Laptop+GPU&amp;id=6486">GeForce RTX 3050 Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+3050+Laptop+GPU&amp;id=6486#price">NA</a></td><td>12,144</td><td>NA</td><td>689</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=EIZO+Quadro+MED-XN92&amp;id=6509">EIZO Quadro MED-XN92</a></td><td><a href="gpu.php?gpu=EIZO+Quadro+MED-XN92&amp;id=6509#price">NA</a></td><td>17,036</td><td>NA</td><td>920</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+6000+Blackwell+Workstation+Edition&amp;id=6307">RTX PRO 6000 Blackwell Workstation Edition</a></td><td><a href="gpu.php?gpu=RTX+PRO+6000+Blackwell+Workstation+Edition&amp;id=6307#price">NA</a></td><td>30,249</td><td>NA</td><td>1,241</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+500+Blackwell+Generation+Laptop+GPU&amp;id=6346">RTX PRO 500 Blackwell Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+PRO+500+Blackwell+Generation+Laptop+GPU&amp;id=6346#price">NA</a></td><td>12,992</td><td>NA</td><td>948</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+3000+Blackwell+Generation+Laptop+GPU&amp;id=6377">RTX PRO 3000 Blackwell Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+PRO+3000+Blackwell+Generation+Laptop+GPU&amp;id=6377#price">NA</a></td><td>28,506</td><td>NA</td><td>1,044</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+Embedded+R2312&amp;id=6390">Radeon Ryzen Embedded R2312</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+Embedded+R2312&amp;id=6390#price">NA</a></td><td>837</td><td>NA</td><td>367</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+9+4950U+Mobile&amp;id=6301">Radeon Ryzen 9 4950U Mobile</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+9+4950U+Mobile&amp;id=6301#price">NA</a></td><td>2,594</td><td>NA</td><td>575</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+RX+9070+GRE&amp;id=6421">Radeon RX 9070 GRE</a></td><td><a href="gpu.php?gpu=Radeon+RX+9070+GRE&amp;id=6421#price">NA</a></td><td>20,506</td><td>NA</td><td>895</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+7650+GRE&amp;id=6308">Radeon RX 7650 GRE</a></td><td><a href="gpu.php?gpu=Radeon+RX+7650+GRE&amp;id=6308#price">NA</a></td><td>14,808</td><td>NA</td><td>1,133</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+PRO+V710+MxGPU&amp;id=5342">Radeon PRO V710 MxGPU</a></td><td><a href="gpu.php?gpu=Radeon+PRO+V710+MxGPU&amp;id=5342#price">NA</a></td><td>13,130</td><td>NA</td><td>981</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Mirage+Driver&amp;id=3284">Mirage Driver</a></td><td><a href="gpu.php?gpu=Mirage+Driver&amp;id=3284#price">NA</a></td><td>1,261</td><td>NA</td><td>225</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L40S-12Q&amp;id=6358">L40S-12Q</a></td><td><a href="gpu.php?gpu=L40S-12Q&amp;id=6358#price">NA</a></td><td>4,243</td><td>NA</td><td>74</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-2A&amp;id=6361">L4-2A</a></td><td><a href="gpu.php?gpu=L4-2A&amp;id=6361#price">NA</a></td><td>3,063</td><td>NA</td><td>64</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+Pro+140T+GPU&amp;id=6333">Intel Arc Pro 140T GPU</a></td><td><a href="gpu.php?gpu=Intel+Arc+Pro+140T+GPU&amp;id=6333#price">NA</a></td><td>6,703</td><td>NA</td><td>861</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+RTX8000P-1B&amp;id=6381">GRID RTX8000P-1B</a></td><td><a href="gpu.php?gpu=GRID+RTX8000P-1B&amp;id=6381#price">NA</a></td><td>1,054</td><td>NA</td><td>66</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5060+Laptop+GPU&amp;id=6330">GeForce RTX 5060 Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5060+Laptop+GPU&amp;id=6330#price">NA</a></td><td>18,852</td><td>NA</td><td>876</td><td>45</td><td>418.92</td><td>8192 MB</td><td class="sorting_1">May 2025</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Beijing+Fantasy+Technology+Fantasy+II-M&amp;id=6378">Beijing Fantasy Technology Fantasy II-M</a></td><td><a href="gpu.php?gpu=Beijing+Fantasy+Technology+Fantasy+II-M&amp;id=6378#price">NA</a></td><td>259</td><td>NA</td><td>125</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=RTXA5000-24Q&amp;id=6213">RTXA5000-24Q</a></td><td><a href="gpu.php?gpu=RTXA5000-24Q&amp;id=6213#price">NA</a></td><td>4,803</td><td>NA</td><td>78</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+2000+Blackwell+Generation+Laptop+GPU&amp;id=6259">RTX PRO 2000 Blackwell Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+PRO+2000+Blackwell+Generation+Laptop+GPU&amp;id=6259#price">NA</a></td><td>16,600</td><td>NA</td><td>792</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+PRO+1000+Blackwell+Generation+Laptop+GPU&amp;id=6258">RTX PRO 1000 Blackwell Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+PRO+1000+Blackwell+Generation+Laptop+GPU&amp;id=6258#price">NA</a></td><td>16,400</td><td>NA</td><td>778</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RadeonT+Ryzen+3+3250U&amp;id=6243">RadeonT Ryzen 3 3250U</a></td><td><a href="gpu.php?gpu=RadeonT+Ryzen+3+3250U&amp;id=6243#price">NA</a></td><td>582</td><td>NA</td><td>226</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+Vega+8+Ryzen+5+3500C&amp;id=6106">Radeon Vega 8 Ryzen 5 3500C</a></td><td><a href="gpu.php?gpu=Radeon+Vega+8+Ryzen+5+3500C&amp;id=6106#price">NA</a></td><td>1,410</td><td>NA</td><td>388</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+7533HS&amp;id=6178">Radeon Ryzen 5 7533HS</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+7533HS&amp;id=6178#price">NA</a></td><td>3,523</td><td>NA</td><td>650</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+Vega+Ryzen+5+5600GT&amp;id=6166">Radeon RX Vega Ryzen 5 5600GT</a></td><td><a href="gpu.php?gpu=Radeon+RX+Vega+Ryzen+5+5600GT&amp;id=6166#price">NA</a></td><td>9,558</td><td>NA</td><td>1,042</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+RX+Vega+11+Ryzen+5+3350GE&amp;id=6103">Radeon RX Vega 11 Ryzen 5 3350GE</a></td><td><a href="gpu.php?gpu=Radeon+RX+Vega+11+Ryzen+5+3350GE&amp;id=6103#price">NA</a></td><td>2,480</td><td>NA</td><td>499</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Eng+Sample%3A+100-000000146-20_37%2F30_Y&amp;id=6212">Radeon Eng Sample: 100-000000146-20_37/30_Y</a></td><td><a href="gpu.php?gpu=Radeon+Eng+Sample%3A+100-000000146-20_37%2F30_Y&amp;id=6212#price">NA</a></td><td>2,124</td><td>NA</td><td>612</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+840M&amp;id=6105">Radeon 840M</a></td><td><a href="gpu.php?gpu=Radeon+840M&amp;id=6105#price">NA</a></td><td>3,914</td><td>NA</td><td>883</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=nVidia+L20&amp;id=6257">nVidia L20</a></td><td><a href="gpu.php?gpu=nVidia+L20&amp;id=6257#price">NA</a></td><td>13,430</td><td>NA</td><td>1,397</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=L40S-48Q&amp;id=6220">L40S-48Q</a></td><td><a href="gpu.php?gpu=L40S-48Q&amp;id=6220#price">NA</a></td><td>3,869</td><td>NA</td><td>78</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L40S-24Q&amp;id=6172">L40S-24Q</a></td><td><a href="gpu.php?gpu=L40S-24Q&amp;id=6172#price">NA</a></td><td>4,036</td><td>NA</td><td>85</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+V100-16Q&amp;id=6141">GRID V100-16Q</a></td><td><a href="gpu.php?gpu=GRID+V100-16Q&amp;id=6141#price">NA</a></td><td>1,272</td><td>NA</td><td>31</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+RTX6000-8Q&amp;id=6164">GRID RTX6000-8Q</a></td><td><a href="gpu.php?gpu=GRID+RTX6000-8Q&amp;id=6164#price">NA</a></td><td>4,514</td><td>NA</td><td>102</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5070+Ti+Laptop+GPU&amp;id=6216">GeForce RTX 5070 Ti Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5070+Ti+Laptop+GPU&amp;id=6216#price">NA</a></td><td>24,004</td><td>NA</td><td>981</td><td>60</td><td>400.06</td><td>12288 MB</td><td class="sorting_1">Apr 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5070+Laptop+GPU&amp;id=6260">GeForce RTX 5070 Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5070+Laptop+GPU&amp;id=6260#price">NA</a></td><td>20,355</td><td>NA</td><td>896</td><td>50</td><td>407.11</td><td>8192 MB</td><td class="sorting_1">Apr 2025</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5060+Ti+8GB&amp;id=6441">GeForce RTX 5060 Ti 8GB</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5060+Ti+8GB&amp;id=6441#price">$379.99</a></td><td>22,670</td><td>59.66</td><td>1,207</td><td>180</td><td>125.94</td><td>8192 MB</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5060+Ti+16GB&amp;id=6160">GeForce RTX 5060 Ti 16GB</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5060+Ti+16GB&amp;id=6160#price">$429.99</a></td><td>22,921</td><td>53.31</td><td>1,215</td><td>180</td><td>127.34</td><td>16384 MB</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=EIZO+Quadro+MED-XN31LP&amp;id=6187">EIZO Quadro MED-XN31LP</a></td><td><a href="gpu.php?gpu=EIZO+Quadro+MED-XN31LP&amp;id=6187#price">NA</a></td><td>1,648</td><td>NA</td><td>573</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=A16-16Q&amp;id=6151">A16-16Q</a></td><td><a href="gpu.php?gpu=A16-16Q&amp;id=6151#price">NA</a></td><td>4,451</td><td>NA</td><td>76</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=XiaoMi+9+Adreno+640+GPU&amp;id=6031">XiaoMi 9 Adreno 640 GPU</a></td><td><a href="gpu.php?gpu=XiaoMi+9+Adreno+640+GPU&amp;id=6031#price">NA</a></td><td>585</td><td>NA</td><td>213</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+Z2+Go&amp;id=5988">Radeon Ryzen Z2 Go</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+Z2+Go&amp;id=5988#price">NA</a></td><td>5,005</td><td>NA</td><td>739</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+Vega+Ryzen+7+5825U&amp;id=6028">Radeon RX Vega Ryzen 7 5825U</a></td><td><a href="gpu.php?gpu=Radeon+RX+Vega+Ryzen+7+5825U&amp;id=6028#price">NA</a></td><td>2,916</td><td>NA</td><td>549</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+9070+XT&amp;id=5956">Radeon RX 9070 XT</a></td><td><a href="gpu.php?gpu=Radeon+RX+9070+XT&amp;id=5956#price">$719.99</a></td><td>26,795</td><td>37.22</td><td>1,328</td><td>304</td><td>88.14</td><td>16384 MB</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+9070&amp;id=5958">Radeon RX 9070</a></td><td><a href="gpu.php?gpu=Radeon+RX+9070&amp;id=5958#price">$669.99</a></td><td>25,381</td><td>37.88</td><td>1,280</td><td>220</td><td>115.37</td><td>16384 MB</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+RX+5700m+8GB+256+bit+Ryzen+5+5600U&amp;id=6073">Radeon RX 5700m 8GB 256 bit Ryzen 5 5600U</a></td><td><a href="gpu.php?gpu=Radeon+RX+5700m+8GB+256+bit+Ryzen+5+5600U&amp;id=6073#price">NA</a></td><td>1,599</td><td>NA</td><td>560</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+Pro+W6900X&amp;id=6001">Radeon Pro W6900X</a></td><td><a href="gpu.php?gpu=Radeon+Pro+W6900X&amp;id=6001#price">NA</a></td><td>17,413</td><td>NA</td><td>782</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Eng+Sample%3A+100-000000144-40_38%2F38_Y&amp;id=6022">Radeon Eng Sample: 100-000000144-40_38/38_Y</a></td><td><a href="gpu.php?gpu=Radeon+Eng+Sample%3A+100-000000144-40_38%2F38_Y&amp;id=6022#price">NA</a></td><td>1,659</td><td>NA</td><td>563</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Eng+Sample%3A+100-000000098-40_39%2F27_Y&amp;id=6079">Radeon Eng Sample: 100-000000098-40_39/27_Y</a></td><td><a href="gpu.php?gpu=Radeon+Eng+Sample%3A+100-000000098-40_39%2F27_Y&amp;id=6079#price">NA</a></td><td>1,743</td><td>NA</td><td>525</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+680M+Ryzen+9+6900HX&amp;id=6080">Radeon 680M Ryzen 9 6900HX</a></td><td><a href="gpu.php?gpu=Radeon+680M+Ryzen+9+6900HX&amp;id=6080#price">NA</a></td><td>5,614</td><td>NA</td><td>947</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+660M+Ryzen+3+7335U&amp;id=6027">Radeon 660M Ryzen 3 7335U</a></td><td><a href="gpu.php?gpu=Radeon+660M+Ryzen+3+7335U&amp;id=6027#price">NA</a></td><td>2,248</td><td>NA</td><td>739</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Moore+Threads+MTT+S80&amp;id=6007">Moore Threads MTT S80</a></td><td><a href="gpu.php?gpu=Moore+Threads+MTT+S80&amp;id=6007#price">NA</a></td><td>2,513</td><td>NA</td><td>846</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Intel+Arc+A380E&amp;id=5936">Intel Arc A380E</a></td><td><a href="gpu.php?gpu=Intel+Arc+A380E&amp;id=5936#price">NA</a></td><td>6,438</td><td>NA</td><td>793</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Inspiration+CG620+MxGPU&amp;id=6005">Inspiration CG620 MxGPU</a></td><td><a href="gpu.php?gpu=Inspiration+CG620+MxGPU&amp;id=6005#price">NA</a></td><td>9,106</td><td>NA</td><td>812</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+P4-4A&amp;id=6006">GRID P4-4A</a></td><td><a href="gpu.php?gpu=GRID+P4-4A&amp;id=6006#price">NA</a></td><td>3,240</td><td>NA</td><td>51</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+P4-2A&amp;id=5929">GRID P4-2A</a></td><td><a href="gpu.php?gpu=GRID+P4-2A&amp;id=5929#price">NA</a></td><td>3,307</td><td>NA</td><td>56</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5080+Laptop+GPU&amp;id=6099">GeForce RTX 5080 Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5080+Laptop+GPU&amp;id=6099#price">NA</a></td><td>27,711</td><td>NA</td><td>1,095</td><td>80</td><td>346.39</td><td>16384 MB</td><td class="sorting_1">Mar 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5070&amp;id=5940">GeForce RTX 5070</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5070&amp;id=5940#price">$599.99</a></td><td>29,137</td><td>48.56</td><td>1,305</td><td>250</td><td>116.55</td><td>12288 MB</td><td class="sorting_1">Mar 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+A2000+Embedded+GPU&amp;id=5760">RTX A2000 Embedded GPU</a></td><td><a href="gpu.php?gpu=RTX+A2000+Embedded+GPU&amp;id=5760#price">NA</a></td><td>10,860</td><td>NA</td><td>431</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+7+PRO+5755GE&amp;id=5816">Radeon Ryzen 7 PRO 5755GE</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+7+PRO+5755GE&amp;id=5816#price">NA</a></td><td>2,117</td><td>NA</td><td>700</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+3+PRO+5355GE&amp;id=5763">Radeon Ryzen 3 PRO 5355GE</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+3+PRO+5355GE&amp;id=5763#price">NA</a></td><td>1,952</td><td>NA</td><td>700</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+Vega+10+Ryzen+7+3700C&amp;id=5869">Radeon RX Vega 10 Ryzen 7 3700C</a></td><td><a href="gpu.php?gpu=Radeon+RX+Vega+10+Ryzen+7+3700C&amp;id=5869#price">NA</a></td><td>1,166</td><td>NA</td><td>312</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-6Q&amp;id=5747">L4-6Q</a></td><td><a href="gpu.php?gpu=L4-6Q&amp;id=5747#price">NA</a></td><td>4,473</td><td>NA</td><td>71</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-2Q&amp;id=5834">L4-2Q</a></td><td><a href="gpu.php?gpu=L4-2Q&amp;id=5834#price">NA</a></td><td>4,062</td><td>NA</td><td>62</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-1Q&amp;id=5788">L4-1Q</a></td><td><a href="gpu.php?gpu=L4-1Q&amp;id=5788#price">NA</a></td><td>259</td><td>NA</td><td>84</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=L2&amp;id=5775">L2</a></td><td><a href="gpu.php?gpu=L2&amp;id=5775#price">NA</a></td><td>5,467</td><td>NA</td><td>88</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+130T+GPU&amp;id=5871">Intel Arc 130T GPU</a></td><td><a href="gpu.php?gpu=Intel+Arc+130T+GPU&amp;id=5871#price">NA</a></td><td>6,402</td><td>NA</td><td>854</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Horizon+Indirect+Display+Driver&amp;id=5784">Horizon Indirect Display Driver</a></td><td><a href="gpu.php?gpu=Horizon+Indirect+Display+Driver&amp;id=5784#price">NA</a></td><td>84</td><td>NA</td><td>331</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5090+Laptop+GPU&amp;id=5754">GeForce RTX 5090 Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5090+Laptop+GPU&amp;id=5754#price">NA</a></td><td>30,034</td><td>NA</td><td>1,057</td><td>95</td><td>316.15</td><td>24576 MB</td><td class="sorting_1">Feb 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5090+D&amp;id=5898">GeForce RTX 5090 D</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5090+D&amp;id=5898#price">NA</a></td><td>44,065</td><td>NA</td><td>1,487</td><td>575</td><td>76.64</td><td>32768 MB</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5070+Ti&amp;id=5878">GeForce RTX 5070 Ti</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5070+Ti&amp;id=5878#price">$869.99</a></td><td>32,974</td><td>37.90</td><td>1,332</td><td>300</td><td>109.91</td><td>16384 MB</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GeForce+GT+1010&amp;id=5791">GeForce GT 1010</a></td><td><a href="gpu.php?gpu=GeForce+GT+1010&amp;id=5791#price">NA</a></td><td>1,208</td><td>NA</td><td>252</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Eng+Sample%3A+100-000000562-40_Y&amp;id=5947">Eng Sample: 100-000000562-40_Y</a></td><td><a href="gpu.php?gpu=Eng+Sample%3A+100-000000562-40_Y&amp;id=5947#price">NA</a></td><td>2,370</td><td>NA</td><td>768</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=EIZO+Quadro+MED-XN71&amp;id=5757">EIZO Quadro MED-XN71</a></td><td><a href="gpu.php?gpu=EIZO+Quadro+MED-XN71&amp;id=5757#price">NA</a></td><td>8,518</td><td>NA</td><td>583</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=EIZO+MED-XN44&amp;id=5814">EIZO MED-XN44</a></td><td><a href="gpu.php?gpu=EIZO+MED-XN44&amp;id=5814#price">NA</a></td><td>5,049</td><td>NA</td><td>821</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=A16-1Q&amp;id=5827">A16-1Q</a></td><td><a href="gpu.php?gpu=A16-1Q&amp;id=5827#price">NA</a></td><td>3,276</td><td>NA</td><td>66</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=A16-1B&amp;id=5836">A16-1B</a></td><td><a href="gpu.php?gpu=A16-1B&amp;id=5836#price">NA</a></td><td>2,220</td><td>NA</td><td>72</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=6FDF%3AFF&amp;id=5867">6FDF:FF</a></td><td><a href="gpu.php?gpu=6FDF%3AFF&amp;id=5867#price">NA</a></td><td>9,529</td><td>NA</td><td>682</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=VMware+Horizon+Indirect+Display+Driver&amp;id=5706">VMware Horizon Indirect Display Driver</a></td><td><a href="gpu.php?gpu=VMware+Horizon+Indirect+Display+Driver&amp;id=5706#price">NA</a></td><td>3,565</td><td>NA</td><td>376</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=RTXA5000-8Q&amp;id=5640">RTXA5000-8Q</a></td><td><a href="gpu.php?gpu=RTXA5000-8Q&amp;id=5640#price">NA</a></td><td>4,916</td><td>NA</td><td>117</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+Vega+3+Athlon+Gold+PRO+3150G&amp;id=5680">Radeon Vega 3 Athlon Gold PRO 3150G</a></td><td><a href="gpu.php?gpu=Radeon+Vega+3+Athlon+Gold+PRO+3150G&amp;id=5680#price">NA</a></td><td>837</td><td>NA</td><td>311</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+PRO+4400G&amp;id=5657">Radeon Ryzen 5 PRO 4400G</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+PRO+4400G&amp;id=5657#price">NA</a></td><td>2,277</td><td>NA</td><td>647</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+7800M&amp;id=5646">Radeon RX 7800M</a></td><td><a href="gpu.php?gpu=Radeon+RX+7800M&amp;id=5646#price">NA</a></td><td>16,537</td><td>NA</td><td>869</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Moore+Threads+S3000+MTvGPU-1132&amp;id=5648">Moore Threads S3000 MTvGPU-1132</a></td><td><a href="gpu.php?gpu=Moore+Threads+S3000+MTvGPU-1132&amp;id=5648#price">NA</a></td><td>1,997</td><td>NA</td><td>315</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+B570&amp;id=5652">Intel Arc B570</a></td><td><a href="gpu.php?gpu=Intel+Arc+B570&amp;id=5652#price">NA</a></td><td>14,195</td><td>NA</td><td>661</td><td>150</td><td>94.63</td><td>10240 MB</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+RTX6000-4Q&amp;id=5674">GRID RTX6000-4Q</a></td><td><a href="gpu.php?gpu=GRID+RTX6000-4Q&amp;id=5674#price">NA</a></td><td>509</td><td>NA</td><td>18</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5090&amp;id=5725">GeForce RTX 5090</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5090&amp;id=5725#price">$2,639.99</a></td><td>39,650</td><td>15.02</td><td>1,413</td><td>575</td><td>68.96</td><td>32768 MB</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5080&amp;id=5721">GeForce RTX 5080</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5080&amp;id=5721#price">$1,264.99</a></td><td>36,565</td><td>28.91</td><td>1,415</td><td>360</td><td>101.57</td><td>16384 MB</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Eng+Sample%3A+100-000000561-40_Y&amp;id=5946">Eng Sample: 100-000000561-40_Y</a></td><td><a href="gpu.php?gpu=Eng+Sample%3A+100-000000561-40_Y&amp;id=5946#price">NA</a></td><td>4,206</td><td>NA</td><td>749</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=A40-2Q&amp;id=5665">A40-2Q</a></td><td><a href="gpu.php?gpu=A40-2Q&amp;id=5665#price">NA</a></td><td>2,960</td><td>NA</td><td>81</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jan 2025</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=VirtualMonitor+Device&amp;id=5023">VirtualMonitor Device</a></td><td><a href="gpu.php?gpu=VirtualMonitor+Device&amp;id=5023#price">NA</a></td><td>2,131</td><td>NA</td><td>485</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+5000+Ada+Generation+Embedded+GPU&amp;id=5277">RTX 5000 Ada Generation Embedded GPU</a></td><td><a href="gpu.php?gpu=RTX+5000+Ada+Generation+Embedded+GPU&amp;id=5277#price">NA</a></td><td>20,312</td><td>NA</td><td>702</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+3500+Ada+Generation+Embedded+GPU&amp;id=5276">RTX 3500 Ada Generation Embedded GPU</a></td><td><a href="gpu.php?gpu=RTX+3500+Ada+Generation+Embedded+GPU&amp;id=5276#price">NA</a></td><td>25,189</td><td>NA</td><td>1,242</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RadeonT+680M+Ryzen+7+6800H&amp;id=4806">RadeonT 680M Ryzen 7 6800H</a></td><td><a href="gpu.php?gpu=RadeonT+680M+Ryzen+7+6800H&amp;id=4806#price">NA</a></td><td>2,381</td><td>NA</td><td>521</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=RadeonT+660M+Ryzen+5+6600H&amp;id=4856">RadeonT 660M Ryzen 5 6600H</a></td><td><a href="gpu.php?gpu=RadeonT+660M+Ryzen+5+6600H&amp;id=4856#price">NA</a></td><td>4,257</td><td>NA</td><td>427</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+3550H&amp;id=5273">Radeon Ryzen 5 3550H</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+3550H&amp;id=5273#price">NA</a></td><td>1,620</td><td>NA</td><td>377</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+RX+7500&amp;id=5457">Radeon RX 7500</a></td><td><a href="gpu.php?gpu=Radeon+RX+7500&amp;id=5457#price">NA</a></td><td>1,873</td><td>NA</td><td>572</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Pro+V620+MxGPU&amp;id=5078">Radeon Pro V620 MxGPU</a></td><td><a href="gpu.php?gpu=Radeon+Pro+V620+MxGPU&amp;id=5078#price">NA</a></td><td>15,633</td><td>NA</td><td>653</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+860M&amp;id=5320">Radeon 860M</a></td><td><a href="gpu.php?gpu=Radeon+860M&amp;id=5320#price">NA</a></td><td>4,808</td><td>NA</td><td>913</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+8060S&amp;id=5327">Radeon 8060S</a></td><td><a href="gpu.php?gpu=Radeon+8060S&amp;id=5327#price">NA</a></td><td>17,641</td><td>NA</td><td>1,183</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+8050S&amp;id=5322">Radeon 8050S</a></td><td><a href="gpu.php?gpu=Radeon+8050S&amp;id=5322#price">NA</a></td><td>15,774</td><td>NA</td><td>1,101</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+680M&amp;id=5216">Radeon 680M</a></td><td><a href="gpu.php?gpu=Radeon+680M&amp;id=5216#price">NA</a></td><td>4,593</td><td>NA</td><td>793</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+660M&amp;id=5062">Radeon 660M</a></td><td><a href="gpu.php?gpu=Radeon+660M&amp;id=5062#price">NA</a></td><td>3,280</td><td>NA</td><td>648</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Meta+Virtual+Monitor&amp;id=5018">Meta Virtual Monitor</a></td><td><a href="gpu.php?gpu=Meta+Virtual+Monitor&amp;id=5018#price">NA</a></td><td>21,467</td><td>NA</td><td>1,138</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+B580&amp;id=5306">Intel Arc B580</a></td><td><a href="gpu.php?gpu=Intel+Arc+B580&amp;id=5306#price">$249.00*</a></td><td>15,748</td><td>63.24</td><td>709</td><td>190</td><td>82.88</td><td>12288 MB</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+RTX6000-2Q&amp;id=5408">GRID RTX6000-2Q</a></td><td><a href="gpu.php?gpu=GRID+RTX6000-2Q&amp;id=5408#price">NA</a></td><td>656</td><td>NA</td><td>89</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Fresco+Logic+IDDCX+Adapter&amp;id=3796">Fresco Logic IDDCX Adapter</a></td><td><a href="gpu.php?gpu=Fresco+Logic+IDDCX+Adapter&amp;id=3796#price">NA</a></td><td>1,276</td><td>NA</td><td>288</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=A10-12Q&amp;id=5065">A10-12Q</a></td><td><a href="gpu.php?gpu=A10-12Q&amp;id=5065#price">NA</a></td><td>9,493</td><td>NA</td><td>627</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Dec 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+7+9800X3D+8-Core+Processor&amp;id=5953">Ryzen 7 9800X3D 8-Core Processor</a></td><td><a href="gpu.php?gpu=Ryzen+7+9800X3D+8-Core+Processor&amp;id=5953#price">NA</a></td><td>1,830</td><td>NA</td><td>630</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+A500+Embedded+GPU&amp;id=5223">RTX A500 Embedded GPU</a></td><td><a href="gpu.php?gpu=RTX+A500+Embedded+GPU&amp;id=5223#price">NA</a></td><td>5,405</td><td>NA</td><td>299</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+7+6810U&amp;id=5210">Radeon Ryzen 7 6810U</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+7+6810U&amp;id=5210#price">NA</a></td><td>5,937</td><td>NA</td><td>897</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+PRO+5655G&amp;id=5208">Radeon Ryzen 5 PRO 5655G</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+PRO+5655G&amp;id=5208#price">NA</a></td><td>2,504</td><td>NA</td><td>793</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+6600+LE&amp;id=5228">Radeon RX 6600 LE</a></td><td><a href="gpu.php?gpu=Radeon+RX+6600+LE&amp;id=5228#price">NA</a></td><td>15,582</td><td>NA</td><td>1,036</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+6300M&amp;id=5214">Radeon RX 6300M</a></td><td><a href="gpu.php?gpu=Radeon+RX+6300M&amp;id=5214#price">NA</a></td><td>6,421</td><td>NA</td><td>384</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+Pro+W6800X+Duo&amp;id=5209">Radeon Pro W6800X Duo</a></td><td><a href="gpu.php?gpu=Radeon+Pro+W6800X+Duo&amp;id=5209#price">NA</a></td><td>15,557</td><td>NA</td><td>702</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+610M+Ryzen+9+7940HX&amp;id=4987">Radeon 610M Ryzen 9 7940HX</a></td><td><a href="gpu.php?gpu=Radeon+610M+Ryzen+9+7940HX&amp;id=4987#price">NA</a></td><td>1,560</td><td>NA</td><td>520</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=P102-100&amp;id=5224">P102-100</a></td><td><a href="gpu.php?gpu=P102-100&amp;id=5224#price">NA</a></td><td>2,911</td><td>NA</td><td>129</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=L40-6Q&amp;id=5229">L40-6Q</a></td><td><a href="gpu.php?gpu=L40-6Q&amp;id=5229#price">NA</a></td><td>4,718</td><td>NA</td><td>94</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+140T&amp;id=5222">Intel Arc 140T</a></td><td><a href="gpu.php?gpu=Intel+Arc+140T&amp;id=5222#price">NA</a></td><td>5,635</td><td>NA</td><td>688</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Eng+Sample%3A+100-000000560-40_Y&amp;id=5945">Eng Sample: 100-000000560-40_Y</a></td><td><a href="gpu.php?gpu=Eng+Sample%3A+100-000000560-40_Y&amp;id=5945#price">NA</a></td><td>5,656</td><td>NA</td><td>771</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Nov 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=ZX+C-960&amp;id=5184">ZX C-960</a></td><td><a href="gpu.php?gpu=ZX+C-960&amp;id=5184#price">NA</a></td><td>65</td><td>NA</td><td>104</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Oct 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Vega+3+Ryzen+Embedded+R1606G&amp;id=5192">Radeon Vega 3 Ryzen Embedded R1606G</a></td><td><a href="gpu.php?gpu=Radeon+Vega+3+Ryzen+Embedded+R1606G&amp;id=5192#price">NA</a></td><td>857</td><td>NA</td><td>289</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Oct 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Lebo+Virtual+USB+Monitor&amp;id=4176">Lebo Virtual USB Monitor</a></td><td><a href="gpu.php?gpu=Lebo+Virtual+USB+Monitor&amp;id=4176#price">NA</a></td><td>1,790</td><td>NA</td><td>398</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Oct 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+130V+GPU&amp;id=5185">Intel Arc 130V GPU</a></td><td><a href="gpu.php?gpu=Intel+Arc+130V+GPU&amp;id=5185#price">NA</a></td><td>4,599</td><td>NA</td><td>623</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Oct 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+RTX8000P-4Q&amp;id=5199">GRID RTX8000P-4Q</a></td><td><a href="gpu.php?gpu=GRID+RTX8000P-4Q&amp;id=5199#price">NA</a></td><td>5,174</td><td>NA</td><td>87</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Oct 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=A16-16A&amp;id=5188">A16-16A</a></td><td><a href="gpu.php?gpu=A16-16A&amp;id=5188#price">NA</a></td><td>1,069</td><td>NA</td><td>38</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Oct 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Snapdragon+X+Elite+-+X1E001DE+-+Qualcomm+Adreno+GP&amp;id=5178">Snapdragon X Elite - X1E001DE - Qualcomm Adreno GP</a></td><td><a href="gpu.php?gpu=Snapdragon+X+Elite+-+X1E001DE+-+Qualcomm+Adreno+GP&amp;id=5178#price">NA</a></td><td>3,246</td><td>NA</td><td>347</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+9+9900X+12-Core+Processor&amp;id=5952">Ryzen 9 9900X 12-Core Processor</a></td><td><a href="gpu.php?gpu=Ryzen+9+9900X+12-Core+Processor&amp;id=5952#price">NA</a></td><td>1,729</td><td>NA</td><td>599</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+7+PRO+6850H+with+Radeon+Graphics&amp;id=5944">Ryzen 7 PRO 6850H with Radeon Graphics</a></td><td><a href="gpu.php?gpu=Ryzen+7+PRO+6850H+with+Radeon+Graphics&amp;id=5944#price">NA</a></td><td>5,791</td><td>NA</td><td>902</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+7+9700X+8-Core+Processor&amp;id=5950">Ryzen 7 9700X 8-Core Processor</a></td><td><a href="gpu.php?gpu=Ryzen+7+9700X+8-Core+Processor&amp;id=5950#price">NA</a></td><td>2,251</td><td>NA</td><td>647</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+5+9600X+6-Core+Processor&amp;id=5951">Ryzen 5 9600X 6-Core Processor</a></td><td><a href="gpu.php?gpu=Ryzen+5+9600X+6-Core+Processor&amp;id=5951#price">NA</a></td><td>1,859</td><td>NA</td><td>631</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+PRO+5655GE&amp;id=5175">Radeon Ryzen 5 PRO 5655GE</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+PRO+5655GE&amp;id=5175#price">NA</a></td><td>1,801</td><td>NA</td><td>644</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+7600X3D+6-Core&amp;id=5167">Radeon Ryzen 5 7600X3D 6-Core</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+7600X3D+6-Core&amp;id=5167#price">NA</a></td><td>1,827</td><td>NA</td><td>573</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Qualcomm+Adreno+X1-45+GPU&amp;id=5168">Qualcomm Adreno X1-45 GPU</a></td><td><a href="gpu.php?gpu=Qualcomm+Adreno+X1-45+GPU&amp;id=5168#price">NA</a></td><td>1,837</td><td>NA</td><td>362</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Intel+UHD+770%230x1c005d839205d7e9%23&amp;id=5179">Intel UHD 770#0x1c005d839205d7e9#</a></td><td><a href="gpu.php?gpu=Intel+UHD+770%230x1c005d839205d7e9%23&amp;id=5179#price">NA</a></td><td>1,759</td><td>NA</td><td>489</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+140V+GPU&amp;id=5176">Intel Arc 140V GPU</a></td><td><a href="gpu.php?gpu=Intel+Arc+140V+GPU&amp;id=5176#price">NA</a></td><td>5,236</td><td>NA</td><td>669</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+3050+A+Laptop+GPU&amp;id=5172">GeForce RTX 3050 A Laptop GPU</a></td><td><a href="gpu.php?gpu=GeForce+RTX+3050+A+Laptop+GPU&amp;id=5172#price">NA</a></td><td>11,664</td><td>NA</td><td>526</td><td>35</td><td>333.25</td><td>4096 MB</td><td class="sorting_1">Sep 2024</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=EIZO+Quadro+MED-XN72&amp;id=5174">EIZO Quadro MED-XN72</a></td><td><a href="gpu.php?gpu=EIZO+Quadro+MED-XN72&amp;id=5174#price">NA</a></td><td>9,037</td><td>NA</td><td>661</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Sep 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=USB+Mobile+Monitor+Virtual+Display&amp;id=5022">USB Mobile Monitor Virtual Display</a></td><td><a href="gpu.php?gpu=USB+Mobile+Monitor+Virtual+Display&amp;id=5022#price">NA</a></td><td>15,222</td><td>NA</td><td>755</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+9+9950X+16-Core+Processor&amp;id=5949">Ryzen 9 9950X 16-Core Processor</a></td><td><a href="gpu.php?gpu=Ryzen+9+9950X+16-Core+Processor&amp;id=5949#price">NA</a></td><td>1,770</td><td>NA</td><td>613</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+A400&amp;id=5160">RTX A400</a></td><td><a href="gpu.php?gpu=RTX+A400&amp;id=5160#price">NA</a></td><td>5,943</td><td>NA</td><td>893</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+5880+Ada+Generation&amp;id=5146">RTX 5880 Ada Generation</a></td><td><a href="gpu.php?gpu=RTX+5880+Ada+Generation&amp;id=5146#price">NA</a></td><td>23,751</td><td>NA</td><td>666</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+6650M+XT&amp;id=5157">Radeon RX 6650M XT</a></td><td><a href="gpu.php?gpu=Radeon+RX+6650M+XT&amp;id=5157#price">NA</a></td><td>17,071</td><td>NA</td><td>688</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+890M&amp;id=5113">Radeon 890M</a></td><td><a href="gpu.php?gpu=Radeon+890M&amp;id=5113#price">NA</a></td><td>8,270</td><td>NA</td><td>981</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+880M&amp;id=5123">Radeon 880M</a></td><td><a href="gpu.php?gpu=Radeon+880M&amp;id=5123#price">NA</a></td><td>7,676</td><td>NA</td><td>983</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Mobile</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Intel+UHD+770&amp;id=5132">Intel UHD 770</a></td><td><a href="gpu.php?gpu=Intel+UHD+770&amp;id=5132#price">NA</a></td><td>1,017</td><td>NA</td><td>673</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+Pro&amp;id=5125">Intel Arc Pro</a></td><td><a href="gpu.php?gpu=Intel+Arc+Pro&amp;id=5125#price">NA</a></td><td>5,775</td><td>NA</td><td>700</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Custom+GPU+0932&amp;id=5164">Custom GPU 0932</a></td><td><a href="gpu.php?gpu=Custom+GPU+0932&amp;id=5164#price">NA</a></td><td>3,255</td><td>NA</td><td>343</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Aug 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+5+7430U+with+Radeon+Graphics&amp;id=5948">Ryzen 5 7430U with Radeon Graphics</a></td><td><a href="gpu.php?gpu=Ryzen+5+7430U+with+Radeon+Graphics&amp;id=5948#price">NA</a></td><td>2,270</td><td>NA</td><td>586</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+A1000&amp;id=5118">RTX A1000</a></td><td><a href="gpu.php?gpu=RTX+A1000&amp;id=5118#price">NA</a></td><td>10,764</td><td>NA</td><td>1,098</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+PRO+6650H&amp;id=4858">Radeon Ryzen 5 PRO 6650H</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+PRO+6650H&amp;id=4858#price">NA</a></td><td>2,679</td><td>NA</td><td>580</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4124P+4-Core&amp;id=5108">Radeon EPYC 4124P 4-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4124P+4-Core&amp;id=5108#price">NA</a></td><td>1,322</td><td>NA</td><td>481</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Qualcomm+Adreno+X1-85+GPU&amp;id=5116">Qualcomm Adreno X1-85 GPU</a></td><td><a href="gpu.php?gpu=Qualcomm+Adreno+X1-85+GPU&amp;id=5116#price">NA</a></td><td>2,982</td><td>NA</td><td>474</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+HD+4600+manual-gen9_2015-134121&amp;id=5114">Intel HD 4600 manual-gen9_2015-134121</a></td><td><a href="gpu.php?gpu=Intel+HD+4600+manual-gen9_2015-134121&amp;id=5114#price">NA</a></td><td>620</td><td>NA</td><td>334</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jul 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Snapdragon+X+Elite+-+X1E84100+-+Qualcomm+Adreno+GP&amp;id=5101">Snapdragon X Elite - X1E84100 - Qualcomm Adreno GP</a></td><td><a href="gpu.php?gpu=Snapdragon+X+Elite+-+X1E84100+-+Qualcomm+Adreno+GP&amp;id=5101#price">NA</a></td><td>2,981</td><td>NA</td><td>518</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Snapdragon+X+Elite+-+X1E80100+-+Qualcomm+Adreno+GP&amp;id=5098">Snapdragon X Elite - X1E80100 - Qualcomm Adreno GP</a></td><td><a href="gpu.php?gpu=Snapdragon+X+Elite+-+X1E80100+-+Qualcomm+Adreno+GP&amp;id=5098#price">NA</a></td><td>2,604</td><td>NA</td><td>497</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Snapdragon+X+Elite+-+X1E78100+-+Qualcomm+Adreno+GP&amp;id=5096">Snapdragon X Elite - X1E78100 - Qualcomm Adreno GP</a></td><td><a href="gpu.php?gpu=Snapdragon+X+Elite+-+X1E78100+-+Qualcomm+Adreno+GP&amp;id=5096#price">NA</a></td><td>2,566</td><td>NA</td><td>462</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+9+6900HS+Creator+Edition&amp;id=4682">Radeon Ryzen 9 6900HS Creator Edition</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+9+6900HS+Creator+Edition&amp;id=4682#price">NA</a></td><td>5,156</td><td>NA</td><td>710</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L40-8Q&amp;id=5102">L40-8Q</a></td><td><a href="gpu.php?gpu=L40-8Q&amp;id=5102#price">NA</a></td><td>11,670</td><td>NA</td><td>463</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+UHD+630&amp;id=5100">Intel UHD 630</a></td><td><a href="gpu.php?gpu=Intel+UHD+630&amp;id=5100#price">NA</a></td><td>615</td><td>NA</td><td>166</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Jun 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=ZX+C960+GPU&amp;id=5083">ZX C960 GPU</a></td><td><a href="gpu.php?gpu=ZX+C960+GPU&amp;id=5083#price">NA</a></td><td>64</td><td>NA</td><td>116</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=ZX+C-1190&amp;id=5608">ZX C-1190</a></td><td><a href="gpu.php?gpu=ZX+C-1190&amp;id=5608#price">NA</a></td><td>347</td><td>NA</td><td>126</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=VNC+Mirror+Driver&amp;id=3278">VNC Mirror Driver</a></td><td><a href="gpu.php?gpu=VNC+Mirror+Driver&amp;id=3278#price">NA</a></td><td>5,764</td><td>NA</td><td>415</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=SuperDisplay+Virtual+Adapter&amp;id=5024">SuperDisplay Virtual Adapter</a></td><td><a href="gpu.php?gpu=SuperDisplay+Virtual+Adapter&amp;id=5024#price">NA</a></td><td>10,390</td><td>NA</td><td>579</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Snapdragon+X+Plus+-+X1P64100+-+Qualcomm+Adreno+GPU&amp;id=5084">Snapdragon X Plus - X1P64100 - Qualcomm Adreno GPU</a></td><td><a href="gpu.php?gpu=Snapdragon+X+Plus+-+X1P64100+-+Qualcomm+Adreno+GPU&amp;id=5084#price">NA</a></td><td>2,602</td><td>NA</td><td>345</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Sangfor+TitanGPU+controller&amp;id=5099">Sangfor TitanGPU controller</a></td><td><a href="gpu.php?gpu=Sangfor+TitanGPU+controller&amp;id=5099#price">NA</a></td><td>63</td><td>NA</td><td>64</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+7+Pro+7735U+with+Radeon+Graphics&amp;id=5943">Ryzen 7 Pro 7735U with Radeon Graphics</a></td><td><a href="gpu.php?gpu=Ryzen+7+Pro+7735U+with+Radeon+Graphics&amp;id=5943#price">NA</a></td><td>5,142</td><td>NA</td><td>628</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+5+Pro+7535U+with+Radeon+Graphics&amp;id=5942">Ryzen 5 Pro 7535U with Radeon Graphics</a></td><td><a href="gpu.php?gpu=Ryzen+5+Pro+7535U+with+Radeon+Graphics&amp;id=5942#price">NA</a></td><td>3,750</td><td>NA</td><td>688</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Ryzen+3+7335U+with+Radeon+Graphics&amp;id=5941">Ryzen 3 7335U with Radeon Graphics</a></td><td><a href="gpu.php?gpu=Ryzen+3+7335U+with+Radeon+Graphics&amp;id=5941#price">NA</a></td><td>1,980</td><td>NA</td><td>709</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+2000E+Ada+Generation&amp;id=5597">RTX 2000E Ada Generation</a></td><td><a href="gpu.php?gpu=RTX+2000E+Ada+Generation&amp;id=5597#price">NA</a></td><td>14,396</td><td>NA</td><td>997</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+2000+Ada+Generation+Embedded+GPU&amp;id=5543">RTX 2000 Ada Generation Embedded GPU</a></td><td><a href="gpu.php?gpu=RTX+2000+Ada+Generation+Embedded+GPU&amp;id=5543#price">NA</a></td><td>15,505</td><td>NA</td><td>681</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RadeonT+660M&amp;id=4766">RadeonT 660M</a></td><td><a href="gpu.php?gpu=RadeonT+660M&amp;id=4766#price">NA</a></td><td>2,221</td><td>NA</td><td>755</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+TM&amp;id=5076">Radeon TM</a></td><td><a href="gpu.php?gpu=Radeon+TM&amp;id=5076#price">NA</a></td><td>5,568</td><td>NA</td><td>696</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+Ryzen+7+PRO+5800H&amp;id=5569">Radeon Ryzen 7 PRO 5800H</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+7+PRO+5800H&amp;id=5569#price">NA</a></td><td>2,981</td><td>NA</td><td>796</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+Ryzen+5+5500H&amp;id=4951">Radeon Ryzen 5 5500H</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+5500H&amp;id=4951#price">NA</a></td><td>1,551</td><td>NA</td><td>569</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+3+7335U&amp;id=5079">Radeon Ryzen 3 7335U</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+3+7335U&amp;id=5079#price">NA</a></td><td>2,158</td><td>NA</td><td>686</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4584PX+16-Core&amp;id=5091">Radeon EPYC 4584PX 16-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4584PX+16-Core&amp;id=5091#price">NA</a></td><td>1,662</td><td>NA</td><td>559</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4564P+16-Core&amp;id=5092">Radeon EPYC 4564P 16-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4564P+16-Core&amp;id=5092#price">NA</a></td><td>1,375</td><td>NA</td><td>395</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4484PX+12-Core&amp;id=5090">Radeon EPYC 4484PX 12-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4484PX+12-Core&amp;id=5090#price">NA</a></td><td>1,620</td><td>NA</td><td>551</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4464P+12-Core&amp;id=5089">Radeon EPYC 4464P 12-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4464P+12-Core&amp;id=5089#price">NA</a></td><td>1,331</td><td>NA</td><td>502</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4364P+8-Core&amp;id=5088">Radeon EPYC 4364P 8-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4364P+8-Core&amp;id=5088#price">NA</a></td><td>1,003</td><td>NA</td><td>292</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4344P+8-Core&amp;id=5087">Radeon EPYC 4344P 8-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4344P+8-Core&amp;id=5087#price">NA</a></td><td>1,635</td><td>NA</td><td>548</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+EPYC+4244P+6-Core&amp;id=5086">Radeon EPYC 4244P 6-Core</a></td><td><a href="gpu.php?gpu=Radeon+EPYC+4244P+6-Core&amp;id=5086#price">NA</a></td><td>1,424</td><td>NA</td><td>541</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Qualcomm+Adreno+8cx+Gen+3+GPU&amp;id=5095">Qualcomm Adreno 8cx Gen 3 GPU</a></td><td><a href="gpu.php?gpu=Qualcomm+Adreno+8cx+Gen+3+GPU&amp;id=5095#price">NA</a></td><td>1,909</td><td>NA</td><td>420</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Parsec+Virtual+Display+Adapter&amp;id=5020">Parsec Virtual Display Adapter</a></td><td><a href="gpu.php?gpu=Parsec+Virtual+Display+Adapter&amp;id=5020#price">NA</a></td><td>15,332</td><td>NA</td><td>870</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=OrayIddDriver+Device&amp;id=5019">OrayIddDriver Device</a></td><td><a href="gpu.php?gpu=OrayIddDriver+Device&amp;id=5019#price">NA</a></td><td>18,852</td><td>NA</td><td>879</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L4-4Q&amp;id=5526">L4-4Q</a></td><td><a href="gpu.php?gpu=L4-4Q&amp;id=5526#price">NA</a></td><td>4,927</td><td>NA</td><td>96</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=L4-24Q&amp;id=5528">L4-24Q</a></td><td><a href="gpu.php?gpu=L4-24Q&amp;id=5528#price">NA</a></td><td>4,767</td><td>NA</td><td>98</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Intel+Arc+140T+GPU&amp;id=5577">Intel Arc 140T GPU</a></td><td><a href="gpu.php?gpu=Intel+Arc+140T+GPU&amp;id=5577#price">NA</a></td><td>6,812</td><td>NA</td><td>861</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GRID+T4-1B&amp;id=5578">GRID T4-1B</a></td><td><a href="gpu.php?gpu=GRID+T4-1B&amp;id=5578#price">NA</a></td><td>1,731</td><td>NA</td><td>65</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GRID+RTX6000-6Q&amp;id=5081">GRID RTX6000-6Q</a></td><td><a href="gpu.php?gpu=GRID+RTX6000-6Q&amp;id=5081#price">NA</a></td><td>21,987</td><td>NA</td><td>782</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GRID+P4-1Q&amp;id=5094">GRID P4-1Q</a></td><td><a href="gpu.php?gpu=GRID+P4-1Q&amp;id=5094#price">NA</a></td><td>730</td><td>NA</td><td>74</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Glenfly+Arise-GT-10C0&amp;id=5077">Glenfly Arise-GT-10C0</a></td><td><a href="gpu.php?gpu=Glenfly+Arise-GT-10C0&amp;id=5077#price">NA</a></td><td>1,007</td><td>NA</td><td>389</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+5060&amp;id=5602">GeForce RTX 5060</a></td><td><a href="gpu.php?gpu=GeForce+RTX+5060&amp;id=5602#price">$299.99</a></td><td>20,891</td><td>69.64</td><td>1,154</td><td>170</td><td>122.89</td><td>8192 MB</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=EIZO+MED-XN43&amp;id=5085">EIZO MED-XN43</a></td><td><a href="gpu.php?gpu=EIZO+MED-XN43&amp;id=5085#price">NA</a></td><td>3,843</td><td>NA</td><td>767</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=A16-4Q&amp;id=5067">A16-4Q</a></td><td><a href="gpu.php?gpu=A16-4Q&amp;id=5067#price">NA</a></td><td>4,386</td><td>NA</td><td>90</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=A16-2B&amp;id=5082">A16-2B</a></td><td><a href="gpu.php?gpu=A16-2B&amp;id=5082#price">NA</a></td><td>2,317</td><td>NA</td><td>58</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">May 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Winsta0%5C%5CDefault&amp;id=5052">Winsta0\\Default</a></td><td><a href="gpu.php?gpu=Winsta0%5C%5CDefault&amp;id=5052#price">NA</a></td><td>4,125</td><td>NA</td><td>250</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Virtual+Display+Device&amp;id=5036">Virtual Display Device</a></td><td><a href="gpu.php?gpu=Virtual+Display+Device&amp;id=5036#price">NA</a></td><td>1,583</td><td>NA</td><td>338</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Ryzen3+5300U+Ryzen+3+5300U&amp;id=5047">Ryzen3 5300U Ryzen 3 5300U</a></td><td><a href="gpu.php?gpu=Ryzen3+5300U+Ryzen+3+5300U&amp;id=5047#price">NA</a></td><td>1,268</td><td>NA</td><td>445</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=RTXA5000-6Q&amp;id=5054">RTXA5000-6Q</a></td><td><a href="gpu.php?gpu=RTXA5000-6Q&amp;id=5054#price">NA</a></td><td>1,522</td><td>NA</td><td>71</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+500+Ada+Generation+Laptop+GPU&amp;id=5056">RTX 500 Ada Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+500+Ada+Generation+Laptop+GPU&amp;id=5056#price">NA</a></td><td>10,944</td><td>NA</td><td>515</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=Radeon+with+3+5300U+Ryzen+3+5300U&amp;id=5048">Radeon with 3 5300U Ryzen 3 5300U</a></td><td><a href="gpu.php?gpu=Radeon+with+3+5300U+Ryzen+3+5300U&amp;id=5048#price">NA</a></td><td>1,266</td><td>NA</td><td>449</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+Embedded+V2546&amp;id=5059">Radeon Ryzen Embedded V2546</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+Embedded+V2546&amp;id=5059#price">NA</a></td><td>1,435</td><td>NA</td><td>358</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Desktop</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+5+7430U&amp;id=5051">Radeon Ryzen 5 7430U</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+5+7430U&amp;id=5051#price">NA</a></td><td>2,487</td><td>NA</td><td>615</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+RX+6750+GRE+10GB&amp;id=5041">Radeon RX 6750 GRE 10GB</a></td><td><a href="gpu.php?gpu=Radeon+RX+6750+GRE+10GB&amp;id=5041#price">NA</a></td><td>18,411</td><td>NA</td><td>945</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=GRID+P40-1A&amp;id=5064">GRID P40-1A</a></td><td><a href="gpu.php?gpu=GRID+P40-1A&amp;id=5064#price">NA</a></td><td>4,909</td><td>NA</td><td>63</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Apr 2024</td><td>Desktop</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=ZX+C-1080&amp;id=5016">ZX C-1080</a></td><td><a href="gpu.php?gpu=ZX+C-1080&amp;id=5016#price">NA</a></td><td>316</td><td>NA</td><td>141</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+2000+Ada+Generation&amp;id=5014">RTX 2000 Ada Generation</a></td><td><a href="gpu.php?gpu=RTX+2000+Ada+Generation&amp;id=5014#price">NA</a></td><td>17,135</td><td>NA</td><td>1,090</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RTX+1000+Ada+Generation+Laptop+GPU&amp;id=5011">RTX 1000 Ada Generation Laptop GPU</a></td><td><a href="gpu.php?gpu=RTX+1000+Ada+Generation+Laptop+GPU&amp;id=5011#price">NA</a></td><td>13,413</td><td>NA</td><td>559</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Mobile</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=RDPDD+Chained+DD&amp;id=5031">RDPDD Chained DD</a></td><td><a href="gpu.php?gpu=RDPDD+Chained+DD&amp;id=5031#price">NA</a></td><td>238</td><td>NA</td><td>8</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+9+PRO+6950H&amp;id=4704">Radeon Ryzen 9 PRO 6950H</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+9+PRO+6950H&amp;id=4704#price">NA</a></td><td>5,781</td><td>NA</td><td>896</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+3+PRO+7335U&amp;id=5030">Radeon Ryzen 3 PRO 7335U</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+3+PRO+7335U&amp;id=5030#price">NA</a></td><td>1,992</td><td>NA</td><td>669</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=Radeon+Ryzen+3+PRO+5475U&amp;id=5010">Radeon Ryzen 3 PRO 5475U</a></td><td><a href="gpu.php?gpu=Radeon+Ryzen+3+PRO+5475U&amp;id=5010#price">NA</a></td><td>1,541</td><td>NA</td><td>519</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=L40S&amp;id=5017">L40S</a></td><td><a href="gpu.php?gpu=L40S&amp;id=5017#price">NA</a></td><td>20,023</td><td>NA</td><td>708</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="odd"><td class=" details-control"></td><td class=""><a href="video_lookup.php?gpu=GeForce+RTX+4090+D&amp;id=5012">GeForce RTX 4090 D</a></td><td><a href="gpu.php?gpu=GeForce+RTX+4090+D&amp;id=5012#price">NA</a></td><td>32,260</td><td>NA</td><td>986</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Mar 2024</td><td>Unknown</td></tr><tr role="row" class="even"><td class=" details-control"></td><td class=""><a href="gpu.php?gpu=RadeonT+760M&amp;id=5005">RadeonT 760M</a></td><td><a href="gpu.php?gpu=RadeonT+760M&amp;id=5005#price">NA</a></td><td>5,846</td><td>NA</td><td>760</td><td>NA</td><td>NA</td><td>NA</td><td class="sorting_1">Feb 2024</td><td>Mobile</td></tr></tbody></table>
 """
 
-scraped_data = parse_html_table(html_content)
-write_csv(scraped_data, 'graphics_cards.csv')
+# Pass the path of a saved PassMark page to parse it instead of the table above
+source = sys.argv[1] if len(sys.argv) > 1 else io.StringIO(html_content)
+scraped_data = parse_html_table(source)
+write_passmark_csv(scraped_data, 'graphics_cards.csv')
 
-print("CSV file 'graphics_cards.csv' has been created successfully.")
\ No newline at end of file
+print("CSV file 'graphics_cards.csv' has been created successfully.")
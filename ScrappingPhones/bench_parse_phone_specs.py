@@ -0,0 +1,94 @@
+"""
+Time parse_phone_specs on a saved phone page.
+
+    python bench_parse_phone_specs.py [--html path_to_your_html_file.html] [--runs 20] [--baseline REV]
+
+With --baseline the scrappingPhonesWeb.py of that git revision is loaded as
+well, so the per-page time before and after a change can be compared on the
+same machine. Peak memory is the RSS growth of one parse in a forked child
+process, so that allocations made by lxml in C are counted too (Linux only).
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import resource
+import statistics
+import subprocess
+import time
+import types
+from pathlib import Path
+
+import scrappingPhonesWeb
+
+HERE = Path(__file__).resolve().parent
+
+
+def load_revision(revision):
+    """Load scrappingPhonesWeb.py as it was at `revision`"""
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:./scrappingPhonesWeb.py'],
+        cwd=HERE, capture_output=True, text=True, check=True,
+    ).stdout
+    module = types.ModuleType(f'scrappingPhonesWeb@{revision}')
+    exec(compile(source, f'scrappingPhonesWeb.py@{revision}', 'exec'), module.__dict__)
+    return module
+
+
+def time_parse(parse, html_content, runs):
+    """Return the per-page parse times in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        # parse_phone_specs prints the phone name, keep the output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            parse(html_content)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _measure_child(parse, html_content, results):
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse(html_content)
+    results.put(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+
+def peak_memory(parse, html_content):
+    """Return the peak RSS growth of one parse in MiB"""
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    child = context.Process(target=_measure_child, args=(parse, html_content, results))
+    child.start()
+    growth_kb = results.get()
+    child.join()
+    return growth_kb / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time parse_phone_specs on a saved page')
+    parser.add_argument('--html', default=str(HERE / 'path_to_your_html_file.html'))
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--baseline', help='git revision to compare against')
+    args = parser.parse_args()
+
+    with open(args.html, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    print(f"{args.html}: {len(html_content) / 1024:.0f} KB, {args.runs} runs")
+
+    candidates = []
+    if args.baseline:
+        candidates.append((args.baseline, load_revision(args.baseline).parse_phone_specs))
+    candidates.append(('html.parser', lambda html: scrappingPhonesWeb.parse_phone_specs(html, parser='html.parser')))
+    if scrappingPhonesWeb.HTML_PARSER != 'html.parser':
+        candidates.append((scrappingPhonesWeb.HTML_PARSER, scrappingPhonesWeb.parse_phone_specs))
+
+    # Measure memory before any parse runs here, freed parser memory would hide the growth
+    peaks = [peak_memory(parse, html_content) for _, parse in candidates]
+    for (name, parse), peak in zip(candidates, peaks):
+        timings = time_parse(parse, html_content, args.runs)
+        print(f"  {name:<12} median {statistics.median(timings):8.1f} ms/page  "
+              f"min {min(timings):8.1f} ms  peak {peak:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
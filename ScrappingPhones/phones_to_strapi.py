@@ -1,56 +1,68 @@
+import argparse
 import os
 import json
-import requests
-from time import sleep
+import sys
+from pathlib import Path
 
-def upload_to_strapi(folder_path, api_endpoint):
-    """
-    Upload complete smartphone JSON data to Strapi database
-    """
-    headers = {
-        'Content-Type': 'application/json'
-    }
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.dedup import drop_duplicates, existing_keys
+from ScrappingCommon.naming import normalise_name
+from ScrappingCommon.strapi_client import upload
+from ScrappingCommon.strapi_sync import sync_collection
+
+CONCURRENCY = 8  # Requests in flight at once
 
-    for filename in os.listdir(folder_path):
+def read_phone_files(folder_path):
+    """Return the (filename, phone data) of every JSON file of the folder"""
+    phones = []
+    for filename in sorted(os.listdir(folder_path)):
         if not filename.endswith('.json'):
             continue
-
-        file_path = os.path.join(folder_path, filename)
-        
         try:
-            # Read the JSON data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                phone_data = json.load(f)
-
-            # Structure for Strapi's API
-            strapi_data = {
-                "data": {
-                    "phone": phone_data  # Put the phone data as attributes
-                }
-            }
-
-            # Send POST request to Strapi
-            response = requests.post(
-                api_endpoint,
-                headers=headers,
-                json=strapi_data
-            )
-
-            if response.status_code in [200, 201]:
-                print(f"Successfully uploaded: {filename}")
-                print(f"Response: {response.json()}")
-            else:
-                print(f"Failed to upload {filename}: Status code {response.status_code}")
-                print(f"Response: {response.text}")
-
-            # Small delay between requests
-            sleep(0.5)
-
+            with open(os.path.join(folder_path, filename), 'r', encoding='utf-8') as f:
+                phones.append((filename, json.load(f)))
         except Exception as e:
             print(f"Error processing {filename}: {str(e)}")
+    return phones
+
+def upload_to_strapi(folder_path, api_base_url, collection='phones'):
+    """
+    Upload complete smartphone JSON data to Strapi database
+    """
+    phones = read_phone_files(folder_path)
+    # Only create the phones Strapi does not have yet, once each, matched on the normalised brand_and_full_name;
+    # a rerun after an interrupted upload thus only sends the phones left
+    known = existing_keys(api_base_url, collection, 'phone', 'brand_and_full_name')
+    phones, skipped = drop_duplicates(phones, lambda phone: normalise_name(phone[1].get('brand_and_full_name')), known)
+    for (filename, _), reason in skipped:
+        print(f"Skipping {filename}: {reason}")
+    # Structure for Strapi's API, the phone data is put as attributes
+    payloads = [{"data": {"phone": phone_data}} for _, phone_data in phones]
+    labels = [filename for filename, _ in phones]
+    return upload(api_base_url, collection, payloads, labels, CONCURRENCY, title='Phone upload')
+
+def sync_to_strapi(folder_path, api_base_url, collection='phones', dry_run=False, max_delete_fraction=0.2):
+    """
+    Only send the differences with what Strapi holds, matched on the normalised brand_and_full_name
+    """
+    records = [phone_data for _, phone_data in read_phone_files(folder_path)]
+    return sync_collection(api_base_url, collection, 'phone', 'brand_and_full_name', records, dry_run=dry_run,
+                           max_delete_fraction=max_delete_fraction, concurrency=CONCURRENCY)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Send the phones of resultsWeb/ to Strapi")
+    parser.add_argument("mode", nargs="?", choices=["upload", "sync"], default="upload",
+                        help="upload: POST the phones Strapi does not have yet; sync: create, update and delete only what changed")
+    parser.add_argument("--dry-run", action="store_true", help="sync: only print what would be sent")
+    parser.add_argument("--max-delete-fraction", type=float, default=0.2,
+                        help="sync: refuse to delete more than this share of the collection")
+    args = parser.parse_args()
 
-# Usage
-folder_path = 'resultsWeb'
-api_endpoint = 'http://localhost:1337/api/phones'
+    # Usage
+    folder_path = 'resultsWeb'
+    api_base_url = 'http://localhost:1337/api'
 
-upload_to_strapi(folder_path, api_endpoint)
\ No newline at end of file
+    if args.mode == "sync":
+        sync_to_strapi(folder_path, api_base_url, dry_run=args.dry_run, max_delete_fraction=args.max_delete_fraction)
+    else:
+        upload_to_strapi(folder_path, api_base_url)
@@ -0,0 +1,124 @@
+"""
+SQLite manifest of the URLs handled by scrappingPhonesWeb.py.
+
+One row per URL with its status, the last fetch time, the JSON file written
+and a hash of the parsed specs. A run only picks the URLs that need work:
+never fetched, failed and past their retry delay, or older than the max age.
+"""
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,          -- 'done' or 'failed'
+    fetched_at TEXT,               -- last successful fetch, UTC ISO 8601
+    output_file TEXT,
+    specs_hash TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,  -- failures since the last success
+    next_attempt_at TEXT,          -- failed URLs are not retried before this time
+    error TEXT
+)
+"""
+
+
+def specs_hash(specs):
+    """Stable hash of a specs structure, to tell whether a re-fetch changed anything"""
+    data = json.dumps(specs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+def utc_now():
+    return datetime.now(timezone.utc)
+
+
+class ScrapeManifest:
+    """Status of every scraped URL, shared by the scraper's driver threads"""
+
+    def __init__(self, path="scrape_manifest.sqlite", retry_delay=300, max_retry_delay=24 * 3600):
+        self.path = path
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(SCHEMA)
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def get(self, url):
+        with self._lock:
+            cursor = self._db.execute("SELECT * FROM urls WHERE url = ?", (url,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return dict(zip([column[0] for column in cursor.description], row))
+
+    def select_urls(self, urls, max_age=None, now=None):
+        """
+        Return the URLs of `urls` that need a fetch, in their original order.
+        Done URLs are skipped unless `max_age` (timedelta) has passed since their fetch,
+        failed URLs wait until their backoff delay is over.
+        """
+        now = now or utc_now()
+        with self._lock:
+            rows = {row[0]: row[1:] for row in self._db.execute(
+                "SELECT url, status, fetched_at, next_attempt_at FROM urls")}
+
+        selected = []
+        counts = {"new": 0, "stale": 0, "retry": 0, "done": 0, "waiting": 0}
+        for url in dict.fromkeys(urls):
+            if url not in rows:
+                counts["new"] += 1
+                selected.append(url)
+                continue
+            status, fetched_at, next_attempt_at = rows[url]
+            if status == "failed":
+                if next_attempt_at is None or datetime.fromisoformat(next_attempt_at) <= now:
+                    counts["retry"] += 1
+                    selected.append(url)
+                else:
+                    counts["waiting"] += 1
+            elif max_age is not None and (fetched_at is None or datetime.fromisoformat(fetched_at) <= now - max_age):
+                counts["stale"] += 1
+                selected.append(url)
+            else:
+                counts["done"] += 1
+
+        print(f"Manifest: {counts['new']} new, {counts['stale']} stale, {counts['retry']} failed to retry, "
+              f"{counts['done']} up to date, {counts['waiting']} failed waiting for their retry delay")
+        return selected
+
+    def mark_done(self, url, output_file, specs_digest, now=None):
+        """Record a successful fetch, return True when the specs changed since the previous one"""
+        now = now or utc_now()
+        with self._lock:
+            previous = self._db.execute("SELECT specs_hash FROM urls WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO urls (url, status, fetched_at, output_file, specs_hash, attempts, next_attempt_at, error) "
+                "VALUES (?, 'done', ?, ?, ?, 0, NULL, NULL)",
+                (url, now.isoformat(timespec="seconds"), str(output_file), specs_digest),
+            )
+            self._db.commit()
+        return previous is None or previous[0] != specs_digest
+
+    def mark_failed(self, url, error, now=None):
+        """Record a failure, the retry delay doubles with every consecutive failure"""
+        now = now or utc_now()
+        with self._lock:
+            row = self._db.execute("SELECT attempts FROM urls WHERE url = ?", (url,)).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            delay = min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
+            next_attempt_at = (now + timedelta(seconds=delay)).isoformat(timespec="seconds")
+            # Keep the last good fetch, the previous JSON file is still valid
+            self._db.execute(
+                "INSERT INTO urls (url, status, attempts, next_attempt_at, error) VALUES (?, 'failed', ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET status = 'failed', attempts = excluded.attempts, "
+                "next_attempt_at = excluded.next_attempt_at, error = excluded.error",
+                (url, attempts, next_attempt_at, str(error)[:500]),
+            )
+            self._db.commit()
+        return delay
@@ -1,16 +1,72 @@
-from bs4 import BeautifulSoup
+import argparse
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from itertools import repeat
 import json
+import os
+import queue
 import re
+import threading
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
 
-def setup_driver():
-    """Setup and return a Chrome webdriver with appropriate options"""
+from scrape_manifest import ScrapeManifest, specs_hash
+from snapshot_store import SnapshotStore
+
+try:
+    import lxml
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml = None
+    HTML_PARSER = 'html.parser'
+
+# Only the phone name and the property blocks are materialised when parsing a page.
+# The strainer sees the raw class attribute, hence the regex instead of a list of classes.
+SPEC_STRAINER = SoupStrainer(class_=re.compile(r'(^|\s)(summaryName|Property__property___pNjSI)(\s|$)'))
+
+# Class of the elements looked up inside a property block -> role
+PROPERTY_CLASSES = {
+    "Property__label___zWFei": "label",
+    "Number__number___G9V3S": "number",
+    "String__string___sxJBL": "string",
+    "Boolean__boolean___i1Pee": "boolean",
+    "ranked": "ranked",
+}
+
+# Requests blocked in lean mode (Network.setBlockedURLs patterns, '*' is a wildcard).
+# Only the text of the DOM is read, so images, fonts, stylesheets, media, ads and analytics are skipped.
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+    "*.mp4", "*.webm",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*adservice.google.*", "*facebook.net*",
+    "*hotjar.com*", "*criteo.*", "*amazon-adsystem.com*", "*taboola.com*",
+]
+
+def load_block_list(path):
+    """Read URL patterns to block, one per line, '#' starts a comment"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.split('#')[0].strip() for line in f if line.split('#')[0].strip()]
+
+def setup_driver(lean=False, blocked_urls=None, profile_dir=None, cache_size_mb=512):
+    """
+    Setup and return a Chrome webdriver with appropriate options.
+    In lean mode images are not loaded, `blocked_urls` (LEAN_BLOCKED_URLS by default) are
+    blocked through CDP and driver.get returns at DOMContentLoaded ('eager' page load strategy).
+    With `profile_dir` Chrome keeps its profile and a disk cache capped at `cache_size_mb`
+    there, so the site's scripts and styles are reused by the next driver using that folder.
+    A profile folder can only be used by one Chrome at a time.
+    """
     options = webdriver.ChromeOptions()
     options.add_argument('--headless')  # Run in headless mode
     options.add_argument('--no-sandbox')
@@ -20,98 +76,362 @@ def setup_driver():
     # Disable automation flags
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    if profile_dir is not None:
+        profile_dir = Path(profile_dir).resolve()
+        options.add_argument(f'--user-data-dir={profile_dir}')
+        options.add_argument(f'--disk-cache-dir={profile_dir / "cache"}')
+        options.add_argument(f'--disk-cache-size={int(cache_size_mb * 1024 * 1024)}')
+    if lean:
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     driver = webdriver.Chrome(options=options)
+    if lean:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": LEAN_BLOCKED_URLS if blocked_urls is None else blocked_urls})
     # Additional stealth settings
     driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'})
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     return driver
 
-def expand_all_sections(driver):
-    """Click all 'Voir plus' buttons on the page, up to 11 times"""
+# Clicks every '+ Voir plus +' button, waits until the DOM has been quiet for `quietMs`
+# (MutationObserver), and repeats until no button is left or after `maxRounds` rounds.
+# Run with execute_async_script, the last argument is the completion callback.
+EXPAND_ALL_SCRIPT = """
+const [quietMs, maxWaitMs, maxTotalMs, maxRounds, done] = arguments;
+const label = '+ Voir plus +';
+const endBy = Date.now() + maxTotalMs;
+let clicks = 0, rounds = 0, timer = null, deadline = 0;
+
+const pendingButtons = () =>
+    Array.from(document.querySelectorAll('button')).filter(b => b.textContent.includes(label));
+const observer = new MutationObserver(() => waitForQuiet());
+
+// A page that never stops changing (counter, carousel, ads) still gets its next round after
+// maxWaitMs, and the script resolves after maxTotalMs whatever the page does
+function waitForQuiet() {
+    clearTimeout(timer);
+    timer = setTimeout(expandRound, Math.max(0, Math.min(quietMs, Math.min(deadline, endBy) - Date.now())));
+}
+
+function expandRound() {
+    const buttons = pendingButtons();
+    if (!buttons.length || rounds >= maxRounds || Date.now() >= endBy) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done({clicks: clicks, rounds: rounds, remaining: buttons.length});
+        return;
+    }
+    rounds++;
+    for (const button of buttons) {
+        button.click();
+        clicks++;
+    }
+    deadline = Date.now() + maxWaitMs;
+    waitForQuiet();
+}
+
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+expandRound();
+"""
+
+def expand_all_sections(driver, quiet_ms=100, max_wait_ms=1500, max_total_ms=5000, max_rounds=11):
+    """
+    Click all 'Voir plus' buttons on the page in a single injected script.
+    The script resolves once no button is left or the page stopped changing, so there is
+    one WebDriver round-trip per page instead of a scroll, a click and two sleeps per button.
+    A round waits at most max_wait_ms for the page to settle and the whole script max_total_ms,
+    so a page that keeps changing resolves with the rounds done by then, not at the script timeout.
+    """
     try:
-        print("Starting to expand sections...")
-        time.sleep(0.2)
-        
-        for attempt in range(11):  # Loop 11 times maximum
-            print(f"Expansion attempt {attempt + 1}/11")
-            
-            # Find all 'Voir plus' buttons
-            more_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), '+ Voir plus +')]")
-            
-            if not more_buttons:
-                print("No more 'Voir plus' buttons found")
-                break
-                
-            print(f"Found {len(more_buttons)} buttons")
-            
-            for i, button in enumerate(more_buttons, 1):
-                try:
-                    print(f"Attempting to click button {i} of {len(more_buttons)}")
-                    driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                    time.sleep(0.2)
-                    driver.execute_script("arguments[0].click();", button)
-                    print(f"Successfully clicked button {i}")
-                    time.sleep(0.2)
-                except Exception as e:
-                    print(f"Error clicking button {i}: {str(e)}")
-                    continue
-                    
+        result = driver.execute_async_script(EXPAND_ALL_SCRIPT, quiet_ms, max_wait_ms, max_total_ms, max_rounds)
+        print(f"Expanded sections: {result['clicks']} clicks in {result['rounds']} rounds"
+              + (f", {result['remaining']} buttons left" if result['remaining'] else ""))
     except Exception as e:
         print(f"Fatal error expanding sections: {str(e)}")
 
-def scrape_phones_from_urls(urls, output_folder="resultsWeb"):
+def output_filename_for(specs, url):
+    """Name of the JSON file of a phone, from its full name or from the URL when the name is missing"""
+    if not specs["brand_and_full_name"]:
+        print(f"Warning: Could not extract name from {url}")
+        # Use part of URL as filename
+        return re.sub(r'[^a-zA-Z0-9]', '_', url.split('/')[-1]) + ".json"
+    # Create safe filename from brand_and_full_name
+    safe_name = re.sub(r'[<>:"/\\|?*]', '_', specs["brand_and_full_name"])
+    return f"{safe_name}.json"
+
+# Number of requests made by the page and bytes received over the network (0 for cache hits)
+PAGE_TRANSFER_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return [entries.length, entries.reduce((total, entry) => total + (entry.transferSize || 0), 0)];
+"""
+
+# Same extraction as read_properties_soup/read_properties_lxml, run in the page: returns the phone
+# name and the [label, value] pairs of every property block, so only a few KB cross the WebDriver wire
+# instead of the whole page_source. Values are resolved for every label, known or not.
+SPEC_PROPERTIES_SCRIPT = """
+const roles = arguments[0];
+const hasContent = (elem) => elem && elem.childNodes.length > 0;
+
+const summaryName = document.querySelector('[class="summaryName selected"]');
+const properties = [];
+for (const prop of document.querySelectorAll('.Property__property___pNjSI')) {
+    const found = {};
+    for (const elem of prop.querySelectorAll('*')) {
+        for (const cls of elem.classList) {
+            const role = roles[cls];
+            if (role && !(role in found)) found[role] = elem;
+        }
+    }
+    if (!hasContent(found.label)) continue;
+
+    const label = found.label.textContent.trim();
+    const valueElem = hasContent(found.number) ? found.number : found.string;
+    if (hasContent(valueElem) && !valueElem.classList.contains('suggestion')) {
+        properties.push([label, valueElem.textContent.trim()]);
+    } else if (hasContent(found.boolean)) {
+        properties.push([label, found.boolean.textContent.includes('\u2714')]);
+    } else if (hasContent(found.ranked)) {
+        const ranked = found.ranked.querySelector('p');
+        if (ranked) properties.push([label, ranked.textContent.trim()]);
+    }
+}
+return {name: summaryName ? summaryName.textContent : null, properties: properties};
+"""
+
+def parse_spec_properties(properties_json, unknown_labels=None):
+    """Build the specs from the output of SPEC_PROPERTIES_SCRIPT (as a JSON string)"""
+    data = json.loads(properties_json)
+    return build_specs(data["name"], [tuple(prop) for prop in data["properties"]], unknown_labels)
+
+def scrape_url(driver, url, output_path, snapshots, unknown_labels, url_timeout=30, specs_only=False):
     """
-    Scrape phone specifications from a list of URLs
+    Fetch one phone page with `driver` and write its JSON file.
+    With `specs_only` the properties are extracted in the browser instead of reading page_source.
+    Return the file name, the hash of the specs and the page timings (seconds) and transfer figures.
     """
-    # Create output folder if it doesn't exist
-    output_path = Path(output_folder)
-    output_path.mkdir(exist_ok=True)
+    driver.set_page_load_timeout(url_timeout)
+    driver.set_script_timeout(url_timeout)
+    start = time.perf_counter()
+
+    # Load the page
+    driver.get(url)
+    
+    # Wait for the main content to load
+    WebDriverWait(driver, min(10, url_timeout)).until(
+        EC.presence_of_element_located((By.CLASS_NAME, "summaryName"))
+    )
+    loaded = time.perf_counter()
     
-    # Setup the webdriver
-    driver = setup_driver()
+    # Expand all sections
+    expand_all_sections(driver)
+    expanded = time.perf_counter()
+    
+    # Get the page source after all expansions (or only its properties), snapshot it before parsing
+    if specs_only:
+        content = json.dumps(driver.execute_script(SPEC_PROPERTIES_SCRIPT, PROPERTY_CLASSES), ensure_ascii=False)
+    else:
+        content = driver.page_source
+    extracted = time.perf_counter()
+    requests_count, transferred = driver.execute_script(PAGE_TRANSFER_SCRIPT)
+    timing = {
+        "load": loaded - start,
+        "expand": expanded - loaded,
+        "extract": extracted - expanded,
+        "extracted_kb": len(content) / 1024,
+        "total": time.perf_counter() - start,
+        "requests": requests_count,
+        "bytes": transferred,
+    }
+    if specs_only:
+        snapshots.save(url, content, kind="properties")
+        specs = parse_spec_properties(content, unknown_labels)
+    else:
+        snapshots.save(url, content)
+        # Parse specifications using existing function
+        specs = parse_phone_specs(content, unknown_labels)
+    output_filename = output_filename_for(specs, url)
     
+    # Save to output folder
+    save_specs_to_json(specs, output_path / output_filename)
+    return output_filename, specs_hash(specs), timing
+
+def report_page_timings(page_timings, mode):
+    """Print the average page timings of a run, to compare lean and full mode"""
+    if not page_timings:
+        return
+    count = len(page_timings)
+    average = {key: sum(timing[key] for timing in page_timings) / count for key in page_timings[0]}
+    for start in ("cold", "warm"):
+        first_pages = [timing for timing in page_timings
+                       if timing["first_page"] and timing["warm_start"] == (start == "warm")]
+        if first_pages:
+            print(f"{start.capitalize()} start, {len(first_pages)} first pages of a driver: "
+                  f"load {sum(t['load'] for t in first_pages) / len(first_pages):.2f}s, "
+                  f"total {sum(t['total'] for t in first_pages) / len(first_pages):.2f}s, "
+                  f"{sum(t['bytes'] for t in first_pages) / len(first_pages) / 1024:.0f} KB transferred")
+    print(f"{mode} mode, {count} pages: load {average['load']:.2f}s, expand {average['expand']:.2f}s, "
+          f"extract {average['extract']:.2f}s ({average['extracted_kb']:.0f} KB), "
+          f"total {average['total']:.2f}s, {average['requests']:.0f} requests, "
+          f"{average['bytes'] / 1024:.0f} KB transferred per page")
+
+def has_cache(profile_dir):
+    """True when a previous driver already filled the disk cache of this profile"""
+    cache_dir = Path(profile_dir) / "cache"
+    if not cache_dir.is_dir():
+        return False
+    with os.scandir(cache_dir) as entries:
+        return any(True for _ in entries)
+
+def scrape_worker(worker_id, url_queue, output_path, snapshots, manifest, unknown_labels, page_timings,
+                  pages_per_driver, page_options, driver_options, profile_root=None):
+    """
+    Take URLs from the shared queue until it is empty, with a driver of its own.
+    The driver is restarted every `pages_per_driver` pages to bound Chrome's memory growth,
+    and after a timeout or a browser error since it may be left in a bad state.
+    Every outcome is recorded in `manifest` when one is given.
+    With `profile_root` the worker's drivers use the profile folder profile_root/worker-<id>,
+    which is never shared with another worker.
+    """
+    profile_dir = Path(profile_root) / f"worker-{worker_id}" if profile_root else None
+    driver = None
+    warm_start = False
+    pages = 0
     try:
-        for url in urls:
+        while True:
             try:
-                print(f"Processing URL: {url}")
-                
-                # Load the page
-                driver.get(url)
-                
-                # Wait for the main content to load
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "summaryName"))
-                )
-                
-                # Expand all sections
-                expand_all_sections(driver)
-                
-                # Get the page source after all expansions
-                html_content = driver.page_source
-                
-                # Parse specifications using existing function
-                specs = parse_phone_specs(html_content)
-                
-                if not specs["brand_and_full_name"]:
-                    print(f"Warning: Could not extract name from {url}")
-                    # Use part of URL as filename
-                    output_filename = re.sub(r'[^a-zA-Z0-9]', '_', url.split('/')[-1]) + ".json"
-                else:
-                    # Create safe filename from brand_and_full_name
-                    safe_name = re.sub(r'[<>:"/\\|?*]', '_', specs["brand_and_full_name"])
-                    output_filename = f"{safe_name}.json"
-                
-                # Save to output folder
-                output_file = output_path / output_filename
-                save_specs_to_json(specs, output_file)
-                print(f"Processed: {url} -> {output_filename}")
-                
+                url = url_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if driver is None or pages >= pages_per_driver:
+                if driver is not None:
+                    print(f"[driver {worker_id}] Recycling after {pages} pages")
+                    driver.quit()
+                warm_start = profile_dir is not None and has_cache(profile_dir)
+                driver = setup_driver(**driver_options, profile_dir=profile_dir)
+                pages = 0
+
+            try:
+                print(f"[driver {worker_id}] Processing URL: {url}")
+                pages += 1
+                output_filename, digest, timing = scrape_url(driver, url, output_path, snapshots, unknown_labels, **page_options)
+                # The first page of a driver shows what a cold or warm cache costs
+                timing["first_page"] = pages == 1
+                timing["warm_start"] = warm_start
+                page_timings.append(timing)
+                changed = manifest.mark_done(url, output_filename, digest) if manifest else True
+                print(f"[driver {worker_id}] Processed: {url} -> {output_filename}{'' if changed else ' (unchanged)'} "
+                      f"(load {timing['load']:.2f}s, expand {timing['expand']:.2f}s, "
+                      f"extract {timing['extract']:.2f}s / {timing['extracted_kb']:.0f} KB, total {timing['total']:.2f}s, "
+                      f"{timing['requests']} requests, {timing['bytes'] / 1024:.0f} KB)")
+            except (TimeoutException, WebDriverException) as e:
+                print(f"[driver {worker_id}] Error processing URL {url}: {str(e).strip()}")
+                if manifest:
+                    manifest.mark_failed(url, e)
+                driver.quit()
+                driver = None
             except Exception as e:
-                print(f"Error processing URL {url}: {str(e)}")
-                continue
-                
+                print(f"[driver {worker_id}] Error processing URL {url}: {str(e)}")
+                if manifest:
+                    manifest.mark_failed(url, e)
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
+
+def scrape_phones_from_urls(urls, output_folder="resultsWeb", snapshot_dir="snapshots",
+                            drivers=1, pages_per_driver=50, url_timeout=30, lean=False, blocked_urls=None,
+                            manifest=None, max_age=None, resume=True, specs_only=False,
+                            profile_root=None, cache_size_mb=512):
+    """
+    Scrape phone specifications from a list of URLs.
+    `drivers` headless Chrome instances take the URLs from a shared queue, each one is
+    restarted after `pages_per_driver` pages and every URL gets `url_timeout` seconds to load.
+    `lean` and `blocked_urls` are passed to setup_driver, `specs_only` to scrape_url.
+    With `profile_root` every worker keeps a persistent Chrome profile and disk cache
+    (at most `cache_size_mb`) in its own sub-folder, reused across drivers and runs.
+    Every fetched page is also kept in the snapshot store so it can be re-parsed later.
+    With a ScrapeManifest every outcome is recorded and, when `resume` is set, only the URLs
+    that are new, failed (after their retry delay) or older than `max_age` are fetched.
+    """
+    # Create output folder if it doesn't exist
+    output_path = Path(output_folder)
+    output_path.mkdir(exist_ok=True)
+    snapshots = SnapshotStore(snapshot_dir)
+
+    if manifest is not None and resume:
+        urls = manifest.select_urls(urls, max_age)
+        if not urls:
+            print("Nothing to scrape")
+            return
+
+    url_queue = queue.Queue()
+    for url in urls:
+        url_queue.put(url)
+
+    # One counter per worker, merged at the end
+    worker_labels = [Counter() for _ in range(max(1, min(drivers, len(urls))))]
+    page_timings = []  # list.append is atomic, the workers share it
+    page_options = {"url_timeout": url_timeout, "specs_only": specs_only}
+    driver_options = {"lean": lean, "blocked_urls": blocked_urls, "cache_size_mb": cache_size_mb}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(worker_labels)) as pool:
+        workers = [
+            pool.submit(scrape_worker, worker_id, url_queue, output_path, snapshots, manifest, unknown_labels,
+                        page_timings, pages_per_driver, page_options, driver_options, profile_root)
+            for worker_id, unknown_labels in enumerate(worker_labels, 1)
+        ]
+        for worker in workers:
+            # A driver that cannot even start is worth stopping for
+            worker.result()
+
+    elapsed = time.perf_counter() - start
+    print(f"Went through {len(urls)} URLs with {len(worker_labels)} drivers in {elapsed:.1f}s")
+    report_page_timings(page_timings, ("Lean" if lean else "Full") + (" specs-only" if specs_only else ""))
+    report_unknown_labels(sum(worker_labels, Counter()))
+
+def reparse_snapshot(snapshot_dir, entry, output_folder):
+    """Rebuild the JSON file of one snapshot, run in the reparse worker processes"""
+    unknown_labels = Counter()
+    try:
+        content = SnapshotStore(snapshot_dir).load(entry)
+        if entry.get("kind") == "properties":
+            specs = parse_spec_properties(content, unknown_labels)
+        else:
+            specs = parse_phone_specs(content, unknown_labels)
+        output_filename = output_filename_for(specs, entry["url"])
+        save_specs_to_json(specs, Path(output_folder) / output_filename)
+        return entry["url"], output_filename, unknown_labels, None
+    except Exception as e:
+        return entry["url"], None, unknown_labels, str(e)
+
+def reparse_snapshots(snapshot_dir="snapshots", output_folder="resultsWeb", workers=None):
+    """
+    Rebuild the JSON files from the latest snapshot of every URL, without a browser.
+    The pages are parsed on a process pool, one process per core by default.
+    """
+    entries = list(SnapshotStore(snapshot_dir).latest().values())
+    if not entries:
+        print(f"No snapshots found in {snapshot_dir}")
+        return
+    Path(output_folder).mkdir(exist_ok=True)
+
+    unknown_labels = Counter()
+    failed = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = pool.map(reparse_snapshot, repeat(snapshot_dir), entries, repeat(output_folder), chunksize=8)
+        for url, output_filename, page_labels, error in tasks:
+            unknown_labels.update(page_labels)
+            if error:
+                failed += 1
+                print(f"Error reparsing {url}: {error}")
+            else:
+                print(f"Reparsed: {url} -> {output_filename}")
+
+    elapsed = time.perf_counter() - start
+    print(f"Reparsed {len(entries) - failed}/{len(entries)} snapshots in {elapsed:.1f}s")
+    report_unknown_labels(unknown_labels)
 
 def process_megapixels(value_text):
     """
@@ -180,9 +500,275 @@ def check_boolean_value(element):
         return None
     return "✔" in element.text
 
-def parse_phone_specs(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
+def keep_boolean(value):
+    """Keep ✔/✖ values only, any text value becomes None"""
+    return value if isinstance(value, bool) else None
+
+def text_and_value(process):
+    """Wrap a processor returning (text, value) into the {"text", "value"} structure"""
+    def convert(value_text):
+        text, value = process(value_text)
+        return {"text": text, "value": value}
+    return convert
+
+# French property label -> (section, field, converter), a converter of None keeps the raw value
+SPEC_FIELDS = {
+    # Design
+    "poids": ("Design", "weight_g", extract_number),
+    "épaisseur": ("Design", "thickness_mm", extract_number),
+    "largeur": ("Design", "width_mm", extract_number),
+    "hauteur": ("Design", "height_mm", extract_number),
+    "indice de protection (IP)": ("Design", "IP_rating", None),
+    "volume": ("Design", "volume_cm3", extract_number),
+    # Screen
+    "taille d'écran": ("Screen", "screen_size_in", extract_number),
+    "type d'écran": ("Screen", "screen_type", None),
+    "densité de pixels": ("Screen", "pixel_density_ppi", extract_number),
+    "résolution": ("Screen", "resolution", None),
+    "Taux de rafraîchissement": ("Screen", "refresh_rate_hz", extract_number),
+    "luminosité (typique)": ("Screen", "typical_brightness_nits", extract_number),
+    "compatible HDR10": ("Screen", "HDR10_compatible", keep_boolean),
+    "compatible Dolby Vision": ("Screen", "Dolby_Vision_compatible", keep_boolean),
+    # Performance
+    "espace de stockage": ("Performance", "storage_options_gb", extract_number),
+    "mémoire vive (RAM)": ("Performance", "RAM_gb", extract_number),
+    "Score du benchmark AnTuTu": ("Performance", "AnTuTu_benchmark_score", extract_number),
+    "nom du GPU": ("Performance", "GPU_name", None),
+    "vitesse du processeur": ("Performance", "processor_speed_ghz", text_and_value(process_processor_speed)),
+    "vitesse RAM": ("Performance", "RAM_speed_mhz", extract_number),
+    "taille des semi-conducteurs": ("Performance", "semiconductor_size_nm", extract_number),
+    "Supporte 64-bit": ("Performance", "supports_64_bit", None),
+    "Utilise la technologie big.LITTLE": ("Performance", "uses_big_LITTLE_technology", None),
+    "threads de processeur": ("Performance", "processor_threads", extract_number),
+    "utilise le multithreading": ("Performance", "uses_multithreading", None),
+    # Cameras
+    "mégapixels (appareil photo principal)": ("Cameras", "main_camera_megapixels", text_and_value(process_megapixels)),
+    "mégapixels (caméra frontale)": ("Cameras", "front_camera_megapixels", extract_number),
+    "doté(e) d'une stabilisation optique d'images intégrée": ("Cameras", "built_in_optical_image_stabilization", None),
+    "enregistrement de vidéo": ("Cameras", "video_recording", None),
+    "plus grande ouverture": ("Cameras", "largest_aperture_f", extract_number),
+    "doté(e) d'un autofocus en continu lors de l'enregistrement des vidéos": ("Cameras", "continuous_autofocus_during_video_recording", None),
+    "peut enregistrer des vidéos au ralenti": ("Cameras", "can_record_slow_motion_videos", None),
+    "doté(e) d'un mode IGD": ("Cameras", "HDR_mode", None),
+    "zoom optique": ("Cameras", "optical_zoom_x", extract_number),
+    "possède un capteur CMOS": ("Cameras", "CMOS_sensor", None),
+    "doté(e) d'un ISO manuel": ("Cameras", "manual_ISO", None),
+    "doté(e) d'un mode rafale": ("Cameras", "burst_mode", None),
+    "doté(e) d'une focalisation manuelle": ("Cameras", "manual_focus", None),
+    "doté(e) d'une balance des blancs manuelle": ("Cameras", "manual_white_balance", None),
+    "prend des images brutes": ("Cameras", "takes_raw_images", None),
+    "doté(e) d'une touche AF": ("Cameras", "AF_touch", None),
+    "doté(e) d'une vitesse d'obturation manuelle": ("Cameras", "manual_shutter_speed", None),
+    "grande ouverture (caméra frontale)": ("Cameras", "large_aperture_front_camera_f", extract_number),
+    "supporte l'enregistrement Dolby Vision": ("Cameras", "Dolby_Vision_recording", None),
+    # Operating System
+    "version Android": ("Operating_System", "version", None),
+    "dispose d'options de confidentialité relatif à la localisation": ("Operating_System", "location_privacy_options", None),
+    "dispose d'options de confidentialité pour la caméra et le microphone": ("Operating_System", "camera_and_microphone_privacy_options", None),
+    "dispose de la fonctionnalité personnalisation du thème": ("Operating_System", "theme_customization", None),
+    "dispose de la fonctionnalité mode sombre": ("Operating_System", "dark_mode", None),
+    "dispose de la fonctionnalité partage du mot de passe Wi-Fi": ("Operating_System", "WiFi_password_sharing", None),
+    "dispose de la fonctionnalité contrôle de l'état de la batterie": ("Operating_System", "battery_health_check", None),
+    "dispose de la fonctionnalité mode extra dim": ("Operating_System", "extra_dim_mode", None),
+    "dispose de la fonctionnalité mode Concentration": ("Operating_System", "Focus_mode", None),
+    "dispose de la fonctionnalité thématisation dynamique": ("Operating_System", "dynamic_theming", None),
+    "pouvez décharger des applications": ("Operating_System", "offload_apps", None),
+    "Notifications personnalisables": ("Operating_System", "customizable_notifications", None),
+    "dispose de la fonctionnalité Texte en direct": ("Operating_System", "live_text", None),
+    "obtient des mises à jour directes de l'OS": ("Operating_System", "direct_OS_updates", None),
+    "dispose de la fonctionnalité démarrage rapide": ("Operating_System", "quick_start", None),
+    # Battery
+    "capacité de la batterie": ("Battery", "battery_capacity_mAh", extract_number),
+    "chargement sans fil": ("Battery", "wireless_charging", None),
+    "Prend en charge le chargement rapide": ("Battery", "fast_charging", None),
+    "vitesse de chargement": ("Battery", "charging_speed_w", extract_number),
+    "autonomie": ("Battery", "battery_life_h", extract_number),
+    # Audio
+    "équipé d'un connecteur pour brancher un micro-casque 3,5 mm": ("Audio", "mini_jack", None),
+    "doté(e) d'un haut-parleur stéréo intégré": ("Audio", "built_in_stereo_speaker", None),
+    "possède aptX": ("Audio", "aptX", None),
+    "possède LDAC": ("Audio", "LDAC", None),
+    "possède aptX HD": ("Audio", "aptX_HD", None),
+    # Features
+    "Prend en charge la 5G": ("Features", "supports_5G", None),
+    "version Wi-Fi": ("Features", "WiFi_version", None),
+    "vitesse de téléchargement": ("Features", "download_speed_mbps", extract_number),
+    "vitesse de téléchargement (upload)": ("Features", "upload_speed_mbps", extract_number),
+    "Dispose de ports USB de Type-C": ("Features", "USB_Type_C_ports", None),
+    "version USB": ("Features", "USB_version", None),
+    "doté(e) d'un périphérique NFC": ("Features", "NFC_device", None),
+    "cartes SIM": ("Features", "SIM_cards", None),
+    "Contient d'un lecteur d'empreintes digitales": ("Features", "fingerprint_reader", None),
+    "permet communication d'urgence via satellite": ("Features", "emergency_communication_via_satellite", None),
+    "détecte les accidents de la route": ("Features", "detects_car_accidents", None),
+    "version Bluetooth": ("Features", "Bluetooth_version", None),
+    "doté(e) d'un gyroscope": ("Features", "gyroscope", None),
+    "doté(e) d'un GPS": ("Features", "GPS", None),
+    "doté(e) d'une boussole": ("Features", "compass", None),
+    "compatible avec le WiFi": ("Features", "WiFi_compatible", None),
+    "Possède un détecteur infrarouge": ("Features", "infrared_sensor", None),
+    "dispose d'un accéléromètre": ("Features", "accelerometer", None),
+    "A un baromètre": ("Features", "barometer", None),
+    "supporte Galileo": ("Features", "supports_Galileo", None),
+}
+
+def report_unknown_labels(unknown_labels, limit=20):
+    """Print the property labels that are not mapped in SPEC_FIELDS"""
+    if not unknown_labels:
+        return
+    print(f"{len(unknown_labels)} unknown property labels ({sum(unknown_labels.values())} occurrences):")
+    for label, count in unknown_labels.most_common(limit):
+        print(f"  {count:>5}  {label}")
+
+def find_property_elements(prop):
+    """Return the first element of each role in a property block, found in a single walk"""
+    found = {}
+    for elem in prop.descendants:
+        if not isinstance(elem, Tag):
+            continue
+        for cls in elem.get("class") or ():
+            role = PROPERTY_CLASSES.get(cls)
+            if role and role not in found:
+                found[role] = elem
+    return found
+
+def read_properties_soup(html_content, parser):
+    """
+    BeautifulSoup backend: return the phone name and the (label, value) pairs of a page.
+    Values are only resolved for labels present in SPEC_FIELDS.
+    """
+    soup = BeautifulSoup(html_content, parser, parse_only=SPEC_STRAINER)
+
+    summary_name = soup.find(class_="summaryName selected")
+    name_text = summary_name.text if summary_name else None
+
+    properties = []
+    for prop in soup.find_all(class_="Property__property___pNjSI"):
+        elements = find_property_elements(prop)
+        label = elements.get("label")
+        if not label:
+            continue
+
+        label_text = label.text.strip()
+        if label_text not in SPEC_FIELDS:
+            properties.append((label_text, None))
+            continue
+
+        value_elem = elements.get("number") or elements.get("string")
+        boolean_elem = elements.get("boolean")
+        ranked_elem = elements.get("ranked")
+
+        # Get the value based on the type of element
+        if value_elem and "suggestion" not in value_elem.get("class", []):
+            value_text = value_elem.text.strip()
+        elif boolean_elem:
+            value_text = check_boolean_value(boolean_elem)
+        elif ranked_elem:
+            value_text = ranked_elem.find("p").text.strip()
+        else:
+            continue
+        properties.append((label_text, value_text))
+
+    return name_text, properties
+
+def has_content(elem):
+    """lxml equivalent of the truthiness of a BeautifulSoup tag (it has children or text)"""
+    return elem is not None and (bool(elem.text) or len(elem) > 0)
+
+def text_of(elem):
+    """Text of an lxml element and its descendants, like BeautifulSoup's .text"""
+    return "".join(elem.itertext())
+
+def spec_block_kind(elem):
+    """Return 'name' or 'property' for the elements read_properties_* look at, None otherwise"""
+    classes = elem.get("class")
+    if not classes:
+        return None
+    if classes == "summaryName selected":
+        return "name"
+    if "Property__property___pNjSI" in classes.split():
+        return "property"
+    return None
+
+def read_property_lxml(prop):
+    """Resolve the (label, value) pair of an lxml property block, None when it has no value"""
+    elements = {}
+    for elem in prop.iterdescendants(tag=etree.Element):
+        for cls in (elem.get("class") or "").split():
+            role = PROPERTY_CLASSES.get(cls)
+            if role and role not in elements:
+                elements[role] = elem
+    label = elements.get("label")
+    if not has_content(label):
+        return None
+
+    label_text = text_of(label).strip()
+    if label_text not in SPEC_FIELDS:
+        return label_text, None
+
+    value_elem = elements.get("number")
+    if not has_content(value_elem):
+        value_elem = elements.get("string")
+    boolean_elem = elements.get("boolean")
+    ranked_elem = elements.get("ranked")
+
+    if has_content(value_elem) and "suggestion" not in value_elem.get("class", "").split():
+        return label_text, text_of(value_elem).strip()
+    if has_content(boolean_elem):
+        return label_text, "✔" in text_of(boolean_elem)
+    if has_content(ranked_elem):
+        return label_text, text_of(ranked_elem.find(".//p")).strip()
+    return None
+
+def read_properties_lxml(html_content, chunk_size=64 * 1024):
+    """
+    lxml backend of read_properties_soup, same output without building a BeautifulSoup tree.
+    The page is pull-parsed and every element outside the name and property blocks is
+    discarded as soon as it is closed, so the whole document tree never exists in memory.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    name_text = None
+    properties = []
+    depth = 0  # > 0 while inside a name or property block
+
+    chunks = [html_content[i:i + chunk_size] for i in range(0, len(html_content), chunk_size)]
+    for chunk in chunks + [None]:
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+
+        for event, elem in parser.read_events():
+            if event == "start":
+                if depth or spec_block_kind(elem):
+                    depth += 1
+                continue
+
+            if depth:
+                depth -= 1
+                if depth:
+                    continue
+                if spec_block_kind(elem) == "name":
+                    if name_text is None and has_content(elem):
+                        name_text = text_of(elem)
+                else:
+                    prop = read_property_lxml(elem)
+                    if prop:
+                        properties.append(prop)
+
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    return name_text, properties
+
+def build_specs(name_text, properties, unknown_labels=None):
+    """
+    Map a phone name and its (label, value) pairs onto the specs structure.
+    Labels missing from SPEC_FIELDS are counted into `unknown_labels` (a Counter) when given.
+    """
     # Initialize the structure with None/default values
     specs = {
     "brand_and_full_name": "",
@@ -298,242 +884,24 @@ def parse_phone_specs(html_content):
     }
 }
 
-    summary_name = soup.find(class_="summaryName selected")
-    if summary_name:
-        full_name = summary_name.text.strip()
+    if name_text:
+        full_name = name_text.strip()
         print(full_name)
         # Remove anything in parentheses
         full_name = re.sub(r'\([^)]*\)', '', full_name).strip()
         specs["brand_and_full_name"] = full_name
 
-    
-    properties = soup.find_all(class_="Property__property___pNjSI")
-
-    for prop in properties:
-        label = prop.find(class_="Property__label___zWFei")
-        if not label:
-            continue
-            
-        label_text = label.text.strip()
-        value_elem = prop.find(class_="Number__number___G9V3S") or prop.find(class_="String__string___sxJBL")
-        boolean_elem = prop.find(class_="Boolean__boolean___i1Pee")
-        ranked_elem = prop.find(class_="ranked")
-        
-        # Get the value based on the type of element
-        if value_elem and "suggestion" not in value_elem.get("class", []):
-            value_text = value_elem.text.strip()
-        elif boolean_elem:
-            value_text = check_boolean_value(boolean_elem)
-        elif ranked_elem:
-            value_text = ranked_elem.find("p").text.strip()
-        else:
+    for label_text, value_text in properties:
+        field = SPEC_FIELDS.get(label_text)
+        if field is None:
+            if unknown_labels is not None:
+                unknown_labels[label_text] += 1
             continue
 
-        # Map the found properties to our structure
-        # Design section
-        if label_text == "poids":
-            specs["Design"]["weight_g"] = extract_number(value_text)
-        elif label_text == "épaisseur":
-            specs["Design"]["thickness_mm"] = extract_number(value_text)
-        elif label_text == "largeur":
-            specs["Design"]["width_mm"] = extract_number(value_text)
-        elif label_text == "hauteur":
-            specs["Design"]["height_mm"] = extract_number(value_text)
-        elif label_text == "indice de protection (IP)":
-            specs["Design"]["IP_rating"] = value_text
-        elif label_text == "volume":
-            specs["Design"]["volume_cm3"] = extract_number(value_text)
-        
-        # Screen section
-        elif label_text == "taille d'écran":
-            specs["Screen"]["screen_size_in"] = extract_number(value_text)
-        elif label_text == "type d'écran":
-            specs["Screen"]["screen_type"] = value_text
-        elif label_text == "densité de pixels":
-            specs["Screen"]["pixel_density_ppi"] = extract_number(value_text)
-        elif label_text == "résolution":
-            specs["Screen"]["resolution"] = value_text
-        elif label_text == "Taux de rafraîchissement":
-            specs["Screen"]["refresh_rate_hz"] = extract_number(value_text)
-        elif label_text == "luminosité (typique)":
-            specs["Screen"]["typical_brightness_nits"] = extract_number(value_text)
-        elif label_text == "compatible HDR10":
-            specs["Screen"]["HDR10_compatible"] = value_text if isinstance(value_text, bool) else None
-        elif label_text == "compatible Dolby Vision":
-            specs["Screen"]["Dolby_Vision_compatible"] = value_text if isinstance(value_text, bool) else None
-    
-         # Performance section
-        elif label_text == "espace de stockage":
-            specs["Performance"]["storage_options_gb"] = extract_number(value_text)
-        elif label_text == "mémoire vive (RAM)":
-            specs["Performance"]["RAM_gb"] = extract_number(value_text)
-        elif label_text == "Score du benchmark AnTuTu":
-            specs["Performance"]["AnTuTu_benchmark_score"] = extract_number(value_text)
-        elif label_text == "nom du GPU":
-            specs["Performance"]["GPU_name"] = value_text
-        elif label_text == "vitesse du processeur":
-            text, value = process_processor_speed(value_text)
-            specs["Performance"]["processor_speed_ghz"] = {
-                "text": text,
-                "value": value
-            }
-        elif label_text == "vitesse RAM":
-            specs["Performance"]["RAM_speed_mhz"] = extract_number(value_text)
-        elif label_text == "taille des semi-conducteurs":
-            specs["Performance"]["semiconductor_size_nm"] = extract_number(value_text)
-        elif label_text == "Supporte 64-bit":
-            specs["Performance"]["supports_64_bit"] = value_text
-        elif label_text == "Utilise la technologie big.LITTLE":
-            specs["Performance"]["uses_big_LITTLE_technology"] = value_text
-        elif label_text == "threads de processeur":
-            specs["Performance"]["processor_threads"] = extract_number(value_text)
-        elif label_text == "utilise le multithreading":
-            specs["Performance"]["uses_multithreading"] = value_text
-            
-    # Cameras section
-        elif label_text == "mégapixels (appareil photo principal)":
-            text, value = process_megapixels(value_text)
-            specs["Cameras"]["main_camera_megapixels"] = {
-                "text": text,
-                "value": value
-            }
-        elif label_text == "mégapixels (caméra frontale)":
-            specs["Cameras"]["front_camera_megapixels"] = extract_number(value_text)
-        elif label_text == "doté(e) d'une stabilisation optique d'images intégrée":
-            specs["Cameras"]["built_in_optical_image_stabilization"] = value_text
-        elif label_text == "enregistrement de vidéo":
-            specs["Cameras"]["video_recording"] = value_text
-        elif label_text == "plus grande ouverture":
-            specs["Cameras"]["largest_aperture_f"] = extract_number(value_text)
-        elif label_text == "doté(e) d'un autofocus en continu lors de l'enregistrement des vidéos":
-            specs["Cameras"]["continuous_autofocus_during_video_recording"] = value_text
-        elif label_text == "peut enregistrer des vidéos au ralenti":
-            specs["Cameras"]["can_record_slow_motion_videos"] = value_text
-        elif label_text == "doté(e) d'un mode IGD":
-            specs["Cameras"]["HDR_mode"] = value_text
-        elif label_text == "zoom optique":
-            specs["Cameras"]["optical_zoom_x"] = extract_number(value_text)
-        elif label_text == "possède un capteur CMOS":
-            specs["Cameras"]["CMOS_sensor"] = value_text
-        elif label_text == "doté(e) d'un ISO manuel":
-            specs["Cameras"]["manual_ISO"] = value_text
-        elif label_text == "doté(e) d'un mode rafale":
-            specs["Cameras"]["burst_mode"] = value_text
-        elif label_text == "doté(e) d'une focalisation manuelle":
-            specs["Cameras"]["manual_focus"] = value_text
-        elif label_text == "doté(e) d'une balance des blancs manuelle":
-            specs["Cameras"]["manual_white_balance"] = value_text
-        elif label_text == "prend des images brutes":
-            specs["Cameras"]["takes_raw_images"] = value_text
-        elif label_text == "doté(e) d'une touche AF":
-            specs["Cameras"]["AF_touch"] = value_text
-        elif label_text == "doté(e) d'une vitesse d'obturation manuelle":
-            specs["Cameras"]["manual_shutter_speed"] = value_text
-        elif label_text == "grande ouverture (caméra frontale)":
-            specs["Cameras"]["large_aperture_front_camera_f"] = extract_number(value_text)
-        elif label_text == "supporte l'enregistrement Dolby Vision":
-            specs["Cameras"]["Dolby_Vision_recording"] = value_text
-            
-        # Operating System section
-        elif label_text == "version Android":
-            specs["Operating_System"]["version"] = value_text
-        elif label_text == "dispose d'options de confidentialité relatif à la localisation":
-            specs["Operating_System"]["location_privacy_options"] = value_text
-        elif label_text == "dispose d'options de confidentialité pour la caméra et le microphone":
-            specs["Operating_System"]["camera_and_microphone_privacy_options"] = value_text
-        elif label_text == "dispose de la fonctionnalité personnalisation du thème":
-            specs["Operating_System"]["theme_customization"] = value_text
-        elif label_text == "dispose de la fonctionnalité mode sombre":
-            specs["Operating_System"]["dark_mode"] = value_text
-        elif label_text == "dispose de la fonctionnalité partage du mot de passe Wi-Fi":
-            specs["Operating_System"]["WiFi_password_sharing"] = value_text
-        elif label_text == "dispose de la fonctionnalité contrôle de l'état de la batterie":
-            specs["Operating_System"]["battery_health_check"] = value_text
-        elif label_text == "dispose de la fonctionnalité mode extra dim":
-            specs["Operating_System"]["extra_dim_mode"] = value_text
-        elif label_text == "dispose de la fonctionnalité mode Concentration":
-            specs["Operating_System"]["Focus_mode"] = value_text
-        elif label_text == "dispose de la fonctionnalité thématisation dynamique":
-            specs["Operating_System"]["dynamic_theming"] = value_text
-        elif label_text == "pouvez décharger des applications":
-            specs["Operating_System"]["offload_apps"] = value_text
-        elif label_text == "Notifications personnalisables":
-            specs["Operating_System"]["customizable_notifications"] = value_text
-        elif label_text == "dispose de la fonctionnalité Texte en direct":
-            specs["Operating_System"]["live_text"] = value_text
-        elif label_text == "obtient des mises à jour directes de l'OS":
-            specs["Operating_System"]["direct_OS_updates"] = value_text
-        elif label_text == "dispose de la fonctionnalité démarrage rapide":
-            specs["Operating_System"]["quick_start"] = value_text
-
-            
-        # Battery section
-        elif label_text == "capacité de la batterie":
-            specs["Battery"]["battery_capacity_mAh"] = extract_number(value_text)
-        elif label_text == "chargement sans fil":
-            specs["Battery"]["wireless_charging"] = value_text
-        elif label_text == "Prend en charge le chargement rapide":
-            specs["Battery"]["fast_charging"] = value_text
-        elif label_text == "vitesse de chargement":
-            specs["Battery"]["charging_speed_w"] = extract_number(value_text)
-        elif label_text == "autonomie":
-            specs["Battery"]["battery_life_h"] = extract_number(value_text)
-            
-        # Audio section
-        elif label_text == "équipé d'un connecteur pour brancher un micro-casque 3,5 mm":
-            specs["Audio"]["mini_jack"] = value_text
-        elif label_text == "doté(e) d'un haut-parleur stéréo intégré":
-            specs["Audio"]["built_in_stereo_speaker"] = value_text
-        elif label_text == "possède aptX":
-            specs["Audio"]["aptX"] = value_text
-        elif label_text == "possède LDAC":
-            specs["Audio"]["LDAC"] = value_text
-        elif label_text == "possède aptX HD":
-            specs["Audio"]["aptX_HD"] = value_text
-            
-        # Features section
-        elif label_text == "Prend en charge la 5G":
-            specs["Features"]["supports_5G"] = value_text
-        elif label_text == "version Wi-Fi":
-            specs["Features"]["WiFi_version"] = value_text
-        elif label_text == "vitesse de téléchargement":
-            specs["Features"]["download_speed_mbps"] = extract_number(value_text)
-        elif label_text == "vitesse de téléchargement (upload)":
-            specs["Features"]["upload_speed_mbps"] = extract_number(value_text)
-        elif label_text == "Dispose de ports USB de Type-C":
-            specs["Features"]["USB_Type_C_ports"] = value_text
-        elif label_text == "version USB":
-            specs["Features"]["USB_version"] = value_text
-        elif label_text == "doté(e) d'un périphérique NFC":
-            specs["Features"]["NFC_device"] = value_text
-        elif label_text == "cartes SIM":
-            specs["Features"]["SIM_cards"] = value_text
-        elif label_text == "Contient d'un lecteur d'empreintes digitales":
-            specs["Features"]["fingerprint_reader"] = value_text
-        elif label_text == "permet communication d'urgence via satellite":
-            specs["Features"]["emergency_communication_via_satellite"] = value_text
-        elif label_text == "détecte les accidents de la route":
-            specs["Features"]["detects_car_accidents"] = value_text
-        elif label_text == "version Bluetooth":
-            specs["Features"]["Bluetooth_version"] = value_text
-        elif label_text == "doté(e) d'un gyroscope":
-            specs["Features"]["gyroscope"] = value_text
-        elif label_text == "doté(e) d'un GPS":
-            specs["Features"]["GPS"] = value_text
-        elif label_text == "doté(e) d'une boussole":
-            specs["Features"]["compass"] = value_text
-        elif label_text == "compatible avec le WiFi":
-            specs["Features"]["WiFi_compatible"] = value_text
-        elif label_text == "Possède un détecteur infrarouge":
-            specs["Features"]["infrared_sensor"] = value_text
-        elif label_text == "dispose d'un accéléromètre":
-            specs["Features"]["accelerometer"] = value_text
-        elif label_text == "A un baromètre":
-            specs["Features"]["barometer"] = value_text
-        elif label_text == "supporte Galileo":
-            specs["Features"]["supports_Galileo"] = value_text
-
-        # After all properties are parsed, append storage and RAM to brand_and_full_name
+        section, key, convert = field
+        specs[section][key] = convert(value_text) if convert else value_text
+
+    # After all properties are parsed, append storage and RAM to brand_and_full_name
     if specs["Performance"]["storage_options_gb"] is not None and specs["Performance"]["RAM_gb"] is not None:
         storage = int(specs["Performance"]["storage_options_gb"])
         ram = int(specs["Performance"]["RAM_gb"])
@@ -541,12 +909,59 @@ def parse_phone_specs(html_content):
 
     return specs
 
+def parse_phone_specs(html_content, unknown_labels=None, parser=HTML_PARSER):
+    """
+    Parse a versus.com phone page into the specs structure.
+    `parser` is 'lxml' (used when installed) or a BeautifulSoup tree builder such as 'html.parser'.
+    """
+    if parser == 'lxml' and lxml is not None:
+        name_text, properties = read_properties_lxml(html_content)
+    else:
+        name_text, properties = read_properties_soup(html_content, parser)
+    return build_specs(name_text, properties, unknown_labels)
+
 def save_specs_to_json(specs, output_path):
-    """Save the extracted specifications to a JSON file"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(specs, f, ensure_ascii=False, indent=2)
+    """
+    Save the extracted specifications to a JSON file.
+    The file is written under a temporary name and renamed, so concurrent workers
+    writing the same phone never leave a half-written or interleaved file.
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(specs, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape versus.com phone pages into resultsWeb/*.json")
+    parser.add_argument("--output", default="resultsWeb", help="folder of the JSON files")
+    parser.add_argument("--snapshots", default="snapshots", help="folder of the raw page snapshots")
+    parser.add_argument("--drivers", type=int, default=1, help="headless Chrome instances run in parallel")
+    parser.add_argument("--pages-per-driver", type=int, default=50, help="restart a driver after this many pages")
+    parser.add_argument("--url-timeout", type=float, default=30, help="seconds allowed to load one URL")
+    parser.add_argument("--lean", action="store_true", help="block images, fonts, stylesheets, ads and trackers")
+    parser.add_argument("--block-list", help="file of URL patterns to block in lean mode instead of the default list")
+    parser.add_argument("--specs-only", action="store_true",
+                        help="extract the spec properties in the browser instead of transferring the whole page")
+    parser.add_argument("--profile-dir", help="keep a Chrome profile and disk cache per driver worker in this folder")
+    parser.add_argument("--cache-size-mb", type=float, default=512, help="disk cache cap of each worker profile")
+    parser.add_argument("--manifest", default="scrape_manifest.sqlite", help="SQLite file tracking the scraped URLs")
+    parser.add_argument("--max-age-days", type=float, help="re-fetch URLs scraped longer ago than this")
+    parser.add_argument("--all", action="store_true", help="fetch every URL of urls.txt, whatever the manifest says")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("scrape", help="fetch the URLs of urls.txt with Chrome (default)")
+    reparse_parser = subparsers.add_parser("reparse", help="rebuild the JSON files from the snapshots only")
+    reparse_parser.add_argument("--workers", type=int, help="parser processes, one per core by default")
+    args = parser.parse_args()
+
+    if args.command == "reparse":
+        reparse_snapshots(args.snapshots, args.output, args.workers)
+        return
 
-if __name__ == "__main__":
     # Read URLs from urls.txt file
     try:
         with open('urls.txt', 'r') as f:
@@ -555,6 +970,18 @@ if __name__ == "__main__":
             print("Error: No valid URLs found in urls.txt. Each line should contain a valid URL starting with http")
         else:
             print(f"Found {len(urls)} valid URLs to process")
-            scrape_phones_from_urls(urls)
+            blocked_urls = load_block_list(args.block_list) if args.block_list else None
+            manifest = ScrapeManifest(args.manifest)
+            max_age = timedelta(days=args.max_age_days) if args.max_age_days is not None else None
+            try:
+                scrape_phones_from_urls(urls, args.output, args.snapshots, args.drivers,
+                                        args.pages_per_driver, args.url_timeout, args.lean, blocked_urls,
+                                        manifest, max_age, resume=not args.all, specs_only=args.specs_only,
+                                        profile_root=args.profile_dir, cache_size_mb=args.cache_size_mb)
+            finally:
+                manifest.close()
     except FileNotFoundError:
-        print("Error: urls.txt file not found. Please create it with one URL per line.")
\ No newline at end of file
+        print("Error: urls.txt file not found. Please create it with one URL per line.")
+
+if __name__ == "__main__":
+    main()
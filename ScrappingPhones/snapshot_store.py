@@ -0,0 +1,111 @@
+"""
+Content-addressed store of the raw pages fetched by scrappingPhonesWeb.py.
+
+Every page is compressed (zstd when the `zstandard` package is installed,
+gzip otherwise) and written once under objects/ by the sha256 of its HTML.
+index.jsonl gets one line per fetch with the URL, the fetch time and the hash,
+so the specs can be rebuilt from the snapshots without opening Chrome again.
+A snapshot is either a whole page ("page", .html) or the spec properties
+extracted in the browser ("properties", .json, see scrappingPhonesWeb.py).
+
+    snapshots/
+        index.jsonl
+        objects/ab/ab12...ef.html.zst
+"""
+from datetime import datetime, timezone
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+INDEX_FILENAME = "index.jsonl"
+EXTENSIONS = {"page": "html", "properties": "json"}
+
+
+def compress(data, codec):
+    if codec == "zst":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def decompress(data, codec):
+    if codec == "zst":
+        if zstandard is None:
+            raise RuntimeError("This snapshot is zstd compressed, install the zstandard package to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotStore:
+    """Compressed page snapshots keyed by content hash, with an index of (url, fetch time)"""
+
+    def __init__(self, root="snapshots", codec=None):
+        self.root = Path(root)
+        self.codec = codec or ("zst" if zstandard is not None else "gz")
+        self.index_path = self.root / INDEX_FILENAME
+        self._index_lock = threading.Lock()  # The scraper drivers share one store
+
+    def object_path(self, digest, codec=None, kind="page"):
+        return self.root / "objects" / digest[:2] / f"{digest}.{EXTENSIONS[kind]}.{codec or self.codec}"
+
+    def save(self, url, content, fetched_at=None, kind="page"):
+        """Store the content if it is new and append the fetch to the index"""
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest, kind=kind)
+        stored_size = None
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = compress(data, self.codec)
+            # Write next to the target then rename, a crashed run never leaves a truncated object
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, path)
+            stored_size = len(compressed)
+
+        entry = {
+            "url": url,
+            "fetched_at": (fetched_at or datetime.now(timezone.utc)).isoformat(timespec="seconds"),
+            "sha256": digest,
+            "kind": kind,
+            "codec": self.codec,
+            "size": len(data),
+            "stored_size": stored_size if stored_size is not None else path.stat().st_size,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._index_lock, open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+    def entries(self):
+        """Yield the index entries in fetch order, skipping a torn last line"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def latest(self):
+        """Return {url: entry} for the most recent fetch of every URL"""
+        latest = {}
+        for entry in self.entries():
+            previous = latest.get(entry["url"])
+            if previous is None or entry["fetched_at"] >= previous["fetched_at"]:
+                latest[entry["url"]] = entry
+        return latest
+
+    def load(self, entry):
+        """Return the content (HTML or properties JSON, see entry["kind"]) of an index entry"""
+        codec = entry.get("codec", self.codec)
+        data = self.object_path(entry["sha256"], codec, entry.get("kind", "page")).read_bytes()
+        return decompress(data, codec).decode("utf-8")
@@ -1,209 +1,38 @@
+import argparse
 import os
+import sys
 import xml.etree.ElementTree as ET
+from pathlib import Path
 from typing import List, Dict, Callable
-import requests
 import re
 from datetime import datetime
 # import gzip
-from difflib import SequenceMatcher
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ScrappingCommon.pairs import PairSpace
+from ScrappingCommon.reference_matcher import ReferenceMatcher
+from ScrappingCommon.sitemap_jobs import PairShardJob, pair_shard_jobs, run_pair_shard_jobs
+from ScrappingCommon.sitemap_writer import url_record, write_sitemap_shards
+from ScrappingCommon.strapi_cache import cached_collection
 
 # Constants
 BASE_URL = 'https://siliconcompare.com'  # Base URL of the website
 MAX_URLS_PER_FILE = 45000  # Maximum number of URLs per file
 OUTPUT_DIR = '../frontend/public/sitemaps'  # Output directory
 LANGUAGES = ['en', 'fr', 'es']  # Supported languages
+WORKERS = None  # Processes writing the comparison sitemaps, None for one per CPU
+GZIP_LEVEL = None  # gzip level (1-9) of the sitemap files, written as .xml.gz; None for plain XML
 
-# API endpoints for data
-ENDPOINTS = {
-    'phone': 'http://localhost:1337/api/phones',
-    'cpu': 'http://localhost:1337/api/cpus',
-    'gpu': 'http://localhost:1337/api/gpus',
+# Strapi collections for data, read through the local cache (ScrappingCommon/strapi_cache.py)
+API_BASE_URL = 'http://localhost:1337/api'
+COLLECTIONS = {
+    'phone': 'phones',
+    'cpu': 'cpus',
+    'gpu': 'gpus',
 }
 
-def generate_general_sitemaps() -> Dict[str, List[str]]:
-    """
-    Generate sitemaps for general pages like homepage, privacy, etc., for each language.
-    """
-    print("Generating general sitemaps...")
-    general_pages = ['', '/phone/compare', '/cpu/compare', '/gpu/compare',]
-    sitemapfiles = {}
-    
-    for lang in LANGUAGES:
-        sitemapindex = 1
-        current_sitemap_filename = f"general-sitemap-{lang}-{sitemapindex}.xml"
-        current_sitemap = ET.Element('urlset', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
-        sitemapfiles[lang] = []
-        
-        for page in general_pages:
-            url_elem = ET.SubElement(current_sitemap, 'url')
-            loc_elem = ET.SubElement(url_elem, 'loc')
-            loc_elem.text = f"{BASE_URL}/{lang}{page}"
-            
-            lastmod_elem = ET.SubElement(url_elem, 'lastmod')
-            lastmod_elem.text = datetime.now().strftime('%Y-%m-%d')
-            
-            priority_elem = ET.SubElement(url_elem, 'priority')
-            priority_elem.text = '1.0' if page == 'home' else '0.8'
-        
-        # Save the sitemap file
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
-        tree = ET.ElementTree(current_sitemap)
-        with open(os.path.join(OUTPUT_DIR, current_sitemap_filename), 'wb') as f:
-            tree.write(f, encoding='utf-8', xml_declaration=True)
-        
-        sitemapfiles[lang].append(current_sitemap_filename)
-        print(f"Generated sitemap for {lang}: {current_sitemap_filename}")
-    
-    return sitemapfiles
-
-def is_similar(item: str, reference_list: List[str], threshold: float) -> bool:
-    """
-    Check if the item is similar to any element in the reference list based on a similarity threshold.
-    """
-    for ref in reference_list:
-        similarity = SequenceMatcher(None, item, ref).ratio()
-        if similarity >= threshold:
-            return True
-    return False
-
-def transform_phones(phones: List[Dict]) -> List[str]:
-    """Transform phone data into URL-friendly names."""
-    def process_phone(phone):
-        brand_and_full_name = phone.get('attributes', {}).get('phone', {}).get('brand_and_full_name')
-        if not brand_and_full_name:
-            print(f"Warning: Missing brand_and_full_name for phone: {phone}")
-            return None
-        
-        processed_name = re.split(r'\s+(?:\d+GB|\d+\s*GB\s*RAM)', brand_and_full_name)[0]
-        return re.sub(r'\s+', '-', processed_name.strip())
-    
-    processed_phones = list(set(filter(None, map(process_phone, phones))))
-    return processed_phones
-
-def transform_cpus(cpus: List[Dict], reference_list: List[str]) -> List[str]:
-    """Transform and filter CPU data."""
-    def process_cpu(cpu):
-        cpu_name = cpu.get('attributes', {}).get('CPU', {}).get('cpu_name')
-        if not cpu_name:
-            print(f"Warning: Missing cpu_name for cpu: {cpu}")
-            return None
-        
-        formatted_name = re.sub(r'\s+', '-', cpu_name.strip())
-        return formatted_name if is_similar(formatted_name, reference_list, 0.8) else None
-    
-    processed_cpus = list(set(filter(None, map(process_cpu, cpus))))
-    return processed_cpus
-
-def transform_gpus(gpus: List[Dict], reference_list: List[str]) -> List[str]:
-    """Transform and filter GPU data."""
-    def process_gpu(gpu):
-        gpu_name = gpu.get('attributes', {}).get('GPU', {}).get('videocard_name')
-        if not gpu_name:
-            print(f"Warning: Missing videocard_name for gpu: {gpu}")
-            return None
-        
-        formatted_name = re.sub(r'\s+', '-', gpu_name.strip())
-        return formatted_name if is_similar(formatted_name, reference_list, 0.65) else None
-    
-    processed_gpus = list(set(filter(None, map(process_gpu, gpus))))
-    return processed_gpus
-
-def generate_combinations(items: List[str]) -> List[str]:
-    """Generate comparison combinations."""
-    combinations = []
-    for i, item1 in enumerate(items):
-        for item2 in items[i+1:]:
-            sorted_items = sorted([item1, item2])
-            combinations.append(f"{sorted_items[0]}-vs-{sorted_items[1]}")
-    return combinations
-
-def generate_sitemaps_for_category(
-    category: str, 
-    transform_func: Callable[[List[Dict], List[str]], List[str]],
-    reference_list: List[str] = None
-) -> List[str]:
-    """Generate sitemaps for a specific category."""
-    print(f"Fetching {category} data from API...")
-    response = requests.get(ENDPOINTS[category])
-    if reference_list:
-        items = transform_func(response.json()['data'], reference_list)
-    else:
-        items = transform_func(response.json()['data'])
-    print(f"Found {len(items)} {category} items")
-
-    print("Generating combinations...")
-    combinations = generate_combinations(items)
-    print(f"Generated {len(combinations)} combinations")
-
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    sitemapfiles = []
-    urlcount = 0
-    
-    for lang in LANGUAGES:
-        print(f"Processing language: {lang}")
-        sitemapindex = 1
-        current_sitemap = None
-        current_sitemap_filename = None
-        
-        for combination in combinations:
-            if urlcount == 0:
-                current_sitemap_filename = f"{category}-sitemap-{lang}-{sitemapindex}.xml"
-                current_sitemap = ET.Element('urlset', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
-                sitemapfiles.append(current_sitemap_filename)
-            
-            url_elem = ET.SubElement(current_sitemap, 'url')
-            loc_elem = ET.SubElement(url_elem, 'loc')
-            loc_elem.text = f"{BASE_URL}/{lang}/{category}/compare/{combination}"
-            
-            lastmod_elem = ET.SubElement(url_elem, 'lastmod')
-            lastmod_elem.text = datetime.now().strftime('%Y-%m-%d')
-            
-            priority_elem = ET.SubElement(url_elem, 'priority')
-            priority_elem.text = '0.5'
-            
-            urlcount += 1
-            
-            if urlcount >= MAX_URLS_PER_FILE:
-                tree = ET.ElementTree(current_sitemap)
-                with open(os.path.join(OUTPUT_DIR, current_sitemap_filename), 'wb') as f:
-                    tree.write(f, encoding='utf-8', xml_declaration=True)
-                urlcount = 0
-                sitemapindex += 1
-        
-        if urlcount > 0:
-            tree = ET.ElementTree(current_sitemap)
-            with open(os.path.join(OUTPUT_DIR, current_sitemap_filename), 'wb') as f:
-                tree.write(f, encoding='utf-8', xml_declaration=True)
-            urlcount = 0
-            sitemapindex += 1
-    
-    print(f"Generated {len(sitemapfiles)} sitemap files for {category}")
-    return sitemapfiles
-
-def generate_sitemap_index(sitemap_files: Dict[str, List[str]]) -> None:
-    """Generate the sitemap index file."""
-    print("Generating sitemap index...")
-    sitemapindex = ET.Element('sitemapindex', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
-    
-    for category_files in sitemap_files.values():
-        for file in category_files:
-            sitemap_elem = ET.SubElement(sitemapindex, 'sitemap')
-            loc_elem = ET.SubElement(sitemap_elem, 'loc')
-            loc_elem.text = f"{BASE_URL}/sitemaps/{file}"
-            
-            lastmod_elem = ET.SubElement(sitemap_elem, 'lastmod')
-            lastmod_elem.text = datetime.now().strftime('%Y-%m-%d')
-    
-    tree = ET.ElementTree(sitemapindex)
-    with open('../frontend/public/sitemap-index.xml', 'wb') as f:
-        tree.write(f, encoding='utf-8', xml_declaration=True)
-    print("Sitemap index written successfully")
-
-def generate_all_sitemaps():
-    """Main function to generate all sitemaps."""
-    sitemapfiles = {}
-
-    reference_cpus = [
+# Only the CPUs and GPUs similar to one of these get comparison pages
+REFERENCE_CPUS = [
     'Intel Core i5-1235U',
     'AMD Ryzen 5 5600G',
     'AMD Ryzen 5 5600X',
@@ -405,7 +234,7 @@ def generate_all_sitemaps():
     'AMD Ryzen 7 Pro 7730U',
     'Intel Core i5-6400',
 ]
-    reference_gpus = [
+REFERENCE_GPUS = [
     'Nvidia GeForce RTX 4060',
     'Nvidia GeForce RTX 3060',
     'AMD Radeon RX 580',
@@ -608,27 +437,195 @@ def generate_all_sitemaps():
     'Asus Dual GeForce RTX 3060',
 ]
 
-    print('Generating phone sitemaps...')
-    sitemapfiles['phone'] = generate_sitemaps_for_category('phone', transform_phones)
+def today() -> str:
+    """lastmod of this run, computed once and shared by every URL."""
+    return datetime.now().strftime('%Y-%m-%d')
+
+def generate_general_sitemaps(lastmod: str = None, compresslevel: int = GZIP_LEVEL) -> Dict[str, List[str]]:
+    """
+    Generate sitemaps for general pages like homepage, privacy, etc., for each language.
+    """
+    print("Generating general sitemaps...")
+    lastmod = lastmod or today()
+    general_pages = ['', '/phone/compare', '/cpu/compare', '/gpu/compare',]
+    sitemapfiles = {}
+    
+    for lang in LANGUAGES:
+        records = (url_record(f"{BASE_URL}/{lang}{page}", lastmod, '1.0' if page == 'home' else '0.8')
+                   for page in general_pages)
+        sitemapfiles[lang] = write_sitemap_shards(OUTPUT_DIR, f"general-sitemap-{lang}-{{index}}.xml", records,
+                                                  max_urls=MAX_URLS_PER_FILE, compresslevel=compresslevel)
+        print(f"Generated sitemap for {lang}: {', '.join(sitemapfiles[lang])}")
+    
+    return sitemapfiles
+
+def is_similar(item: str, reference_list: List[str], threshold: float) -> bool:
+    """
+    Check if the item is similar to any element in the reference list based on a similarity threshold.
+    Prefer a ReferenceMatcher built once when many items are checked against the same list.
+    """
+    return ReferenceMatcher(reference_list, threshold).matches(item)
+
+def transform_phones(phones: List[Dict]) -> List[str]:
+    """Transform phone data into URL-friendly names."""
+    def process_phone(phone):
+        brand_and_full_name = phone.get('attributes', {}).get('phone', {}).get('brand_and_full_name')
+        if not brand_and_full_name:
+            print(f"Warning: Missing brand_and_full_name for phone: {phone}")
+            return None
+        
+        processed_name = re.split(r'\s+(?:\d+GB|\d+\s*GB\s*RAM)', brand_and_full_name)[0]
+        return re.sub(r'\s+', '-', processed_name.strip())
+    
+    processed_phones = list(set(filter(None, map(process_phone, phones))))
+    return processed_phones
+
+def transform_cpus(cpus: List[Dict], reference_list: List[str]) -> List[str]:
+    """Transform and filter CPU data."""
+    matcher = ReferenceMatcher(reference_list, 0.8)
 
-    print('Generating CPU sitemaps...')
-    sitemapfiles['cpu'] = generate_sitemaps_for_category('cpu', transform_cpus, reference_cpus)
+    def process_cpu(cpu):
+        cpu_name = cpu.get('attributes', {}).get('CPU', {}).get('cpu_name')
+        if not cpu_name:
+            print(f"Warning: Missing cpu_name for cpu: {cpu}")
+            return None
+        
+        formatted_name = re.sub(r'\s+', '-', cpu_name.strip())
+        return formatted_name if matcher.matches(formatted_name) else None
+    
+    processed_cpus = list(set(filter(None, map(process_cpu, cpus))))
+    return processed_cpus
 
-    print('Generating GPU sitemaps...')
-    sitemapfiles['gpu'] = generate_sitemaps_for_category('gpu', transform_gpus, reference_gpus)
+def transform_gpus(gpus: List[Dict], reference_list: List[str]) -> List[str]:
+    """Transform and filter GPU data."""
+    matcher = ReferenceMatcher(reference_list, 0.65)
+
+    def process_gpu(gpu):
+        gpu_name = gpu.get('attributes', {}).get('GPU', {}).get('videocard_name')
+        if not gpu_name:
+            print(f"Warning: Missing videocard_name for gpu: {gpu}")
+            return None
+        
+        formatted_name = re.sub(r'\s+', '-', gpu_name.strip())
+        return formatted_name if matcher.matches(formatted_name) else None
+    
+    processed_gpus = list(set(filter(None, map(process_gpu, gpus))))
+    return processed_gpus
+
+def category_items(
+    category: str,
+    transform_func: Callable[[List[Dict], List[str]], List[str]],
+    reference_list: List[str] = None
+) -> List[str]:
+    """Fetch a category and return the names that get comparison pages."""
+    print(f"Fetching {category} data from API...")
+    entries = cached_collection(API_BASE_URL, COLLECTIONS[category])
+    if reference_list:
+        items = transform_func(entries, reference_list)
+    else:
+        items = transform_func(entries)
+    print(f"Found {len(items)} {category} items")
+    return items
+
+def category_shard_jobs(category: str, items: List[str]) -> List[PairShardJob]:
+    """One job per language and range of MAX_URLS_PER_FILE comparisons of the category."""
+    jobs = []
+    for lang in LANGUAGES:
+        jobs += pair_shard_jobs(category, items, f"{BASE_URL}/{lang}/{category}/compare/",
+                                f"{category}-sitemap-{lang}", MAX_URLS_PER_FILE)
+    return jobs
+
+def write_comparison_sitemaps(
+    items_by_category: Dict[str, List[str]],
+    lastmod: str,
+    workers: int = WORKERS,
+    compresslevel: int = GZIP_LEVEL
+) -> Dict[str, List[str]]:
+    """
+    Write the comparison sitemaps of every category and language, the shards
+    being written side by side by a pool of processes. Returns the files by category.
+    """
+    jobs = []
+    for category, items in items_by_category.items():
+        print(f"{len(PairSpace(items))} {category} combinations per language")
+        jobs += category_shard_jobs(category, items)
+
+    print(f"Writing {len(jobs)} sitemap shards on {workers or os.cpu_count()} processes...")
+    results = run_pair_shard_jobs(jobs, items_by_category, OUTPUT_DIR, lastmod, workers, MAX_URLS_PER_FILE,
+                                  compresslevel)
+
+    sitemapfiles = {category: [] for category in items_by_category}
+    for job, files in zip(jobs, results):
+        sitemapfiles[job.group] += files
+    for category, files in sitemapfiles.items():
+        print(f"Generated {len(files)} sitemap files for {category}")
+    return sitemapfiles
+
+def generate_sitemaps_for_category(
+    category: str, 
+    transform_func: Callable[[List[Dict], List[str]], List[str]],
+    reference_list: List[str] = None,
+    lastmod: str = None,
+    workers: int = WORKERS,
+    compresslevel: int = GZIP_LEVEL
+) -> List[str]:
+    """Generate sitemaps for a specific category."""
+    items = category_items(category, transform_func, reference_list)
+    return write_comparison_sitemaps({category: items}, lastmod or today(), workers, compresslevel)[category]
+
+def generate_sitemap_index(sitemap_files: Dict[str, List[str]], lastmod: str = None) -> None:
+    """Generate the sitemap index file, listing the files as written (.xml or .xml.gz)."""
+    print("Generating sitemap index...")
+    lastmod = lastmod or today()
+    sitemapindex = ET.Element('sitemapindex', xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+    
+    for category_files in sitemap_files.values():
+        for file in category_files:
+            sitemap_elem = ET.SubElement(sitemapindex, 'sitemap')
+            loc_elem = ET.SubElement(sitemap_elem, 'loc')
+            loc_elem.text = f"{BASE_URL}/sitemaps/{file}"
+            
+            lastmod_elem = ET.SubElement(sitemap_elem, 'lastmod')
+            lastmod_elem.text = lastmod
+    
+    tree = ET.ElementTree(sitemapindex)
+    with open('../frontend/public/sitemap-index.xml', 'wb') as f:
+        tree.write(f, encoding='utf-8', xml_declaration=True)
+    print("Sitemap index written successfully")
+
+def generate_all_sitemaps(workers: int = WORKERS, compresslevel: int = GZIP_LEVEL):
+    """Main function to generate all sitemaps."""
+    sitemapfiles = {}
+    lastmod = today()
+
+    items_by_category = {
+        'phone': category_items('phone', transform_phones),
+        'cpu': category_items('cpu', transform_cpus, REFERENCE_CPUS),
+        'gpu': category_items('gpu', transform_gpus, REFERENCE_GPUS),
+    }
+
+    # Every category and language at once, so the pool stays busy until the last shard
+    print('Generating comparison sitemaps...')
+    sitemapfiles.update(write_comparison_sitemaps(items_by_category, lastmod, workers, compresslevel))
 
     print('Generating general sitemaps...')
-    general_sitemaps = generate_general_sitemaps()
+    general_sitemaps = generate_general_sitemaps(lastmod, compresslevel)
     sitemapfiles.update(general_sitemaps)
 
     print('Generating sitemap index...')
-    generate_sitemap_index(sitemapfiles)
+    generate_sitemap_index(sitemapfiles, lastmod)
 
     print('Sitemap generation complete!')
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate the sitemaps and the sitemap index of the frontend")
+    parser.add_argument('--workers', type=int, default=WORKERS, help='processes writing the comparison sitemaps')
+    parser.add_argument('--gzip', type=int, nargs='?', const=6, default=GZIP_LEVEL, metavar='LEVEL',
+                        choices=range(1, 10), help='write gzipped .xml.gz sitemaps, compression level 1-9 (default 6)')
+    args = parser.parse_args()
+
     try:
-        generate_all_sitemaps()
+        generate_all_sitemaps(args.workers, args.gzip)
     except Exception as error:
         print(f"Error generating sitemaps: {error}")
 